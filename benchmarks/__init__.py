@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Conferências e medições de desempenho do motor (python -m benchmarks.<módulo>)."""
@@ -0,0 +1,130 @@
+"""
+Cópia congelada da pontuação do avaliador AMP original.
+
+AMPEvaluator passou a somar os termos por peça de forma incremental, em
+outra ordem; esta cópia guarda a soma peça a peça da versão original para
+que benchmarks.amp_parity meça a diferença contra ela. Não deve ser
+alterada.
+"""
+
+from core.position import Position
+from core.board_state import BoardState
+from core.enums import PlayerColor
+
+
+# Pesos do avaliador original
+NORMAL_PIECE_VALUE = 2.3
+KING_PIECE_VALUE = 3.8
+
+
+def baseline_amp_score(board: BoardState, color: PlayerColor) -> float:
+    """
+    Pontuação do avaliador AMP original.
+
+    Args:
+        board: Estado do tabuleiro
+        color: Cor do jogador a avaliar
+
+    Returns:
+        Pontuação da posição, somada na ordem original
+    """
+    opponent_color = color.opposite()
+
+    # Contar peças do jogador
+    player_pieces = board.get_pieces_by_color(color)
+    player_score = sum(
+        KING_PIECE_VALUE if piece.is_king() else NORMAL_PIECE_VALUE
+        for piece in player_pieces
+    )
+
+    # Contar peças do adversário
+    opponent_pieces = board.get_pieces_by_color(opponent_color)
+    opponent_score = sum(
+        KING_PIECE_VALUE if piece.is_king() else NORMAL_PIECE_VALUE
+        for piece in opponent_pieces
+    )
+
+    boardStateValue = player_score - opponent_score
+
+    allpieces = board.get_all_pieces()
+
+    #Verificando se podem capturar
+    for piece in allpieces:
+        if piece.position.row+2<=7 and piece.position.col+2<=7:
+            if piece.color == color and board.get_piece(Position(piece.position.row+1, piece.position.col+1)) != None and piece.position.row+2<=7 and piece.position.col+2<=7:
+                if board.get_piece(Position(piece.position.row+1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position(piece.position.row+2, piece.position.col+2)) == None):
+                    boardStateValue += 1
+        if piece.position.row+2<=7 and piece.position.col-2>=0:
+            if piece.color == color and board.get_piece(Position(piece.position.row+1, piece.position.col-1)) != None:
+                if board.get_piece(Position(piece.position.row+1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position(piece.position.row+2, piece.position.col-2)) == None):
+                    boardStateValue += 1
+        if piece.position.row-2>=0 and piece.position.col+2<=7:
+            if piece.color == color and board.get_piece(Position(piece.position.row-1, piece.position.col+1)) != None:
+                if board.get_piece(Position(piece.position.row-1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position(piece.position.row-2, piece.position.col+2)) == None):
+                    boardStateValue += 1
+        if piece.position.row-2>=0 and piece.position.col-2>=0:
+            if piece.color == color and board.get_piece(Position(piece.position.row-1, piece.position.col-1)) != None:
+                if board.get_piece(Position(piece.position.row-1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position(piece.position.row-2, piece.position.col-2)) == None):
+                    boardStateValue += 1
+
+        if piece.position.row+2<=7 and piece.position.col+2<=7:
+            if piece.color == color.opposite() and board.get_piece(Position(piece.position.row+1, piece.position.col+1)) != None:
+                if board.get_piece(Position(piece.position.row+1, piece.position.col+1)).color == color and (board.get_piece(Position(piece.position.row+2, piece.position.col+2)) == None):
+                    boardStateValue -= 2
+        if piece.position.row+2<=7 and piece.position.col-2>=0:
+            if piece.color == color.opposite() and board.get_piece(Position(piece.position.row+1, piece.position.col-1)) != None:
+                if board.get_piece(Position(piece.position.row+1, piece.position.col-1)).color == color and (board.get_piece(Position(piece.position.row+2, piece.position.col-2)) == None):
+                    boardStateValue -= 2
+        if piece.position.row-2>=0 and piece.position.col+2<=7:
+            if piece.color == color.opposite() and board.get_piece(Position(piece.position.row-1, piece.position.col+1)) != None:
+                if board.get_piece(Position(piece.position.row-1, piece.position.col+1)).color == color and (board.get_piece(Position(piece.position.row-2, piece.position.col+2)) == None):
+                    boardStateValue -= 2
+        if piece.position.row-2>=0 and piece.position.col-2>=0:
+            if piece.color == color.opposite() and board.get_piece(Position(piece.position.row-1, piece.position.col-1)) != None:
+                if board.get_piece(Position(piece.position.row-1, piece.position.col-1)).color == color and (board.get_piece(Position(piece.position.row-2, piece.position.col-2)) == None):
+                    boardStateValue -= 2
+
+
+    #Verificando se estão nas bordas
+    for piece in allpieces:
+        if piece.position.col == 0 or piece.position.col == 7:
+            if piece.color == color:
+                boardStateValue += 0.35
+            else:
+                boardStateValue -= 0.35
+
+    #Verificando estão prestes a serem promovidas
+    for piece in allpieces:
+        if color == PlayerColor.RED:
+            if piece.color == PlayerColor.RED and piece.position.row == 1 and piece.is_king() == False:
+                if piece.position.col-1 >= 0:
+                    if board.get_piece(Position(piece.position.row-1, piece.position.col-1)) == None:
+                        boardStateValue += 1.5
+                if piece.position.col+1 <= 7:
+                    if board.get_piece(Position(piece.position.row-1, piece.position.col+1)) == None:
+                        boardStateValue += 1.5
+            if piece.color == PlayerColor.BLACK and piece.position.row == 6 and piece.is_king() == False:
+                if piece.position.col-1 >= 0:
+                    if board.get_piece(Position(piece.position.row+1, piece.position.col-1)) == None:
+                        boardStateValue -= 1.5
+                if piece.position.col+1 <= 7:
+                    if board.get_piece(Position(piece.position.row+1, piece.position.col+1)) == None:
+                        boardStateValue -= 1.5
+        else:
+            if piece.color == PlayerColor.RED and piece.position.row == 1 and piece.is_king() == False:
+                if piece.position.col-1 >= 0:
+                    if board.get_piece(Position(piece.position.row-1, piece.position.col-1)) == None:
+                        boardStateValue -= 1.5
+                if piece.position.col+1 <= 7:
+                    if board.get_piece(Position(piece.position.row-1, piece.position.col+1)) == None:
+                        boardStateValue -= 1.5
+            if piece.color == PlayerColor.BLACK and piece.position.row == 6 and piece.is_king() == False:
+                if piece.position.col-1 >= 0:
+                    if board.get_piece(Position(piece.position.row+1, piece.position.col-1)) == None:
+                        boardStateValue += 1.5
+                if piece.position.col+1 <= 7:
+                    if board.get_piece(Position(piece.position.row+1, piece.position.col+1)) == None:
+                        boardStateValue += 1.5
+
+    # Retornar resultado
+    return boardStateValue
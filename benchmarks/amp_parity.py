@@ -0,0 +1,210 @@
+"""
+Confere FastAMPEvaluator contra AMPEvaluator e contra o AMP original, e mede o ganho.
+
+FastAMPEvaluator deve dar exatamente as pontuações de AMPEvaluator. Os dois
+somam os termos em outra ordem que o avaliador original (copiado em
+benchmarks.amp_baseline), e a pontuação pode diferir dela nos últimos bits:
+a conferência contra o original aceita diferenças de até
+BASELINE_TOLERANCE e mostra a maior encontrada.
+
+Uso:
+    python -m benchmarks.amp_parity [--positions N] [--seed S]
+
+Sai com código 1 se alguma pontuação divergir.
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import Callable, List, Optional, Sequence, Tuple
+from core.board_state import BoardState
+from core.bitboard_state import BitboardState, SQUARE_POSITIONS
+from core.piece import Piece
+from core.enums import PlayerColor, PieceType
+from core.move_generator import MoveGenerator
+from core.evaluation.amp_evaluator import AMPEvaluator
+from core.evaluation.fast_amp_evaluator import FastAMPEvaluator
+from .amp_baseline import baseline_amp_score
+
+
+# Maior diferença aceita em relação ao avaliador original (as observadas
+# ficam abaixo de 3e-14)
+BASELINE_TOLERANCE = 1e-12
+
+
+def random_game_positions(count: int, rng: random.Random) -> List[BoardState]:
+    """
+    Posições de partidas com movimentos aleatórios a partir da inicial.
+
+    Args:
+        count: Número de posições
+        rng: Gerador de números aleatórios
+
+    Returns:
+        Lista de tabuleiros
+    """
+    positions: List[BoardState] = []
+    while len(positions) < count:
+        board = BoardState.create_initial_state()
+        color = PlayerColor.RED
+        for _ in range(rng.randrange(1, 120)):
+            moves = MoveGenerator.get_all_valid_moves(color, board)
+            if not moves:
+                break
+            board.make_move(rng.choice(moves))
+            color = color.opposite()
+            if rng.random() < 0.1:
+                positions.append(board.clone())
+    return positions[:count]
+
+
+def random_placements(count: int, rng: random.Random) -> List[BoardState]:
+    """
+    Posições com peças espalhadas ao acaso (inclusive em linhas de promoção).
+
+    Args:
+        count: Número de posições
+        rng: Gerador de números aleatórios
+
+    Returns:
+        Lista de tabuleiros
+    """
+    positions: List[BoardState] = []
+    for _ in range(count):
+        board = BoardState()
+        for square in rng.sample(range(len(SQUARE_POSITIONS)), rng.randint(1, 24)):
+            board.set_piece(Piece(rng.choice(list(PlayerColor)), rng.choice(list(PieceType)), SQUARE_POSITIONS[square]))
+        positions.append(board)
+    return positions
+
+
+def check_parity(
+    reference: AMPEvaluator,
+    fast: FastAMPEvaluator,
+    positions: Sequence[BoardState]
+) -> List[Tuple[BoardState, PlayerColor, float, float]]:
+    """
+    Compara as pontuações dos dois avaliadores.
+
+    Args:
+        reference: Avaliador de referência
+        fast: Avaliador a conferir
+        positions: Tabuleiros a avaliar
+
+    Returns:
+        Divergências (tabuleiro, cor, pontuação de referência, pontuação rápida)
+    """
+    mismatches = []
+    for board in positions:
+        for color in PlayerColor:
+            expected = reference.evaluate(board, color)
+            actual = fast.evaluate(board, color)
+            if actual != expected:
+                mismatches.append((board, color, expected, actual))
+    return mismatches
+
+
+def check_baseline(
+    evaluator: AMPEvaluator,
+    positions: Sequence[BoardState],
+    originals: Sequence[BoardState]
+) -> Tuple[float, List[Tuple[BoardState, PlayerColor, float, float]]]:
+    """
+    Compara as pontuações de um avaliador com as do avaliador original.
+
+    O original soma as peças na ordem em que o BoardState as guarda, então
+    é sempre aplicado ao BoardState de origem de cada posição.
+
+    Args:
+        evaluator: Avaliador a conferir
+        positions: Tabuleiros avaliados por evaluator
+        originals: BoardState correspondente a cada tabuleiro
+
+    Returns:
+        Tupla (maior diferença absoluta, divergências acima de
+        BASELINE_TOLERANCE como (tabuleiro, cor, original, pontuação))
+    """
+    largest = 0.0
+    mismatches = []
+    for board, original in zip(positions, originals):
+        for color in PlayerColor:
+            expected = baseline_amp_score(original, color)
+            actual = evaluator.evaluate(board, color)
+            difference = abs(actual - expected)
+            largest = max(largest, difference)
+            if difference > BASELINE_TOLERANCE:
+                mismatches.append((board, color, expected, actual))
+    return largest, mismatches
+
+
+def time_evaluations(evaluate: Callable[[BoardState, PlayerColor], float], positions: Sequence[BoardState]) -> float:
+    """
+    Mede o tempo de avaliar todas as posições pelas duas cores.
+
+    Args:
+        evaluate: Função de avaliação
+        positions: Tabuleiros a avaliar
+
+    Returns:
+        Microssegundos por avaliação (melhor de 3 rodadas)
+    """
+    best = float('inf')
+    for _ in range(3):
+        start = time.perf_counter()
+        for board in positions:
+            evaluate(board, PlayerColor.RED)
+            evaluate(board, PlayerColor.BLACK)
+        best = min(best, time.perf_counter() - start)
+    return best / (2 * len(positions)) * 1e6
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--positions', type=int, default=20000, help='posições de cada tipo (padrão: 20000)')
+    parser.add_argument('--seed', type=int, default=2024)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    games = random_game_positions(args.positions, rng)
+    placements = random_placements(args.positions, rng)
+    bitboards = [BitboardState.from_board_state(board) for board in games]
+
+    reference = AMPEvaluator()
+    fast = FastAMPEvaluator()
+
+    failed = False
+    suites = (('partidas', games, games), ('aleatórias', placements, placements), ('bitboards', bitboards, games))
+    for label, positions, originals in suites:
+        mismatches = check_parity(reference, fast, positions)
+        print(f"{label}: {2 * len(positions)} avaliações, {len(mismatches)} divergências")
+        for board, color, expected, actual in mismatches[:3]:
+            print(f"{board}\n{color.value}: AMPEvaluator={expected} FastAMPEvaluator={actual}\n")
+        failed = failed or bool(mismatches)
+
+        for evaluator in (reference, fast):
+            largest, mismatches = check_baseline(evaluator, positions, originals)
+            print(
+                f"{label}: {evaluator} contra o original: maior diferença {largest:.1e}, "
+                f"{len(mismatches)} acima de {BASELINE_TOLERANCE:.0e}"
+            )
+            for board, color, expected, actual in mismatches[:3]:
+                print(f"{board}\n{color.value}: original={expected} {evaluator}={actual}\n")
+            failed = failed or bool(mismatches)
+
+    print()
+    for label, positions in (('BoardState', games), ('BitboardState', bitboards)):
+        for name in ('evaluate', 'positional_score'):
+            reference_us = time_evaluations(getattr(reference, name), positions)
+            fast_us = time_evaluations(getattr(fast, name), positions)
+            print(
+                f"{label:<14} {name:<17} AMPEvaluator {reference_us:7.1f} µs  "
+                f"FastAMPEvaluator {fast_us:6.1f} µs  ({reference_us / fast_us:.1f}x)"
+            )
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
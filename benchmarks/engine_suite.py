@@ -0,0 +1,419 @@
+"""
+Mede a busca (MinimaxAlphaBeta) num conjunto fixo de posições.
+
+Cada posição é buscada com cada avaliador em profundidade fixa, de 1 até a
+profundidade da posição (cada profundidade com um motor novo, para que o
+tempo até ela não dependa da anterior; cada busca é repetida e vale o
+menor tempo). O relatório JSON guarda nós, nós por segundo, tempo até cada
+profundidade, melhor movimento e pontuação, e pode ser comparado com um
+relatório anterior.
+
+Uso:
+    python -m benchmarks.engine_suite [--evaluator NOME ...] [--category CAT ...]
+        [--depth D] [--repeat N] [--output ARQUIVO] [--baseline ARQUIVO]
+        [--max-slowdown PCT]
+
+Com --baseline e --max-slowdown, sai com código 1 se o tempo total ficar
+mais de PCT% acima do da base.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from core.board_state import BoardState
+from core.piece import Piece
+from core.position import Position
+from core.enums import PlayerColor, PieceType
+from core.ai.minimax import MinimaxAlphaBeta
+from core.evaluation.base_evaluator import BaseEvaluator
+from core.evaluation.amp_evaluator import AMPEvaluator
+from core.evaluation.fast_amp_evaluator import FastAMPEvaluator
+from core.evaluation.piece_count_evaluator import PieceCountEvaluator
+from core.evaluation.piece_on_sides_count_evaluator import PieceOnSidesEvaluator
+from core.evaluation.pieces_about_to_promote_evaluator import PieceAboutToPromoteEvaluator
+from core.evaluation.pieces_threatened_evaluator import PiecesThreatenedEvaluator
+
+
+# Versão do formato do relatório
+REPORT_FORMAT = 1
+
+# Repetições padrão de cada busca
+DEFAULT_REPEAT = 3
+
+# Caracteres dos diagramas (casas escuras); qualquer outro caractere marca uma casa clara
+_DIAGRAM_PIECES = {
+    'r': (PlayerColor.RED, PieceType.NORMAL),
+    'R': (PlayerColor.RED, PieceType.KING),
+    'b': (PlayerColor.BLACK, PieceType.NORMAL),
+    'B': (PlayerColor.BLACK, PieceType.KING),
+}
+
+
+def parse_diagram(rows: Sequence[str]) -> BoardState:
+    """
+    Monta um tabuleiro a partir de um diagrama.
+
+    O diagrama tem 8 linhas de 8 caracteres, da linha 0 (promoção das
+    vermelhas) à 7. Nas casas escuras, 'r'/'b' são peças, 'R'/'B' damas e
+    '.' casa vazia; os caracteres das casas claras são ignorados.
+
+    Args:
+        rows: Linhas do diagrama
+
+    Returns:
+        Tabuleiro
+
+    Raises:
+        ValueError: Se o diagrama não tem 8x8 casas ou tem um caractere
+            desconhecido numa casa escura
+    """
+    if len(rows) != 8 or any(len(row) != 8 for row in rows):
+        raise ValueError(f"Diagrama deve ter 8 linhas de 8 casas: {rows}")
+
+    board = BoardState()
+    for row, line in enumerate(rows):
+        for col, char in enumerate(line):
+            position = Position.at(row, col)
+            if not position.is_dark_square():
+                continue
+            if char in _DIAGRAM_PIECES:
+                color, piece_type = _DIAGRAM_PIECES[char]
+                board.set_piece(Piece(color, piece_type, position))
+            elif char != '.':
+                raise ValueError(f"Caractere desconhecido {char!r} na casa {position}")
+    return board
+
+
+@dataclass(frozen=True)
+class BenchmarkPosition:
+    """
+    Posição do conjunto de benchmark.
+
+    Attributes:
+        name: Identificador da posição nos relatórios
+        category: Categoria (opening, middlegame, captures, endgame)
+        rows: Diagrama (ver parse_diagram)
+        color: Jogador da vez
+        depth: Profundidade padrão da busca
+    """
+    name: str
+    category: str
+    rows: Tuple[str, ...]
+    color: PlayerColor
+    depth: int
+
+    def board(self) -> BoardState:
+        """Tabuleiro da posição."""
+        return parse_diagram(self.rows)
+
+
+# Posições tiradas de partidas com movimentos aleatórios. As de capturas têm
+# capturas múltiplas pendentes; os finais têm damas.
+POSITIONS: Tuple[BenchmarkPosition, ...] = (
+    BenchmarkPosition('initial', 'opening', (
+        '-b-b-b-b', 'b-b-b-b-', '-b-b-b-b', '.-.-.-.-',
+        '-.-.-.-.', 'r-r-r-r-', '-r-r-r-r', 'r-r-r-r-',
+    ), PlayerColor.RED, 9),
+    BenchmarkPosition('opening-4', 'opening', (
+        '-b-b-b-b', 'b-b-b-b-', '-b-.-.-b', '.-b-.-b-',
+        '-.-r-r-.', 'r-.-r-.-', '-r-r-r-r', 'r-r-r-r-',
+    ), PlayerColor.RED, 9),
+    BenchmarkPosition('opening-7', 'opening', (
+        '-b-b-b-b', 'b-b-.-b-', '-b-.-.-b', '.-b-.-b-',
+        '-.-r-.-.', 'r-r-r-.-', '-r-r-.-r', 'r-r-r-r-',
+    ), PlayerColor.BLACK, 9),
+    BenchmarkPosition('middlegame-16', 'middlegame', (
+        '-b-b-b-b', 'b-.-b-b-', '-b-.-.-.', '.-b-.-.-',
+        '-.-b-.-.', 'r-.-.-.-', '-r-.-r-b', 'r-r-.-.-',
+    ), PlayerColor.BLACK, 9),
+    BenchmarkPosition('middlegame-18', 'middlegame', (
+        '-.-b-b-b', 'b-b-b-b-', '-b-.-.-r', '.-.-b-.-',
+        '-.-b-.-.', '.-.-.-r-', '-r-r-.-r', 'r-.-r-r-',
+    ), PlayerColor.RED, 9),
+    BenchmarkPosition('middlegame-king', 'middlegame', (
+        '-b-.-b-b', 'b-.-.-b-', '-.-.-b-.', '.-b-.-.-',
+        '-.-.-.-.', 'r-.-.-r-', '-r-.-r-r', 'r-B-.-.-',
+    ), PlayerColor.BLACK, 9),
+    BenchmarkPosition('captures-13', 'captures', (
+        '-b-.-b-b', 'b-.-.-.-', '-.-.-.-b', '.-.-b-.-',
+        '-r-r-b-.', 'r-.-.-.-', '-r-r-.-.', 'r-.-.-.-',
+    ), PlayerColor.BLACK, 9),
+    BenchmarkPosition('captures-17', 'captures', (
+        '-.-b-.-b', 'b-.-b-b-', '-b-.-r-b', 'b-.-b-.-',
+        '-r-r-.-.', 'b-.-.-.-', '-r-r-.-.', '.-r-r-.-',
+    ), PlayerColor.BLACK, 9),
+    BenchmarkPosition('captures-21', 'captures', (
+        '-b-b-b-b', 'b-b-b-b-', '-.-.-.-.', '.-b-.-.-',
+        '-r-b-b-.', 'r-.-.-r-', '-r-r-.-r', 'r-r-r-r-',
+    ), PlayerColor.RED, 9),
+    BenchmarkPosition('endgame-4', 'endgame', (
+        '-.-.-.-.', 'R-.-r-.-', '-.-.-.-.', 'r-.-.-.-',
+        '-.-.-.-.', '.-.-.-.-', '-.-.-.-.', '.-.-.-B-',
+    ), PlayerColor.RED, 11),
+    BenchmarkPosition('endgame-6', 'endgame', (
+        '-.-.-.-.', '.-.-.-.-', '-.-R-.-.', '.-.-.-.-',
+        '-.-.-.-b', 'r-.-.-b-', '-.-.-.-.', '.-.-B-B-',
+    ), PlayerColor.RED, 11),
+    BenchmarkPosition('endgame-7', 'endgame', (
+        '-.-.-.-.', '.-.-b-b-', '-.-.-.-b', '.-R-b-.-',
+        '-r-.-.-.', '.-.-.-.-', '-.-.-.-.', '.-.-.-B-',
+    ), PlayerColor.BLACK, 11),
+)
+
+EVALUATORS: Dict[str, Callable[[], BaseEvaluator]] = {
+    'piece_count': PieceCountEvaluator,
+    'piece_on_sides': PieceOnSidesEvaluator,
+    'about_to_promote': PieceAboutToPromoteEvaluator,
+    'threatened': PiecesThreatenedEvaluator,
+    'amp': AMPEvaluator,
+    'fast_amp': FastAMPEvaluator,
+}
+
+
+def run_position(
+    position: BenchmarkPosition,
+    evaluator_name: str,
+    depth: Optional[int] = None,
+    repeat: int = DEFAULT_REPEAT
+) -> dict:
+    """
+    Busca uma posição com um avaliador, de 1 até a profundidade pedida.
+
+    Args:
+        position: Posição do conjunto
+        evaluator_name: Chave de EVALUATORS
+        depth: Profundidade (padrão: a da posição)
+        repeat: Repetições de cada busca (vale o menor tempo)
+
+    Returns:
+        Resultado da posição (ver run_suite)
+    """
+    depth = depth or position.depth
+    board = position.board()
+    time_to_depth_ms: List[float] = []
+
+    for search_depth in range(1, depth + 1):
+        best_ms = float('inf')
+        for _ in range(repeat):
+            engine = MinimaxAlphaBeta(EVALUATORS[evaluator_name](), max_depth=search_depth)
+            start = time.perf_counter()
+            move = engine.find_best_move(board, position.color)
+            best_ms = min(best_ms, (time.perf_counter() - start) * 1000)
+        time_to_depth_ms.append(best_ms)
+
+    statistics = engine.get_statistics()
+    nodes = statistics['nodes_evaluated'] + statistics['quiescence_nodes']
+    time_ms = time_to_depth_ms[-1]
+    return {
+        'position': position.name,
+        'category': position.category,
+        'evaluator': evaluator_name,
+        'depth': depth,
+        'nodes': nodes,
+        'nodes_per_second': nodes / time_ms * 1000 if time_ms > 0 else 0.0,
+        'time_ms': time_ms,
+        'time_to_depth_ms': time_to_depth_ms,
+        'best_move': str(move) if move is not None else None,
+        'score': engine.best_score,
+        'statistics': statistics,
+    }
+
+
+def run_suite(
+    positions: Sequence[BenchmarkPosition] = POSITIONS,
+    evaluators: Sequence[str] = tuple(EVALUATORS),
+    depth: Optional[int] = None,
+    repeat: int = DEFAULT_REPEAT,
+    progress: Optional[Callable[[dict], None]] = None
+) -> dict:
+    """
+    Busca todas as posições com todos os avaliadores.
+
+    Cada resultado tem position, category, evaluator, depth, nodes (nós de
+    negamax mais de quiescência), nodes_per_second, time_ms (da busca na
+    profundidade final), time_to_depth_ms (um tempo por profundidade, a
+    partir de 1), best_move, score e as estatísticas completas do motor.
+
+    Args:
+        positions: Posições a buscar
+        evaluators: Chaves de EVALUATORS
+        depth: Profundidade para todas as posições (padrão: a de cada uma)
+        repeat: Repetições de cada busca (vale o menor tempo)
+        progress: Chamada com cada resultado assim que fica pronto
+
+    Returns:
+        Relatório com informações da máquina, resultados e totais por avaliador
+    """
+    results = []
+    for evaluator_name in evaluators:
+        for position in positions:
+            result = run_position(position, evaluator_name, depth, repeat)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+
+    totals = {}
+    for evaluator_name in evaluators:
+        nodes = sum(result['nodes'] for result in results if result['evaluator'] == evaluator_name)
+        time_ms = sum(result['time_ms'] for result in results if result['evaluator'] == evaluator_name)
+        totals[evaluator_name] = {
+            'nodes': nodes,
+            'time_ms': time_ms,
+            'nodes_per_second': nodes / time_ms * 1000 if time_ms > 0 else 0.0,
+        }
+
+    return {
+        'format': REPORT_FORMAT,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'results': results,
+        'totals': totals,
+    }
+
+
+def compare_reports(report: dict, baseline: dict) -> List[dict]:
+    """
+    Compara os resultados de um relatório com os de uma base.
+
+    Resultados são pareados por (posição, avaliador, profundidade); os que
+    só existem num dos relatórios são ignorados.
+
+    Args:
+        report: Relatório atual
+        baseline: Relatório de base
+
+    Returns:
+        Uma diferença por resultado pareado, com nós, tempos e variação
+        percentual do tempo, e se o melhor movimento ou a pontuação mudaram
+
+    Raises:
+        ValueError: Se a base tem outro formato de relatório
+    """
+    if baseline.get('format') != REPORT_FORMAT:
+        raise ValueError(f"Formato de relatório incompatível: {baseline.get('format')} (esperado {REPORT_FORMAT})")
+
+    def key(result: dict) -> Tuple[str, str, int]:
+        return result['position'], result['evaluator'], result['depth']
+
+    base_results = {key(result): result for result in baseline['results']}
+    deltas = []
+    for result in report['results']:
+        base = base_results.get(key(result))
+        if base is None:
+            continue
+        deltas.append({
+            'position': result['position'],
+            'evaluator': result['evaluator'],
+            'depth': result['depth'],
+            'nodes': result['nodes'],
+            'base_nodes': base['nodes'],
+            'time_ms': result['time_ms'],
+            'base_time_ms': base['time_ms'],
+            'time_change_pct': _change_pct(result['time_ms'], base['time_ms']),
+            'best_move_changed': result['best_move'] != base['best_move'],
+            'score_changed': result['score'] != base['score'],
+        })
+    return deltas
+
+
+def _change_pct(value: float, base: float) -> float:
+    """Variação percentual de value em relação a base."""
+    return (value / base - 1) * 100 if base > 0 else 0.0
+
+
+def _print_result(result: dict) -> None:
+    """Mostra uma linha de resultado."""
+    print(
+        f"{result['evaluator']:<17} {result['position']:<16} d{result['depth']:<2} "
+        f"{result['nodes']:>9} nós {result['time_ms']:>9.1f} ms {result['nodes_per_second']:>9,.0f} nós/s  "
+        f"{result['best_move']} ({result['score']:+.2f})"
+    )
+
+
+def _print_comparison(deltas: List[dict]) -> None:
+    """Mostra as diferenças para a base e o total."""
+    print()
+    for delta in deltas:
+        notes = []
+        if delta['nodes'] != delta['base_nodes']:
+            notes.append(f"nós {delta['base_nodes']} -> {delta['nodes']}")
+        if delta['best_move_changed']:
+            notes.append("melhor movimento mudou")
+        elif delta['score_changed']:
+            notes.append("pontuação mudou")
+        print(
+            f"{delta['evaluator']:<17} {delta['position']:<16} d{delta['depth']:<2} "
+            f"{delta['base_time_ms']:>9.1f} -> {delta['time_ms']:>9.1f} ms "
+            f"({delta['time_change_pct']:+6.1f}%)  {', '.join(notes)}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    categories = sorted({position.category for position in POSITIONS})
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--evaluator', action='append', choices=sorted(EVALUATORS),
+                        help='avaliador a usar (repetível; padrão: todos)')
+    parser.add_argument('--category', action='append', choices=categories,
+                        help='categoria de posições (repetível; padrão: todas)')
+    parser.add_argument('--depth', type=int, help='profundidade para todas as posições')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'repetições de cada busca (padrão: {DEFAULT_REPEAT})')
+    parser.add_argument('--output', help='arquivo JSON do relatório')
+    parser.add_argument('--baseline', help='relatório anterior para comparar')
+    parser.add_argument('--max-slowdown', type=float,
+                        help='piora máxima do tempo total, em %%, em relação à base')
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error(f"número de repetições inválido: {args.repeat}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    positions = [position for position in POSITIONS if not args.category or position.category in args.category]
+    report = run_suite(positions, args.evaluator or tuple(EVALUATORS), args.depth, args.repeat, _print_result)
+
+    print()
+    for evaluator_name, total in report['totals'].items():
+        print(f"{evaluator_name:<17} total {total['nodes']:>10} nós {total['time_ms']:>10.1f} ms "
+              f"{total['nodes_per_second']:>9,.0f} nós/s")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nRelatório gravado em {args.output}")
+
+    if baseline is None:
+        return 0
+
+    deltas = compare_reports(report, baseline)
+    _print_comparison(deltas)
+    if not deltas:
+        print("Nenhum resultado em comum com a base")
+        return 0
+
+    time_ms = sum(delta['time_ms'] for delta in deltas)
+    base_time_ms = sum(delta['base_time_ms'] for delta in deltas)
+    change = _change_pct(time_ms, base_time_ms)
+    print(f"\nTotal: {base_time_ms:.1f} -> {time_ms:.1f} ms ({change:+.1f}%) em {len(deltas)} resultados")
+
+    if args.max_slowdown is not None and change > args.max_slowdown:
+        print(f"Mais lento que a base além de {args.max_slowdown}%")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
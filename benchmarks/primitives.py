@@ -0,0 +1,405 @@
+"""
+Mede o tempo e as alocações das funções mais chamadas pela busca.
+
+Cada medição chama uma função sobre uma lista fixa de argumentos (tirados
+das posições de benchmarks.engine_suite). Depois de algumas rodadas de
+aquecimento, o número de passadas por amostra é aumentado até a amostra
+durar pelo menos --min-time; o resultado é a mediana e o intervalo
+interquartil (IQR) dos tempos por chamada. As alocações são contadas com
+tracemalloc numa passada à parte.
+
+A medição "overhead" chama uma função vazia com os mesmos argumentos das
+demais e mostra o custo do próprio laço de medição.
+
+Uso:
+    python -m benchmarks.primitives [--filter TEXTO] [--repeat N] [--warmup N]
+        [--min-time S] [--output ARQUIVO] [--baseline ARQUIVO]
+
+Com --baseline, marca as funções cuja mediana saiu do intervalo
+interquartil da base (e vice-versa).
+"""
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+from core.board_state import BoardState
+from core.position import Position
+from core.enums import PlayerColor
+from core.game_rules import GameRules
+from core.move_generator import MoveGenerator
+from benchmarks.engine_suite import EVALUATORS, POSITIONS
+
+
+# Versão do formato do relatório
+REPORT_FORMAT = 1
+
+DEFAULT_REPEAT = 15
+DEFAULT_WARMUP = 3
+DEFAULT_MIN_TIME = 0.02
+
+_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+@dataclass
+class MicroBenchmark:
+    """
+    Função a medir e os argumentos de cada chamada.
+
+    Attributes:
+        name: Identificador nos relatórios
+        function: Função medida, chamada como function(*args)
+        calls: Argumentos de cada chamada de uma passada
+    """
+    name: str
+    function: Callable[..., Any]
+    calls: List[Tuple]
+
+
+@dataclass
+class MicroResult:
+    """
+    Resultado de uma medição. Tempos em nanossegundos por chamada,
+    alocações por chamada.
+
+    Attributes:
+        name: Identificador da medição
+        calls: Chamadas por passada
+        passes: Passadas por amostra
+        samples_ns: Tempo por chamada de cada amostra
+        median_ns: Mediana das amostras
+        q1_ns: Primeiro quartil
+        q3_ns: Terceiro quartil
+        iqr_ns: Intervalo interquartil (q3 - q1)
+        allocated_blocks: Blocos alocados que continuam vivos após a
+            chamada (inclui o valor retornado)
+        allocated_bytes: Bytes desses blocos
+        peak_bytes: Maior pico de memória durante uma chamada
+    """
+    name: str
+    calls: int
+    passes: int
+    samples_ns: List[float]
+    median_ns: float
+    q1_ns: float
+    q3_ns: float
+    iqr_ns: float
+    allocated_blocks: float
+    allocated_bytes: float
+    peak_bytes: int
+
+
+def _noop(*args: Any) -> None:
+    """Função vazia da medição de overhead."""
+
+
+def default_benchmarks() -> List[MicroBenchmark]:
+    """
+    Monta as medições padrão sobre as posições de benchmarks.engine_suite.
+
+    Returns:
+        Lista de medições
+    """
+    boards = [position.board() for position in POSITIONS]
+    board_colors = [(board, color) for board in boards for color in PlayerColor]
+    pieces = [(piece, board) for board in boards for piece in board.get_all_pieces()]
+    moves = [
+        (board, move)
+        for position, board in zip(POSITIONS, boards)
+        for move in MoveGenerator.get_all_valid_moves(position.color, board)
+    ]
+    steps = [
+        (Position.at(row, col), row_delta * distance, col_delta * distance)
+        for row in range(8)
+        for col in range(8)
+        if Position.at(row, col).is_dark_square()
+        for row_delta, col_delta in _DIRECTIONS
+        for distance in (1, 2)
+    ]
+
+    benchmarks = [
+        MicroBenchmark('overhead', _noop, board_colors),
+        MicroBenchmark('Position.move', Position.move, steps),
+        MicroBenchmark('BoardState.clone', BoardState.clone, [(board,) for board in boards]),
+        MicroBenchmark('BoardState.get_pieces_by_color', BoardState.get_pieces_by_color, board_colors),
+        MicroBenchmark('MoveGenerator.generate_capture_moves', MoveGenerator.generate_capture_moves, pieces),
+        MicroBenchmark('GameRules.apply_move', GameRules.apply_move, moves),
+    ]
+    for factory in EVALUATORS.values():
+        evaluator = factory()
+        benchmarks.append(MicroBenchmark(f"{evaluator.__class__.__name__}.evaluate", evaluator.evaluate, board_colors))
+    return benchmarks
+
+
+def _run_pass(function: Callable[..., Any], calls: List[Tuple]) -> None:
+    """Chama a função uma vez com cada conjunto de argumentos."""
+    for args in calls:
+        function(*args)
+
+
+def _time_passes(benchmark: MicroBenchmark, passes: int) -> float:
+    """Tempo, em segundos, de passes passadas seguidas."""
+    function = benchmark.function
+    calls = benchmark.calls
+    start = time.perf_counter()
+    for _ in range(passes):
+        _run_pass(function, calls)
+    return time.perf_counter() - start
+
+
+def _count_allocations(benchmark: MicroBenchmark) -> Tuple[float, float, int]:
+    """
+    Conta as alocações de uma passada com tracemalloc.
+
+    Os valores retornados são guardados até o fim da passada, para que os
+    blocos que eles ocupam apareçam na contagem.
+
+    Returns:
+        (blocos vivos por chamada, bytes vivos por chamada, maior pico de uma chamada)
+    """
+    function = benchmark.function
+    results: List[Any] = [None] * len(benchmark.calls)
+    ignore_tracemalloc = [tracemalloc.Filter(False, tracemalloc.__file__)]
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        peak_bytes = 0
+        for index, args in enumerate(benchmark.calls):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            results[index] = function(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            peak_bytes = max(peak_bytes, peak - current)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    # Filtrar só depois de parar, para não contar a compilação dos filtros
+    before = before.filter_traces(ignore_tracemalloc)
+    after = after.filter_traces(ignore_tracemalloc)
+    differences = after.compare_to(before, 'filename')
+    blocks = sum(difference.count_diff for difference in differences)
+    size = sum(difference.size_diff for difference in differences)
+    return blocks / len(benchmark.calls), size / len(benchmark.calls), peak_bytes
+
+
+def measure(
+    benchmark: MicroBenchmark,
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    min_time: float = DEFAULT_MIN_TIME
+) -> MicroResult:
+    """
+    Mede uma função.
+
+    O coletor de lixo fica desligado durante as amostras (como em timeit).
+
+    Args:
+        benchmark: Medição
+        repeat: Número de amostras (pelo menos 2)
+        warmup: Passadas de aquecimento, descartadas
+        min_time: Duração mínima de cada amostra, em segundos
+
+    Returns:
+        Resultado da medição
+
+    Raises:
+        ValueError: Se repeat é menor que 2 ou a medição não tem chamadas
+    """
+    if repeat < 2:
+        raise ValueError(f"São necessárias pelo menos 2 amostras: {repeat}")
+    if not benchmark.calls:
+        raise ValueError(f"Medição sem chamadas: {benchmark.name}")
+
+    for _ in range(warmup):
+        _run_pass(benchmark.function, benchmark.calls)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        passes = 1
+        while _time_passes(benchmark, passes) < min_time:
+            passes *= 2
+
+        calls = passes * len(benchmark.calls)
+        samples = [_time_passes(benchmark, passes) / calls * 1e9 for _ in range(repeat)]
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    q1, median, q3 = statistics.quantiles(samples, n=4)
+    blocks, size, peak = _count_allocations(benchmark)
+    return MicroResult(
+        name=benchmark.name,
+        calls=len(benchmark.calls),
+        passes=passes,
+        samples_ns=samples,
+        median_ns=median,
+        q1_ns=q1,
+        q3_ns=q3,
+        iqr_ns=q3 - q1,
+        allocated_blocks=blocks,
+        allocated_bytes=size,
+        peak_bytes=peak
+    )
+
+
+def run_benchmarks(
+    benchmarks: Sequence[MicroBenchmark],
+    repeat: int = DEFAULT_REPEAT,
+    warmup: int = DEFAULT_WARMUP,
+    min_time: float = DEFAULT_MIN_TIME,
+    progress: Optional[Callable[[MicroResult], None]] = None
+) -> dict:
+    """
+    Mede todas as funções e monta o relatório.
+
+    Args:
+        benchmarks: Medições
+        repeat: Número de amostras de cada medição
+        warmup: Passadas de aquecimento
+        min_time: Duração mínima de cada amostra, em segundos
+        progress: Chamada com cada resultado assim que fica pronto
+
+    Returns:
+        Relatório com informações da máquina, parâmetros e resultados
+    """
+    results = []
+    for benchmark in benchmarks:
+        result = measure(benchmark, repeat, warmup, min_time)
+        results.append(asdict(result))
+        if progress is not None:
+            progress(result)
+
+    return {
+        'format': REPORT_FORMAT,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'warmup': warmup,
+        'min_time': min_time,
+        'results': results,
+    }
+
+
+def compare_reports(report: dict, baseline: dict) -> List[dict]:
+    """
+    Compara as medianas de um relatório com as de uma base.
+
+    Uma mudança é considerada significativa quando a mediana atual está
+    fora do intervalo interquartil da base e a mediana da base está fora
+    do intervalo atual.
+
+    Args:
+        report: Relatório atual
+        baseline: Relatório de base
+
+    Returns:
+        Uma diferença por função presente nos dois relatórios
+
+    Raises:
+        ValueError: Se a base tem outro formato de relatório
+    """
+    if baseline.get('format') != REPORT_FORMAT:
+        raise ValueError(f"Formato de relatório incompatível: {baseline.get('format')} (esperado {REPORT_FORMAT})")
+
+    base_results = {result['name']: result for result in baseline['results']}
+    deltas = []
+    for result in report['results']:
+        base = base_results.get(result['name'])
+        if base is None:
+            continue
+        significant = (
+            not base['q1_ns'] <= result['median_ns'] <= base['q3_ns']
+            and not result['q1_ns'] <= base['median_ns'] <= result['q3_ns']
+        )
+        deltas.append({
+            'name': result['name'],
+            'median_ns': result['median_ns'],
+            'base_median_ns': base['median_ns'],
+            'change_pct': (result['median_ns'] / base['median_ns'] - 1) * 100 if base['median_ns'] > 0 else 0.0,
+            'significant': significant,
+            'allocated_blocks': result['allocated_blocks'],
+            'base_allocated_blocks': base['allocated_blocks'],
+        })
+    return deltas
+
+
+def _print_result(result: MicroResult) -> None:
+    """Mostra uma linha de resultado."""
+    print(
+        f"{result.name:<40} {result.median_ns:>10.0f} ns  IQR {result.iqr_ns:>8.0f} ns  "
+        f"{result.allocated_blocks:>6.1f} blocos {result.allocated_bytes:>8.0f} B  pico {result.peak_bytes:>6} B"
+    )
+
+
+def _print_comparison(deltas: List[dict]) -> None:
+    """Mostra as diferenças para a base."""
+    print()
+    for delta in deltas:
+        if not delta['significant']:
+            mark = ' '
+        elif delta['change_pct'] > 0:
+            mark = '+'
+        else:
+            mark = '-'
+        allocations = ""
+        if delta['allocated_blocks'] != delta['base_allocated_blocks']:
+            allocations = f"  blocos {delta['base_allocated_blocks']:.1f} -> {delta['allocated_blocks']:.1f}"
+        print(
+            f"{mark} {delta['name']:<40} {delta['base_median_ns']:>10.0f} -> {delta['median_ns']:>10.0f} ns "
+            f"({delta['change_pct']:+6.1f}%){allocations}"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Ponto de entrada da linha de comando."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--filter', help='mede só as funções cujo nome contém o texto')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'amostras por função (padrão: {DEFAULT_REPEAT})')
+    parser.add_argument('--warmup', type=int, default=DEFAULT_WARMUP,
+                        help=f'passadas de aquecimento (padrão: {DEFAULT_WARMUP})')
+    parser.add_argument('--min-time', type=float, default=DEFAULT_MIN_TIME,
+                        help=f'duração mínima de cada amostra, em segundos (padrão: {DEFAULT_MIN_TIME})')
+    parser.add_argument('--output', help='arquivo JSON do relatório')
+    parser.add_argument('--baseline', help='relatório anterior para comparar')
+    args = parser.parse_args(argv)
+
+    if args.repeat < 2:
+        parser.error(f"são necessárias pelo menos 2 amostras: {args.repeat}")
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)
+
+    benchmarks = [
+        benchmark for benchmark in default_benchmarks()
+        if not args.filter or args.filter in benchmark.name
+    ]
+    report = run_benchmarks(benchmarks, args.repeat, args.warmup, args.min_time, _print_result)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"\nRelatório gravado em {args.output}")
+
+    if baseline is not None:
+        _print_comparison(compare_reports(report, baseline))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
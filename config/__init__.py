@@ -5,10 +5,12 @@ from .window_config import WindowConfig
 from .board_config import BoardConfig
 from .colors_config import ColorsConfig
 from .ui_element_config import UIElementConfig
+from .ai_config import AIConfig
 
 __all__ = [
     'WindowConfig',
     'BoardConfig',
     'ColorsConfig',
-    'UIElementConfig'
+    'UIElementConfig',
+    'AIConfig'
 ]
\ No newline at end of file
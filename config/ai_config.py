@@ -0,0 +1,25 @@
+"""Configurações da inteligência artificial."""
+
+import os
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass
+class AIConfig:
+    """Configurações da IA."""
+
+    # Livro de aberturas (gerado com: python -m core.ai.opening_book build ARQUIVO)
+    OPENING_BOOK_PATH: str = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'opening_book.bin'
+    )
+
+    # Tabela de finais (gerada com: python -m core.tablebase build ARQUIVO)
+    TABLEBASE_PATH: str = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'endgame.tb'
+    )
+
+    # Dificuldades (nomes de Difficulty) que buscam com reduções de
+    # movimentos tardios e poda de futilidade: alcançam mais profundidade no
+    # mesmo tempo, mas mudam a força e os movimentos escolhidos pela IA
+    SELECTIVE_SEARCH_DIFFICULTIES: Tuple[str, ...] = ('HARD',)
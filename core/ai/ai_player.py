@@ -1,13 +1,18 @@
 """Jogador controlado por IA."""
 
 import random
+import threading
 from typing import Optional
+from config.ai_config import AIConfig
 from ..board_state import BoardState
 from ..move import Move
 from ..enums import PlayerColor, Difficulty
 from ..evaluation.base_evaluator import BaseEvaluator
 from ..move_generator import MoveGenerator
+from ..tablebase import EndgameTablebase
 from .minimax import MinimaxAlphaBeta
+from .ponder import Ponderer
+from .opening_book import OpeningBook
 
 
 class AIPlayer:
@@ -22,7 +27,12 @@ class AIPlayer:
         color: PlayerColor,
         evaluator: BaseEvaluator,
         difficulty: Difficulty = Difficulty.MEDIUM,
-        name: str = "IA"
+        name: str = "IA",
+        time_limit_ms: Optional[float] = None,
+        workers: int = 1,
+        ponder: bool = False,
+        opening_book: Optional[OpeningBook] = None,
+        tablebase: Optional[EndgameTablebase] = None
     ):
         """
         Inicializa o jogador de IA.
@@ -30,8 +40,17 @@ class AIPlayer:
         Args:
             color: Cor do jogador
             evaluator: Função de avaliação a usar
-            difficulty: Dificuldade da IA (controla profundidade e aleatoriedade)
+            difficulty: Dificuldade da IA (controla profundidade, aleatoriedade
+                e, por AIConfig.SELECTIVE_SEARCH_DIFFICULTIES, o uso de
+                reduções de movimentos tardios e poda de futilidade)
             name: Nome do jogador
+            time_limit_ms: Orçamento de tempo por movimento em milissegundos.
+                Se informado, a busca usa aprofundamento iterativo até o tempo
+                acabar em vez da profundidade fixa da dificuldade.
+            workers: Número de processos para a busca na raiz (1 = serial)
+            ponder: Pensar durante o turno do adversário (ver start_pondering)
+            opening_book: Livro de aberturas consultado antes da busca
+            tablebase: Tabela de finais consultada pela busca
         """
         self.color = color
         self.evaluator = evaluator
@@ -39,21 +58,42 @@ class AIPlayer:
         self.depth = difficulty.get_max_depth()
         self.random_move_probability = difficulty.get_random_move_probability()
         self.name = name
-        self.minimax = MinimaxAlphaBeta(evaluator, self.depth)
-
-    def choose_move(self, board: BoardState) -> Optional[Move]:
+        self.time_limit_ms = time_limit_ms
+        selective = difficulty.name in AIConfig.SELECTIVE_SEARCH_DIFFICULTIES
+        self.minimax = MinimaxAlphaBeta(
+            evaluator,
+            self.depth,
+            workers=workers,
+            late_move_reductions=selective,
+            futility_pruning=selective,
+            tablebase=tablebase
+        )
+        self.ponderer = Ponderer(self.minimax, color, time_limit_ms) if ponder else None
+        self.opening_book = opening_book
+
+    def choose_move(
+        self,
+        board: BoardState,
+        stop_event: Optional[threading.Event] = None
+    ) -> Optional[Move]:
         """
         Escolhe o melhor movimento para o estado atual.
 
         Args:
             board: Estado atual do tabuleiro
+            stop_event: Evento que cancela a busca quando sinalizado (opcional)
 
         Returns:
-            Melhor movimento encontrado ou None se não há movimentos
+            Melhor movimento encontrado ou None se não há movimentos ou se
+            a busca foi cancelada
         """
         # Obter todos os movimentos válidos
         all_moves = self._get_all_valid_moves(board)
 
+        # Parar o pondering antes de usar o motor, aproveitando o resultado
+        # se a posição atual foi prevista
+        pondered = self.ponderer.take(board) if self.ponderer is not None else None
+
         if not all_moves:
             return None
 
@@ -61,8 +101,17 @@ class AIPlayer:
         if random.random() < self.random_move_probability:
             return random.choice(all_moves)
 
+        if pondered is not None and pondered.move in all_moves:
+            return pondered.move
+
+        # Posições do livro de aberturas dispensam a busca
+        if self.opening_book is not None:
+            book_move = self.opening_book.choose_move(board, self.color, all_moves)
+            if book_move is not None:
+                return book_move
+
         # Usar minimax para escolher melhor movimento
-        move = self.minimax.find_best_move(board, self.color)
+        move = self.minimax.find_best_move(board, self.color, self.time_limit_ms, stop_event)
         return move
 
     def _get_all_valid_moves(self, board: BoardState) -> list[Move]:
@@ -94,14 +143,40 @@ class AIPlayer:
 
         return moves
 
+    def start_pondering(self, board: BoardState) -> None:
+        """
+        Começa a pensar durante o turno do adversário (se pondering ativo).
+
+        Args:
+            board: Tabuleiro com o adversário a jogar
+        """
+        if self.ponderer is not None:
+            self.ponderer.start(board)
+
+    def stop_pondering(self) -> None:
+        """Interrompe o pondering em andamento, se houver."""
+        if self.ponderer is not None:
+            self.ponderer.stop()
+
     def get_last_statistics(self) -> dict:
         """
-        Retorna estatísticas da última busca.
+        Retorna estatísticas da última busca (e do pondering e do livro de
+        aberturas, se ativos).
 
         Returns:
             Dicionário com estatísticas
         """
-        return self.minimax.get_statistics()
+        statistics = self.minimax.get_statistics()
+        if self.ponderer is not None:
+            statistics.update(self.ponderer.get_statistics())
+        if self.opening_book is not None:
+            statistics.update(self.opening_book.get_statistics())
+        return statistics
+
+    def shutdown(self) -> None:
+        """Interrompe o pondering e libera os processos da busca paralela."""
+        self.stop_pondering()
+        self.minimax.shutdown()
 
     def __str__(self) -> str:
         """Representação em string."""
@@ -0,0 +1,94 @@
+"""Busca da IA executada em segundo plano."""
+
+import threading
+from typing import Optional
+from ..board_state import BoardState
+from ..move import Move
+from .ai_player import AIPlayer
+
+
+class BackgroundSearch:
+    """
+    Executa AIPlayer.choose_move em uma thread separada.
+
+    Permite que o loop principal do jogo continue rodando (eventos e
+    renderização) enquanto a IA pensa. O resultado é consultado a cada
+    quadro com done()/result(), e a busca pode ser cancelada com cancel().
+    """
+
+    def __init__(self, ai_player: AIPlayer, board: BoardState):
+        """
+        Inicia a busca em segundo plano.
+
+        Args:
+            ai_player: Jogador de IA que vai escolher o movimento
+            board: Estado do tabuleiro (é copiado; o original pode mudar)
+        """
+        self.ai_player = ai_player
+        self._stop_event = threading.Event()
+        self._finished = threading.Event()
+        self._move: Optional[Move] = None
+        self._error: Optional[BaseException] = None
+
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(board.clone(),),
+            name=f"BackgroundSearch-{ai_player.color.value}",
+            daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, board: BoardState) -> None:
+        """Corpo da thread: escolhe o movimento e guarda o resultado."""
+        try:
+            self._move = self.ai_player.choose_move(board, self._stop_event)
+        except BaseException as error:
+            self._error = error
+        finally:
+            self._finished.set()
+
+    def done(self) -> bool:
+        """
+        Verifica se a busca terminou.
+
+        Returns:
+            True se a busca terminou (ou foi cancelada e já parou)
+        """
+        return self._finished.is_set()
+
+    def result(self) -> Optional[Move]:
+        """
+        Retorna o movimento escolhido.
+
+        Deve ser chamado apenas depois que done() retornar True.
+
+        Returns:
+            Movimento escolhido ou None se não há movimentos ou se a busca
+            foi cancelada
+
+        Raises:
+            Exception: Repassa qualquer erro ocorrido na busca
+        """
+        if self._error is not None:
+            raise self._error
+        if self._stop_event.is_set():
+            return None
+        return self._move
+
+    def cancel(self) -> None:
+        """
+        Pede que a busca pare o quanto antes; o resultado será descartado.
+
+        Não espera a thread terminar: uma nova busca no mesmo motor espera
+        a cancelada parar (MinimaxAlphaBeta só executa uma busca por vez).
+        """
+        self._stop_event.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Verifica se a busca foi cancelada.
+
+        Returns:
+            True se cancel() foi chamado
+        """
+        return self._stop_event.is_set()
@@ -1,13 +1,40 @@
 """Implementação do algoritmo Minimax com poda Alpha-Beta."""
 
-from typing import Optional, Tuple
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import math
+import threading
+import time
 from ..board_state import BoardState
 from ..move import Move
-from ..enums import PlayerColor
+from ..enums import PlayerColor, BoundType, GameStatus, TablebaseValue
 from ..game_rules import GameRules
 from ..move_generator import MoveGenerator
 from ..evaluation.base_evaluator import BaseEvaluator
+from ..evaluation.features import MaskTracker, board_masks
+from ..tablebase import EndgameTablebase, TablebaseEntry
+from .transposition_table import TranspositionTable
+from .move_ordering import MoveOrderer, HeuristicMoveOrderer
+from .parallel_search import ParallelRootSearch
+
+
+class SearchTimeout(Exception):
+    """Sinaliza que a busca deve parar (tempo esgotado ou cancelamento)."""
+
+
+@dataclass
+class AnalysisLine:
+    """
+    Linha de análise de um movimento da raiz.
+
+    Attributes:
+        move: Movimento da raiz
+        score: Pontuação do movimento para o jogador da raiz
+        pv: Variação principal, começando pelo próprio movimento
+    """
+    move: Move
+    score: float
+    pv: List[Move]
 
 
 class MinimaxAlphaBeta:
@@ -15,164 +42,1221 @@ class MinimaxAlphaBeta:
     Implementa o algoritmo Minimax com poda Alpha-Beta.
 
     Usado pela IA para encontrar o melhor movimento.
+
+    A busca é feita na forma negamax: cada nó retorna a pontuação do ponto
+    de vista do jogador que tem a vez naquele nó. As folhas são sempre
+    avaliadas do ponto de vista do jogador da raiz e têm o sinal ajustado.
     """
 
-    def __init__(self, evaluator: BaseEvaluator, max_depth: int = 4):
+    # Pontuação base de vitória (somada à profundidade restante)
+    WIN_SCORE = 10000
+
+    # Profundidade máxima do aprofundamento iterativo com limite de tempo
+    MAX_ITERATIVE_DEPTH = 64
+
+    # Intervalo (em nós) entre verificações do relógio; potência de 2 menos 1
+    TIME_CHECK_MASK = 255
+
+    # Limite padrão de plies da busca de quiescência além do horizonte
+    DEFAULT_QUIESCENCE_MAX_PLY = 8
+
+    # Meia-largura padrão da janela de aspiração (meia peça comum na escala
+    # dos avaliadores, em que uma peça comum vale cerca de 2)
+    DEFAULT_ASPIRATION_WINDOW = 1.0
+
+    # Reduções de movimentos tardios (LMR): profundidade restante mínima,
+    # índice mínimo do movimento na lista ordenada e plies reduzidos
+    DEFAULT_LMR_MIN_DEPTH = 3
+    DEFAULT_LMR_MIN_MOVE_INDEX = 2
+    DEFAULT_LMR_REDUCTION = 2
+
+    # Margens da poda de futilidade por profundidade restante (1, 2, ...)
+    DEFAULT_FUTILITY_MARGINS = (2.0, 4.0)
+
+    def __init__(
+        self,
+        evaluator: BaseEvaluator,
+        max_depth: int = 4,
+        tt_max_entries: Optional[int] = TranspositionTable.DEFAULT_MAX_ENTRIES,
+        tt_max_bytes: Optional[int] = None,
+        move_orderer: Optional[MoveOrderer] = None,
+        workers: int = 1,
+        quiescence_max_ply: int = DEFAULT_QUIESCENCE_MAX_PLY,
+        aspiration_window: Optional[float] = DEFAULT_ASPIRATION_WINDOW,
+        late_move_reductions: bool = False,
+        lmr_min_depth: int = DEFAULT_LMR_MIN_DEPTH,
+        lmr_min_move_index: int = DEFAULT_LMR_MIN_MOVE_INDEX,
+        lmr_reduction: int = DEFAULT_LMR_REDUCTION,
+        futility_pruning: bool = False,
+        futility_margins: Tuple[float, ...] = DEFAULT_FUTILITY_MARGINS,
+        tablebase: Optional[EndgameTablebase] = None,
+        batch_frontier: bool = False
+    ):
         """
         Inicializa o algoritmo.
 
         Args:
             evaluator: Função de avaliação a usar
             max_depth: Profundidade máxima de busca
+            tt_max_entries: Limite de entradas da tabela de transposição
+                (None ou 0, sem tt_max_bytes, desativa a tabela)
+            tt_max_bytes: Orçamento aproximado de memória da tabela
+            move_orderer: Estágio de ordenação de movimentos (padrão:
+                HeuristicMoveOrderer; MoveOrderer() mantém a ordem do gerador)
+            workers: Número de processos para a busca na raiz. Com mais de
+                um, os movimentos da raiz são distribuídos entre processos
+                (apenas na busca de profundidade fixa).
+            quiescence_max_ply: Máximo de plies de capturas buscados além do
+                horizonte (0 desativa a busca de quiescência)
+            aspiration_window: Meia-largura da janela de aspiração em torno
+                da pontuação da iteração anterior, no aprofundamento
+                iterativo (None desativa)
+            late_move_reductions: Buscar lances quietos tardios com
+                profundidade reduzida (repetindo a busca se superarem alpha)
+            lmr_min_depth: Profundidade restante mínima para reduzir
+            lmr_min_move_index: Índice mínimo (na lista ordenada) do
+                movimento reduzido
+            lmr_reduction: Número de plies reduzidos
+            futility_pruning: Descartar lances quietos perto das folhas
+                quando a avaliação estática mais a margem não alcança alpha
+            futility_margins: Margem para cada profundidade restante (a
+                primeira vale para profundidade 1); a poda só ocorre até
+                len(futility_margins)
+            tablebase: Tabela de finais consultada nos nós da busca; posições
+                cobertas recebem o valor teórico sem serem expandidas
+            batch_frontier: Nos nós de profundidade 1, avaliar de uma vez
+                (com NumPy, via evaluation.batch) todos os filhos sem
+                capturas pendentes, em vez de visitar cada um; requer um
+                avaliador com uses_features
+
+        Raises:
+            ValueError: Se batch_frontier é pedido com um avaliador que não
+                usa características
+            ImportError: Se batch_frontier é pedido sem NumPy instalado
+
+        Reduções e podas seletivas vêm desligadas: com elas o valor de um nó
+        passa a depender da janela de busca, e a busca alcança mais
+        profundidade mas pode escolher outros movimentos. AIPlayer as liga conforme a dificuldade
+        (AIConfig.SELECTIVE_SEARCH_DIFFICULTIES).
         """
         self.evaluator = evaluator
         self.max_depth = max_depth
         self.nodes_evaluated = 0
+        self.move_generations = 0
+        self.interior_nodes = 0
+        self.quiescence_nodes = 0
+        self.depth_reached = 0
+        self.search_time_ms = 0.0
+        self.time_limit_ms: Optional[float] = None
+
+        # Resultado da última busca completa: pontuação e variação principal
+        self.best_score: Optional[float] = None
+        self.principal_variation: List[Move] = []
+
+        # Tabela triangular da variação principal: a linha ply guarda a
+        # melhor continuação a partir daquele ply
+        self._pv_table: List[List[Move]] = []
+        # Variação principal da última busca da raiz (ainda não confirmada)
+        self._root_pv: List[Move] = []
+
+        self.quiescence_max_ply = quiescence_max_ply
+        self.aspiration_window = aspiration_window
+        self.late_move_reductions = late_move_reductions
+        self.lmr_min_depth = lmr_min_depth
+        self.lmr_min_move_index = lmr_min_move_index
+        self.lmr_reduction = lmr_reduction
+        self.futility_pruning = futility_pruning
+        self.futility_margins = tuple(futility_margins)
+        self.tablebase = tablebase
+
+        # Avaliação em lote da fronteira: NumPy só é importado se ativada
+        self.batch_frontier = batch_frontier
+        self._board_batch = None
+        self._mask_tracker: Optional[MaskTracker] = None
+        if batch_frontier:
+            if not evaluator.uses_features:
+                raise ValueError(f"batch_frontier requer um avaliador com uses_features: {evaluator}")
+            from ..evaluation.batch import BoardBatch
+            self._board_batch = BoardBatch
 
-    def find_best_move(self, board: BoardState, color: PlayerColor) -> Optional[Move]:
+        # Contadores da busca por variação principal (PVS), da aspiração,
+        # das reduções de movimentos tardios e da poda de futilidade
+        self.pvs_researches = 0
+        self.aspiration_fail_highs = 0
+        self.aspiration_fail_lows = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.futility_prunes = 0
+        self.tablebase_hits = 0
+        self.batched_leaves = 0
+
+        # Instante (time.perf_counter) em que a busca deve parar
+        self._deadline: Optional[float] = None
+        # Uma busca por vez: tabelas, contadores e avaliador são do motor,
+        # e uma busca cancelada pode ainda estar terminando em outra thread
+        self._search_lock = threading.Lock()
+
+        self.move_orderer = move_orderer if move_orderer is not None else HeuristicMoveOrderer()
+
+        self.workers = workers
+        self._tt_max_entries = tt_max_entries
+        self._tt_max_bytes = tt_max_bytes
+        self._parallel: Optional[ParallelRootSearch] = None
+
+        if tt_max_entries or tt_max_bytes:
+            self.transposition_table: Optional[TranspositionTable] = TranspositionTable(
+                max_entries=tt_max_entries or None,
+                max_bytes=tt_max_bytes
+            )
+        else:
+            self.transposition_table = None
+
+        # Cor da raiz da busca atual (as folhas são avaliadas deste ponto de vista)
+        self._root_color = PlayerColor.RED
+        # Cor da raiz para a qual as pontuações da tabela foram calculadas
+        self._table_color: Optional[PlayerColor] = None
+
+    def find_best_move(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        time_limit_ms: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> Optional[Move]:
         """
         Encontra o melhor movimento para o jogador.
 
+        Sem limite de tempo, busca até max_depth. Com limite de tempo, usa
+        aprofundamento iterativo (profundidade 1, 2, 3...) até o tempo
+        acabar e retorna o melhor movimento da última iteração completa.
+
         Args:
             board: Estado atual do tabuleiro
             color: Cor do jogador
+            time_limit_ms: Orçamento de tempo em milissegundos (opcional)
+            stop_event: Evento que, quando sinalizado (por outra thread),
+                interrompe a busca (opcional)
+
+        Uma busca iniciada enquanto outra usa o motor espera a anterior
+        terminar (uma busca cancelada para na próxima verificação).
 
         Returns:
-            Melhor movimento encontrado ou None se não há movimentos
+            Melhor movimento encontrado ou None se não há movimentos ou se
+            a busca foi cancelada
         """
-        self.nodes_evaluated = 0
-        best_move = None
-        best_score = -math.inf
+        with self._search_lock:
+            # Cancelada enquanto esperava a busca anterior terminar
+            if stop_event is not None and stop_event.is_set():
+                return None
+            return self._find_best_move(board, color, time_limit_ms, stop_event)
+
+    def _find_best_move(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        time_limit_ms: Optional[float],
+        stop_event: Optional[threading.Event]
+    ) -> Optional[Move]:
+        """
+        Corpo de find_best_move, executado com o motor reservado.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador
+            time_limit_ms: Orçamento de tempo em milissegundos (ou None)
+            stop_event: Evento de cancelamento da busca (ou None)
+
+        Returns:
+            Melhor movimento encontrado ou None se não há movimentos ou se
+            a busca foi cancelada
+        """
+        start_time = time.perf_counter()
+        self._start_search(color, time_limit_ms)
 
         # Obter todos os movimentos válidos
         valid_moves = MoveGenerator.get_all_valid_moves(color, board)
+        self.move_generations += 1
+        self.interior_nodes += 1
 
         if not valid_moves:
             return None
 
+        # Buscar sobre uma cópia, aplicando e desfazendo movimentos no lugar,
+        # para não alterar o tabuleiro de quem chamou
+        search_board = board.clone()
+        search_board.set_side_to_move(color)
+        self._attach(search_board)
+
+        try:
+            if time_limit_ms is None and self.workers > 1 and len(valid_moves) > 1:
+                best_move, self.best_score = self._search_root_parallel(
+                    search_board, color, valid_moves, self.max_depth, stop_event
+                )
+                self.principal_variation = self._root_pv
+                self.depth_reached = self.max_depth
+            elif time_limit_ms is None:
+                best_move, self.best_score = self._search_root(
+                    search_board, color, valid_moves, self.max_depth, stop_event,
+                    self._probe_hash_move(search_board)
+                )
+                self.principal_variation = self._root_pv
+                self.depth_reached = self.max_depth
+            else:
+                best_move = self._iterative_deepening(
+                    search_board, color, valid_moves, start_time, time_limit_ms, stop_event
+                )
+        except SearchTimeout:
+            # Só ocorre aqui por cancelamento (o tempo é tratado no aprofundamento)
+            best_move = None
+
+        self.search_time_ms = (time.perf_counter() - start_time) * 1000
+
+        if stop_event is not None and stop_event.is_set():
+            return None
+        return best_move
+
+    def evaluate_position(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Avalia uma posição com o avaliador do motor, fora de uma busca.
+
+        O avaliador pertence ao motor (contadores, cache, tabuleiro
+        observado); se uma busca está em andamento, espera ela terminar.
+
+        Args:
+            board: Estado do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação da posição (quanto maior, melhor para a cor)
+        """
+        with self._search_lock:
+            return self.evaluator.evaluate(board, color)
+
+    def analyze(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        multipv: int = 1,
+        depth: Optional[int] = None
+    ) -> List[AnalysisLine]:
+        """
+        Analisa a posição e retorna os melhores movimentos da raiz.
+
+        A busca é feita por aprofundamento iterativo até a profundidade
+        pedida. Na raiz, cada movimento só é buscado com janela completa se
+        puder entrar entre os multipv melhores (janela nula acima do
+        k-ésimo melhor valor); os demais são descartados com o custo de uma
+        busca de janela nula. Com multipv=1 o custo é o de uma busca normal.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador
+            multipv: Número de linhas a retornar
+            depth: Profundidade da análise (padrão: max_depth)
+
+        Returns:
+            Até multipv linhas, da melhor para a pior (empates na ordem da raiz)
+        """
+        if multipv < 1:
+            raise ValueError(f"multipv deve ser pelo menos 1: {multipv}")
+
+        with self._search_lock:
+            start_time = time.perf_counter()
+            self._start_search(color, None)
+
+            valid_moves = MoveGenerator.get_all_valid_moves(color, board)
+            self.move_generations += 1
+            self.interior_nodes += 1
+
+            if not valid_moves:
+                return []
+
+            search_board = board.clone()
+            search_board.set_side_to_move(color)
+            self._attach(search_board)
+
+            lines: List[AnalysisLine] = []
+            for iteration_depth in range(1, (depth or self.max_depth) + 1):
+                lines = self._search_root_multipv(search_board, color, valid_moves, iteration_depth, multipv, lines)
+                self.depth_reached = iteration_depth
+
+            self.best_score = lines[0].score
+            self.principal_variation = lines[0].pv
+            self.search_time_ms = (time.perf_counter() - start_time) * 1000
+            return lines
+
+    def _start_search(self, color: PlayerColor, time_limit_ms: Optional[float]) -> None:
+        """
+        Zera os contadores e prepara as estruturas para uma nova busca.
+
+        Args:
+            color: Cor do jogador da raiz
+            time_limit_ms: Orçamento de tempo da busca (ou None)
+        """
+        self.nodes_evaluated = 0
+        self.move_generations = 0
+        self.interior_nodes = 0
+        self.quiescence_nodes = 0
+        self.pvs_researches = 0
+        self.aspiration_fail_highs = 0
+        self.aspiration_fail_lows = 0
+        self.lmr_reductions = 0
+        self.lmr_researches = 0
+        self.futility_prunes = 0
+        self.tablebase_hits = 0
+        self.batched_leaves = 0
+        self.depth_reached = 0
+        self.best_score = None
+        self.principal_variation = []
+        self.time_limit_ms = time_limit_ms
+        self._deadline = None
+        self._root_color = color
+        self._reset_pv_table()
+        self._prepare_transposition_table(color)
+        self.move_orderer.new_search()
+        self.evaluator.new_search()
+
+    def _reset_pv_table(self) -> None:
+        """Cria a tabela triangular com uma linha por ply possível."""
+        max_ply = max(self.max_depth, self.MAX_ITERATIVE_DEPTH) + self.quiescence_max_ply + 2
+        self._pv_table = [[] for _ in range(max_ply)]
+        self._root_pv = []
+
+    def _iterative_deepening(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        valid_moves: List[Move],
+        start_time: float,
+        time_limit_ms: float,
+        stop_event: Optional[threading.Event]
+    ) -> Move:
+        """
+        Busca com profundidades crescentes até o orçamento de tempo acabar.
+
+        A primeira iteração sempre é concluída, para que haja um movimento.
+        Uma nova iteração só começa se menos da metade do orçamento foi
+        gasta, já que cada iteração costuma custar várias vezes a anterior.
+
+        A partir da segunda iteração, a raiz é buscada com uma janela de
+        aspiração em torno da pontuação anterior. Se o resultado cai fora
+        da janela (fail-low ou fail-high), o lado que falhou é alargado
+        (dobrando a largura) e a iteração é repetida.
+
+        Args:
+            board: Cópia do tabuleiro usada na busca
+            color: Cor do jogador
+            valid_moves: Movimentos válidos na raiz
+            start_time: Início da busca (time.perf_counter)
+            time_limit_ms: Orçamento de tempo em milissegundos
+            stop_event: Evento de cancelamento da busca (ou None)
+
+        Returns:
+            Melhor movimento da última iteração completa
+        """
+        best_move = valid_moves[0]
+
+        # Com um único movimento possível não há o que buscar
+        if len(valid_moves) == 1:
+            return best_move
+
+        budget = time_limit_ms / 1000
+        hash_move = self._probe_hash_move(board)
+        score = None
+
+        for depth in range(1, self.MAX_ITERATIVE_DEPTH + 1):
+            if depth > 1:
+                self._deadline = start_time + budget
+
+            try:
+                move, score = self._search_with_aspiration(board, color, valid_moves, depth, stop_event, hash_move, score)
+            except SearchTimeout:
+                break
+
+            best_move = move
+            self.best_score = score
+            self.principal_variation = self._root_pv
+            self.depth_reached = depth
+
+            # Vitória ou derrota comprovada: buscar mais fundo não muda nada
+            if abs(score) >= self.WIN_SCORE:
+                break
+
+            if time.perf_counter() - start_time >= budget / 2:
+                break
+
+            # Próxima iteração começa pelo melhor movimento desta
+            hash_move = move
+
+        self._deadline = None
+        return best_move
+
+    def _search_with_aspiration(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        valid_moves: List[Move],
+        depth: int,
+        stop_event: Optional[threading.Event],
+        hash_move: Optional[Move],
+        previous_score: Optional[float]
+    ) -> Tuple[Move, float]:
+        """
+        Busca a raiz com uma janela de aspiração em torno da pontuação anterior.
+
+        Args:
+            board: Cópia do tabuleiro usada na busca
+            color: Cor do jogador
+            valid_moves: Movimentos válidos na raiz
+            depth: Profundidade da busca
+            stop_event: Evento de cancelamento da busca (ou None)
+            hash_move: Melhor movimento conhecido, buscado primeiro
+            previous_score: Pontuação da iteração anterior (None = janela completa)
+
+        Returns:
+            Tupla (melhor movimento, pontuação exata)
+
+        Raises:
+            SearchTimeout: Se o tempo acabar durante a busca
+        """
+        if previous_score is None or not self.aspiration_window:
+            return self._search_root(board, color, valid_moves, depth, stop_event, hash_move)
+
+        delta = self.aspiration_window
+        alpha = previous_score - delta
+        beta = previous_score + delta
+
+        while True:
+            move, score = self._search_root(board, color, valid_moves, depth, stop_event, hash_move, alpha, beta)
+
+            if score <= alpha:
+                self.aspiration_fail_lows += 1
+                alpha = score - delta if delta < self.WIN_SCORE else -math.inf
+            elif score >= beta:
+                self.aspiration_fail_highs += 1
+                beta = score + delta if delta < self.WIN_SCORE else math.inf
+                # O movimento que falhou alto é o melhor candidato
+                hash_move = move
+            else:
+                return move, score
+
+            delta *= 2
+
+    def _search_root(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        valid_moves: List[Move],
+        depth: int,
+        stop_event: Optional[threading.Event] = None,
+        hash_move: Optional[Move] = None,
+        alpha: float = -math.inf,
+        beta: float = math.inf
+    ) -> Tuple[Move, float]:
+        """
+        Busca a raiz com uma profundidade fixa.
+
+        O primeiro movimento é buscado com a janela (alpha, beta); os
+        demais, com uma janela nula logo acima do melhor valor até então
+        (PVS). Um movimento que supera essa janela é buscado de novo com a
+        janela completa para obter seu valor exato.
+
+        Args:
+            board: Cópia do tabuleiro usada na busca
+            color: Cor do jogador
+            valid_moves: Movimentos válidos na raiz
+            depth: Profundidade da busca
+            stop_event: Evento de cancelamento da busca (ou None)
+            hash_move: Melhor movimento conhecido, buscado primeiro
+            alpha: Limite inferior da janela
+            beta: Limite superior da janela
+
+        Returns:
+            Tupla (melhor movimento, pontuação). A pontuação é exata se
+            estiver dentro da janela; caso contrário é um limite.
+
+        Raises:
+            SearchTimeout: Se o tempo acabar durante a busca
+        """
+        ordered_moves = self.move_orderer.order_moves(valid_moves, board, 0, hash_move)
+        original_alpha = alpha
+        best_move = ordered_moves[0]
+        best_score = -math.inf
+
         # Avaliar cada movimento
-        for move in valid_moves:
+        for index, move in enumerate(ordered_moves):
             # Aplicar movimento
-            new_board = GameRules.apply_move(board, move)
-
-            # Avaliar posição resultante
-            score = self._minimax(
-                board=new_board,
-                depth=self.max_depth - 1,
-                alpha=-math.inf,
-                beta=math.inf,
-                maximizing=False,  # Próxima jogada é do oponente
-                color=color
-            )
+            undo = board.make_move(move)
+
+            # Avaliar posição resultante (próxima jogada é do oponente)
+            score = self._search_child(board, depth, alpha, beta, color, 1, index == 0, stop_event)
+
+            # Desfazer movimento
+            board.unmake_move(undo)
 
             # Atualizar melhor movimento
             if score > best_score:
                 best_score = score
                 best_move = move
+                self._root_pv = [move] + self._pv_table[1]
 
-        return best_move
+            alpha = max(alpha, score)
+            if beta <= alpha:
+                break
+
+        if self.transposition_table is not None:
+            if best_score <= original_alpha:
+                bound = BoundType.UPPER
+            elif best_score >= beta:
+                bound = BoundType.LOWER
+            else:
+                bound = BoundType.EXACT
+            self.transposition_table.store(board.zobrist, depth, best_score, bound, best_move)
+
+        return best_move, best_score
+
+    def _search_root_multipv(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        valid_moves: List[Move],
+        depth: int,
+        multipv: int,
+        previous_lines: List[AnalysisLine]
+    ) -> List[AnalysisLine]:
+        """
+        Busca a raiz mantendo os multipv melhores movimentos com valor exato.
+
+        Args:
+            board: Cópia do tabuleiro usada na busca
+            color: Cor do jogador
+            valid_moves: Movimentos válidos na raiz
+            depth: Profundidade da busca
+            multipv: Número de linhas mantidas
+            previous_lines: Linhas da iteração anterior (buscadas primeiro)
+
+        Returns:
+            Linhas ordenadas da melhor para a pior
+        """
+        hash_move = previous_lines[0].move if previous_lines else self._probe_hash_move(board)
+        ordered_moves = self.move_orderer.order_moves(valid_moves, board, 0, hash_move)
+        if previous_lines:
+            previous_moves = [line.move for line in previous_lines]
+            ordered_moves = previous_moves + [move for move in ordered_moves if move not in previous_moves]
+
+        lines: List[AnalysisLine] = []
+
+        for move in ordered_moves:
+            # Enquanto não há multipv linhas, todo movimento entra com janela completa
+            alpha = lines[-1].score if len(lines) == multipv else -math.inf
+
+            undo = board.make_move(move)
+            score = self._search_child(board, depth, alpha, math.inf, color, 1, False, None)
+            board.unmake_move(undo)
+
+            if score > alpha:
+                line = AnalysisLine(move=move, score=score, pv=[move] + self._pv_table[1])
+                # Inserir depois das linhas de pontuação maior ou igual
+                position = len(lines)
+                while position > 0 and lines[position - 1].score < score:
+                    position -= 1
+                lines.insert(position, line)
+                del lines[multipv:]
+
+        if self.transposition_table is not None:
+            self.transposition_table.store(board.zobrist, depth, lines[0].score, BoundType.EXACT, lines[0].move)
+
+        return lines
 
-    def _minimax(
+    def _search_child(
         self,
         board: BoardState,
         depth: int,
         alpha: float,
         beta: float,
-        maximizing: bool,
+        color: PlayerColor,
+        ply: int,
+        first_move: bool,
+        stop_event: Optional[threading.Event],
+        reduction: int = 0
+    ) -> float:
+        """
+        Busca a posição depois de um movimento (PVS).
+
+        O primeiro movimento de um nó é buscado com a janela completa. Os
+        demais são buscados com janela nula (alpha, próximo float acima de
+        alpha), o que só prova que não superam alpha; se superarem (sem
+        chegar a beta), são buscados de novo com a janela completa.
+
+        Com redução (LMR), a busca de janela nula é feita primeiro com a
+        profundidade reduzida; se o movimento superar alpha, ele é buscado
+        de novo com a profundidade normal.
+
+        Args:
+            board: Tabuleiro com o movimento já aplicado
+            depth: Profundidade restante no nó pai
+            alpha: Limite inferior da janela do nó pai
+            beta: Limite superior da janela do nó pai
+            color: Cor do jogador que fez o movimento
+            ply: Distância da posição filha até a raiz
+            first_move: Se é o primeiro movimento buscado no nó pai
+            stop_event: Evento de cancelamento da busca (ou None)
+            reduction: Plies reduzidos na primeira busca (LMR)
+
+        Returns:
+            Pontuação do movimento do ponto de vista de color
+        """
+        opponent = color.opposite()
+
+        if not first_move and alpha > -math.inf:
+            null_beta = math.nextafter(alpha, math.inf)
+
+            if reduction:
+                self.lmr_reductions += 1
+                score = -self._negamax(board, depth - 1 - reduction, -null_beta, -alpha, opponent, ply, stop_event)
+                if score <= alpha:
+                    return score
+                self.lmr_researches += 1
+
+            score = -self._negamax(board, depth - 1, -null_beta, -alpha, opponent, ply, stop_event)
+            if score <= alpha or score >= beta:
+                return score
+            self.pvs_researches += 1
+
+        return -self._negamax(board, depth - 1, -beta, -alpha, opponent, ply, stop_event)
+
+    def _search_root_parallel(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        valid_moves: List[Move],
+        depth: int,
+        stop_event: Optional[threading.Event]
+    ) -> Tuple[Move, float]:
+        """
+        Busca a raiz distribuindo os movimentos entre processos.
+
+        A variação principal do melhor movimento, devolvida pelo processo
+        que o buscou, fica em _root_pv.
+
+        Args:
+            board: Cópia do tabuleiro usada na busca
+            color: Cor do jogador
+            valid_moves: Movimentos válidos na raiz
+            depth: Profundidade da busca
+            stop_event: Evento de cancelamento da busca (ou None)
+
+        Os incrementos de histórico feitos nos processos são somados ao
+        ordenador deste motor. O resultado pode diferir do da busca serial
+        (ver ParallelRootSearch).
+
+        Returns:
+            Tupla (melhor movimento, pontuação)
+
+        Raises:
+            SearchTimeout: Se a busca foi cancelada
+        """
+        if self._parallel is None:
+            self._parallel = ParallelRootSearch(self.workers, self._engine_config())
+
+        ordered_moves = self.move_orderer.order_moves(
+            valid_moves, board, 0, self._probe_hash_move(board)
+        )
+        result = self._parallel.search(board, color, ordered_moves, depth, stop_event)
+        if result is None:
+            raise SearchTimeout()
+        best_move, best_score, best_pv, nodes, history_increments = result
+        self.nodes_evaluated += nodes
+        self.move_orderer.merge_history(history_increments)
+        self._root_pv = best_pv
+
+        if self.transposition_table is not None:
+            self.transposition_table.store(board.zobrist, depth, best_score, BoundType.EXACT, best_move)
+
+        return best_move, best_score
+
+    def search_root_move(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        move: Move,
+        depth: int,
+        alpha: float = -math.inf,
+        stop_event: Optional[threading.Event] = None,
+        starts_search: bool = True
+    ) -> float:
+        """
+        Busca um único movimento da raiz (usado pelos processos da busca paralela).
+
+        Se a pontuação é exata, principal_variation fica com a continuação
+        do movimento (começando por ele).
+
+        Args:
+            board: Tabuleiro da raiz (não é alterado)
+            color: Cor do jogador da raiz
+            move: Movimento a buscar
+            depth: Profundidade da busca, contando o próprio movimento
+            alpha: Limite inferior da janela na raiz
+            stop_event: Evento de cancelamento (threading ou multiprocessing)
+            starts_search: Primeiro movimento buscado de uma nova busca da
+                raiz: prepara ordenador e avaliador como find_best_move
+                (killers descartados, histórico envelhecido)
+
+        Returns:
+            Pontuação do movimento para color; exata se maior que alpha,
+            caso contrário um limite superior
+
+        Raises:
+            SearchTimeout: Se a busca foi cancelada
+        """
+        self.nodes_evaluated = 0
+        self.quiescence_nodes = 0
+        self._root_color = color
+        self._reset_pv_table()
+        self._prepare_transposition_table(color)
+        if starts_search:
+            self.move_orderer.new_search()
+            self.evaluator.new_search()
+
+        search_board = board.clone()
+        search_board.set_side_to_move(color)
+        self._attach(search_board)
+        search_board.make_move(move)
+
+        score = -self._negamax(
+            board=search_board,
+            depth=depth - 1,
+            alpha=-math.inf,
+            beta=-alpha,
+            color=color.opposite(),
+            ply=1,
+            stop_event=stop_event
+        )
+        self.principal_variation = [move] + self._pv_table[1] if score > alpha else [move]
+        return score
+
+    def _engine_config(self) -> dict:
+        """
+        Argumentos para construir um motor equivalente em outro processo.
+
+        Returns:
+            Dicionário de argumentos de MinimaxAlphaBeta
+        """
+        return {
+            'evaluator': self.evaluator,
+            'max_depth': self.max_depth,
+            'tt_max_entries': self._tt_max_entries,
+            'tt_max_bytes': self._tt_max_bytes,
+            'move_orderer': self.move_orderer,
+            'quiescence_max_ply': self.quiescence_max_ply,
+            'aspiration_window': self.aspiration_window,
+            'late_move_reductions': self.late_move_reductions,
+            'lmr_min_depth': self.lmr_min_depth,
+            'lmr_min_move_index': self.lmr_min_move_index,
+            'lmr_reduction': self.lmr_reduction,
+            'futility_pruning': self.futility_pruning,
+            'futility_margins': self.futility_margins,
+            'tablebase': self.tablebase,
+            'batch_frontier': self.batch_frontier
+        }
+
+    def shutdown(self) -> None:
+        """Encerra os processos da busca paralela, se houver."""
+        if self._parallel is not None:
+            self._parallel.shutdown()
+            self._parallel = None
+
+    def _attach(self, board: BoardState) -> None:
+        """
+        Prepara o tabuleiro da busca: avisa o avaliador e, com
+        batch_frontier, passa a manter as máscaras de peças.
+
+        Args:
+            board: Tabuleiro em que a busca vai fazer e desfazer movimentos
+        """
+        self.evaluator.attach(board)
+        if self._board_batch is not None:
+            if self._mask_tracker is not None:
+                self._mask_tracker.close()
+            self._mask_tracker = MaskTracker(board)
+
+    def _frontier_scores(
+        self,
+        board: BoardState,
+        moves: List[Move],
+        color: PlayerColor
+    ) -> List[Optional[float]]:
+        """
+        Avalia em lote os filhos de um nó de profundidade 1.
+
+        Filhos em que o adversário tem captura (e que a quiescência
+        expandiria) ou cobertos pela tabela de finais ficam sem pontuação
+        e são buscados normalmente.
+
+        Args:
+            board: Tabuleiro do nó
+            moves: Movimentos de color, na ordem em que serão buscados
+            color: Jogador que tem a vez no nó
+
+        Returns:
+            Pontuação de cada filho do ponto de vista de color, ou None
+        """
+        batch = self._board_batch.from_moves(board_masks(board, self._mask_tracker), moves, color)
+        features = batch.features()
+        scores = self.evaluator.evaluate_features(features, self._root_color)
+        if color != self._root_color:
+            scores = -scores
+
+        # O filho é avaliado do ponto de vista do adversário e o valor
+        # volta com o sinal trocado (negamax): o do pai é a própria avaliação
+        searched = features.of(color.opposite()).threats > 0 if self.quiescence_max_ply > 0 else None
+        if self.tablebase is not None:
+            pieces = features.red.men + features.red.kings + features.black.men + features.black.kings
+            covered = pieces <= self.tablebase.max_pieces
+            searched = covered if searched is None else searched | covered
+
+        if searched is None:
+            return scores.tolist()
+        return [None if skip else score for score, skip in zip(scores.tolist(), searched.tolist())]
+
+    def _probe_hash_move(self, board: BoardState) -> Optional[Move]:
+        """
+        Consulta a tabela de transposição pelo melhor movimento da raiz.
+
+        Args:
+            board: Tabuleiro da raiz
+
+        Returns:
+            Melhor movimento guardado ou None
+        """
+        if self.transposition_table is None:
+            return None
+        entry = self.transposition_table.probe(board.zobrist)
+        return entry.best_move if entry is not None else None
+
+    def _prepare_transposition_table(self, color: PlayerColor) -> None:
+        """
+        Prepara a tabela de transposição para uma nova busca.
+
+        As pontuações guardadas dependem da cor da raiz (os avaliadores não
+        são necessariamente simétricos), então a tabela é limpa quando a
+        cor muda. Entre buscas da mesma cor ela é mantida.
+
+        Args:
+            color: Cor do jogador da raiz
+        """
+        table = self.transposition_table
+        if table is None:
+            return
+
+        if self._table_color != color:
+            table.clear()
+            self._table_color = color
+        table.reset_counters()
+
+    def _evaluate(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Avalia uma folha do ponto de vista do jogador da vez.
+
+        Args:
+            board: Estado do tabuleiro
+            color: Jogador que tem a vez
+
+        Returns:
+            Avaliação da posição para color
+        """
+        score = self.evaluator.evaluate(board, self._root_color)
+        return score if color == self._root_color else -score
+
+    def _tablebase_score(
+        self,
+        entry: TablebaseEntry,
+        board: BoardState,
+        depth: int,
         color: PlayerColor
     ) -> float:
         """
-        Implementação recursiva do Minimax com poda Alpha-Beta.
+        Converte o resultado da tabela de finais em pontuação da busca.
+
+        Com distância, a pontuação segue a das vitórias encontradas na
+        busca (WIN_SCORE + profundidade restante), descontando os plies
+        até o fim do jogo: vitórias mais rápidas valem mais. Sem distância,
+        vitórias valem metade de WIN_SCORE mais a avaliação da posição,
+        para que a busca ainda faça progresso.
 
         Args:
-            board: Estado atual do tabuleiro
+            entry: Resultado da tabela para color
+            board: Estado do tabuleiro
+            depth: Profundidade restante
+            color: Jogador que tem a vez
+
+        Returns:
+            Pontuação do ponto de vista de color
+        """
+        if entry.value == TablebaseValue.DRAW:
+            return 0
+        sign = 1 if entry.value == TablebaseValue.WIN else -1
+        if entry.distance is not None:
+            return sign * (self.WIN_SCORE + depth - entry.distance)
+        return sign * self.WIN_SCORE / 2 + self._evaluate(board, color)
+
+    def _check_stop(self, stop_event: Optional[threading.Event]) -> None:
+        """
+        Interrompe a busca se o tempo acabou ou se ela foi cancelada.
+
+        Args:
+            stop_event: Evento de cancelamento da busca (ou None)
+
+        Raises:
+            SearchTimeout: Se a busca deve parar
+        """
+        if (
+            (self._deadline is not None and time.perf_counter() >= self._deadline)
+            or (stop_event is not None and stop_event.is_set())
+        ):
+            raise SearchTimeout()
+
+    def _quiescence(
+        self,
+        board: BoardState,
+        alpha: float,
+        beta: float,
+        color: PlayerColor,
+        ply: int,
+        quiescence_ply: int,
+        stop_event: Optional[threading.Event]
+    ) -> float:
+        """
+        Busca de quiescência: expande apenas capturas além do horizonte.
+
+        Como a captura é obrigatória, não há "stand pat": se o jogador da
+        vez tem captura, a posição só é avaliada depois de resolvê-la. Sem
+        capturas (ou no limite de plies), a posição é avaliada.
+
+        Args:
+            board: Estado atual do tabuleiro (alterado e restaurado no lugar)
+            alpha: Melhor valor garantido para o jogador da vez
+            beta: Melhor valor garantido para o adversário (com sinal trocado)
+            color: Cor do jogador que tem a vez
+            ply: Distância do nó até a raiz
+            quiescence_ply: Plies já buscados além do horizonte
+            stop_event: Evento de cancelamento da busca (ou None)
+
+        Returns:
+            Avaliação da posição do ponto de vista de color
+
+        Raises:
+            SearchTimeout: Se o tempo acabou ou a busca foi cancelada
+        """
+        self._pv_table[ply] = []
+
+        if quiescence_ply >= self.quiescence_max_ply:
+            return self._evaluate(board, color)
+
+        captures = MoveGenerator.get_all_capture_moves(color, board)
+        if not captures:
+            return self._evaluate(board, color)
+
+        best_score = -math.inf
+        ordered_moves = self.move_orderer.order_moves(captures, board, ply)
+
+        for move in ordered_moves:
+            self.quiescence_nodes += 1
+            if not self.quiescence_nodes & self.TIME_CHECK_MASK:
+                self._check_stop(stop_event)
+
+            undo = board.make_move(move)
+            score = -self._quiescence(
+                board, -beta, -alpha, color.opposite(), ply + 1, quiescence_ply + 1, stop_event
+            )
+            board.unmake_move(undo)
+
+            if score > best_score:
+                best_score = score
+
+            if score > alpha:
+                self._pv_table[ply] = [move] + self._pv_table[ply + 1]
+                alpha = score
+            if beta <= alpha:
+                break
+
+        return best_score
+
+    def _negamax(
+        self,
+        board: BoardState,
+        depth: int,
+        alpha: float,
+        beta: float,
+        color: PlayerColor,
+        ply: int,
+        stop_event: Optional[threading.Event]
+    ) -> float:
+        """
+        Implementação recursiva do Minimax com poda Alpha-Beta (forma negamax).
+
+        Args:
+            board: Estado atual do tabuleiro (alterado e restaurado no lugar)
             depth: Profundidade restante de busca
-            alpha: Melhor valor garantido para o maximizador
-            beta: Melhor valor garantido para o minimizador
-            maximizing: True se é turno do maximizador, False para minimizador
-            color: Cor do jogador original (maximizador)
+            alpha: Melhor valor garantido para o jogador da vez
+            beta: Melhor valor garantido para o adversário (com sinal trocado)
+            color: Cor do jogador que tem a vez
+            ply: Distância do nó até a raiz
+            stop_event: Evento de cancelamento da busca (ou None)
 
         Returns:
-            Avaliação da posição
+            Avaliação da posição do ponto de vista de color
+
+        Raises:
+            SearchTimeout: Se o tempo acabou ou a busca foi cancelada
         """
         self.nodes_evaluated += 1
 
-        # Determinar cor do jogador atual
-        current_color = color if maximizing else color.opposite()
+        # Verificar o relógio e o cancelamento periodicamente
+        if not self.nodes_evaluated & self.TIME_CHECK_MASK:
+            self._check_stop(stop_event)
 
         # Condições de parada
 
-        # 1. Profundidade zero - avaliar posição
+        self._pv_table[ply] = []
+
+        # Posição resolvida pela tabela de finais
+        if self.tablebase is not None:
+            entry = self.tablebase.probe(board, color)
+            if entry is not None:
+                self.tablebase_hits += 1
+                return self._tablebase_score(entry, board, depth, color)
+
+        # 1. Profundidade zero - avaliar posição (após resolver as capturas)
         if depth == 0:
-            return self.evaluator.evaluate(board, color)
+            return self._quiescence(board, alpha, beta, color, ply, 0, stop_event)
+
+        # Consultar tabela de transposição antes de expandir o nó
+        table = self.transposition_table
+        key = board.zobrist
+        original_alpha = alpha
+        hash_move = None
+
+        if table is not None:
+            entry = table.probe(key)
+            if entry is not None:
+                hash_move = entry.best_move
+            if entry is not None and entry.depth >= depth:
+                if entry.bound == BoundType.EXACT:
+                    return entry.score
+                if entry.bound == BoundType.LOWER:
+                    alpha = max(alpha, entry.score)
+                else:
+                    beta = min(beta, entry.score)
+                if alpha >= beta:
+                    return entry.score
+
+        # Expandir o nó: os movimentos são gerados uma única vez e o status
+        # do jogo (sem peças / sem movimentos) é derivado deles
+        valid_moves = MoveGenerator.get_all_valid_moves(color, board)
+        self.move_generations += 1
+        self.interior_nodes += 1
 
         # 2. Jogo terminou
-        if GameRules.is_game_over(board, current_color):
-            winner = GameRules.get_winner(board, current_color)
+        status = GameRules.get_status_from_moves(board, color, valid_moves)
+        if status != GameStatus.PLAYING:
+            winner = status.get_winner()
             if winner == color:
-                # Vitória para o jogador
-                return 10000 + depth  # Preferir vitórias mais rápidas
+                # Vitória para o jogador da vez
+                return self.WIN_SCORE + depth  # Preferir vitórias mais rápidas
             elif winner == color.opposite():
                 # Derrota
-                return -10000 - depth  # Evitar derrotas rápidas
+                return -self.WIN_SCORE - depth  # Evitar derrotas rápidas
             else:
                 # Empate
                 return 0
 
-        # Obter movimentos válidos
-        valid_moves = MoveGenerator.get_all_valid_moves(current_color, board)
+        best_score = -math.inf
+        best_move = None
+        ordered_moves = self.move_orderer.order_moves(valid_moves, board, ply, hash_move)
 
-        if not valid_moves:
-            # Sem movimentos, jogo terminou
-            return -10000 - depth if maximizing else 10000 + depth
-
-        if maximizing:
-            # Maximizar
-            max_eval = -math.inf
-
-            for move in valid_moves:
-                new_board = GameRules.apply_move(board, move)
-                eval_score = self._minimax(
-                    board=new_board,
-                    depth=depth - 1,
-                    alpha=alpha,
-                    beta=beta,
-                    maximizing=False,
-                    color=color
-                )
+        # Reduções e podas só se aplicam a lances quietos; como a captura é
+        # obrigatória, ou todos os movimentos do nó são capturas ou nenhum é
+        quiet_node = not valid_moves[0].is_capture
 
-                max_eval = max(max_eval, eval_score)
-                alpha = max(alpha, eval_score)
+        # Poda de futilidade: perto das folhas, se nem a avaliação estática
+        # mais a margem alcança alpha, lances quietos não vão superá-lo.
+        # Não se aplica a nós da variação principal nem perto de vitórias.
+        futility_bound = None
+        if (
+            self.futility_pruning
+            and quiet_node
+            and depth <= len(self.futility_margins)
+            and -self.WIN_SCORE < alpha < self.WIN_SCORE
+            and beta <= math.nextafter(alpha, math.inf)
+        ):
+            bound = self._evaluate(board, color) + self.futility_margins[depth - 1]
+            if bound <= alpha:
+                futility_bound = bound
 
-                # Poda Beta
-                if beta <= alpha:
-                    break
+        can_reduce = (
+            self.late_move_reductions
+            and quiet_node
+            and depth >= self.lmr_min_depth
+        )
 
-            return max_eval
+        frontier_scores = None
+        if depth == 1 and self._board_batch is not None:
+            frontier_scores = self._frontier_scores(board, ordered_moves, color)
 
-        else:
-            # Minimizar
-            min_eval = math.inf
-
-            for move in valid_moves:
-                new_board = GameRules.apply_move(board, move)
-                eval_score = self._minimax(
-                    board=new_board,
-                    depth=depth - 1,
-                    alpha=alpha,
-                    beta=beta,
-                    maximizing=True,
-                    color=color
+        for index, move in enumerate(ordered_moves):
+            if frontier_scores is not None and frontier_scores[index] is not None:
+                # Folha já avaliada no lote: o valor é exato qualquer que
+                # seja a janela, então nem é preciso aplicar o movimento
+                score = frontier_scores[index]
+                self.nodes_evaluated += 1
+                self.batched_leaves += 1
+                if not self.nodes_evaluated & self.TIME_CHECK_MASK:
+                    self._check_stop(stop_event)
+                self._pv_table[ply + 1] = []
+            else:
+                undo = board.make_move(move)
+
+                # Promoções nunca são podadas nem reduzidas
+                if futility_bound is not None and index > 0 and not undo.promoted:
+                    board.unmake_move(undo)
+                    self.futility_prunes += 1
+                    best_score = max(best_score, futility_bound)
+                    continue
+
+                reduction = 0
+                if can_reduce and index >= self.lmr_min_move_index and not undo.promoted:
+                    reduction = min(self.lmr_reduction, depth - 1)
+
+                score = self._search_child(
+                    board, depth, alpha, beta, color, ply + 1, index == 0, stop_event, reduction
                 )
+                board.unmake_move(undo)
+
+            if score > best_score:
+                best_score = score
+                best_move = move
 
-                min_eval = min(min_eval, eval_score)
-                beta = min(beta, eval_score)
+            if score > alpha:
+                self._pv_table[ply] = [move] + self._pv_table[ply + 1]
+                alpha = score
 
-                # Poda Alpha
-                if beta <= alpha:
-                    break
+            # Poda
+            if beta <= alpha:
+                self.move_orderer.record_cutoff(move, ply, depth, index)
+                break
 
-            return min_eval
+        # Guardar resultado na tabela de transposição
+        if table is not None:
+            if best_score <= original_alpha:
+                bound = BoundType.UPPER
+            elif best_score >= beta:
+                bound = BoundType.LOWER
+            else:
+                bound = BoundType.EXACT
+            table.store(key, depth, best_score, bound, best_move)
+
+        return best_score
 
     def get_statistics(self) -> dict:
         """
@@ -181,7 +1265,29 @@ class MinimaxAlphaBeta:
         Returns:
             Dicionário com estatísticas
         """
-        return {
+        statistics = {
             'nodes_evaluated': self.nodes_evaluated,
-            'max_depth': self.max_depth
-        }
\ No newline at end of file
+            'interior_nodes': self.interior_nodes,
+            'quiescence_nodes': self.quiescence_nodes,
+            'quiescence_max_ply': self.quiescence_max_ply,
+            'move_generations': self.move_generations,
+            'pvs_researches': self.pvs_researches,
+            'aspiration_fail_highs': self.aspiration_fail_highs,
+            'aspiration_fail_lows': self.aspiration_fail_lows,
+            'aspiration_researches': self.aspiration_fail_highs + self.aspiration_fail_lows,
+            'lmr_reductions': self.lmr_reductions,
+            'lmr_researches': self.lmr_researches,
+            'futility_prunes': self.futility_prunes,
+            'tablebase_hits': self.tablebase_hits,
+            'batched_leaves': self.batched_leaves,
+            'max_depth': self.max_depth,
+            'depth_reached': self.depth_reached,
+            'time_ms': self.search_time_ms,
+            'time_limit_ms': self.time_limit_ms,
+            'workers': self.workers
+        }
+        statistics.update(self.move_orderer.get_statistics())
+        statistics.update(self.evaluator.get_statistics())
+        if self.transposition_table is not None:
+            statistics.update(self.transposition_table.get_statistics())
+        return statistics
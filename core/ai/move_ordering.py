@@ -0,0 +1,270 @@
+"""Ordenação de movimentos para a poda Alpha-Beta."""
+
+from typing import Dict, List, Optional
+from ..board_state import BoardState
+from ..move import Move
+from ..enums import PlayerColor
+
+
+class MoveOrderer:
+    """
+    Estágio de ordenação de movimentos da busca.
+
+    Esta implementação base mantém a ordem do gerador de movimentos e
+    apenas conta os cortes. Subclasses sobrescrevem order_moves e
+    record_cutoff para aplicar heurísticas.
+    """
+
+    def __init__(self):
+        """Inicializa os contadores."""
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def new_search(self) -> None:
+        """Prepara o ordenador para uma nova busca."""
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+
+    def order_moves(
+        self,
+        moves: List[Move],
+        board: BoardState,
+        ply: int,
+        hash_move: Optional[Move] = None
+    ) -> List[Move]:
+        """
+        Ordena os movimentos de um nó, do mais promissor ao menos promissor.
+
+        Args:
+            moves: Movimentos válidos do nó
+            board: Estado do tabuleiro no nó
+            ply: Distância do nó até a raiz
+            hash_move: Melhor movimento conhecido (tabela de transposição ou
+                iteração anterior), se houver
+
+        Returns:
+            Lista de movimentos ordenada
+        """
+        return moves
+
+    def record_cutoff(self, move: Move, ply: int, depth: int, move_index: int) -> None:
+        """
+        Registra um movimento que causou corte beta.
+
+        Args:
+            move: Movimento que causou o corte
+            ply: Distância do nó até a raiz
+            depth: Profundidade restante no nó
+            move_index: Posição do movimento na lista ordenada
+        """
+        self.cutoffs += 1
+        if move_index == 0:
+            self.first_move_cutoffs += 1
+
+    def take_history_increments(self) -> Dict[int, int]:
+        """
+        Devolve e zera os incrementos do histórico feitos desde a última
+        chamada (usado pelos processos da busca paralela).
+
+        Returns:
+            Incrementos indexados por origem * 64 + destino (vazio na base)
+        """
+        return {}
+
+    def merge_history(self, increments: Dict[int, int]) -> None:
+        """
+        Soma ao histórico os incrementos aprendidos em outra busca.
+
+        A busca paralela usa este método para trazer ao motor principal o
+        que os processos aprenderam, de modo que a ordenação das buscas
+        seguintes leve em conta os cortes feitos nos processos.
+
+        Args:
+            increments: Incrementos indexados por origem * 64 + destino
+        """
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna estatísticas de cortes da última busca.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        return {
+            'cutoffs': self.cutoffs,
+            'first_move_cutoffs': self.first_move_cutoffs,
+            'first_move_cutoff_rate': self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+        }
+
+    def __str__(self) -> str:
+        """Representação em string do ordenador."""
+        return self.__class__.__name__
+
+
+class HeuristicMoveOrderer(MoveOrderer):
+    """
+    Ordenação por heurísticas clássicas, em ordem de prioridade:
+
+    1. Movimento da tabela de transposição / iteração anterior
+    2. Capturas, das maiores sequências para as menores (damas valem mais)
+    3. Promoções
+    4. Movimentos killer do ply (lances quietos que causaram corte em nós irmãos)
+    5. Demais movimentos pela tabela de histórico, mantida ao longo da busca
+    """
+
+    HASH_MOVE_SCORE = 1 << 30
+    CAPTURE_SCORE = 1 << 24
+    CAPTURED_PIECE_SCORE = 1 << 20
+    PROMOTION_SCORE = 1 << 19
+    KILLER_SCORES = (1 << 18, (1 << 18) - 1)
+
+    # Número de plies com killers
+    MAX_PLY = 128
+
+    def __init__(self, use_killers: bool = True, use_history: bool = True):
+        """
+        Inicializa o ordenador.
+
+        Args:
+            use_killers: Usar movimentos killer
+            use_history: Usar a tabela de histórico
+        """
+        super().__init__()
+        self.use_killers = use_killers
+        self.use_history = use_history
+        self.killers: List[List[Optional[Move]]] = [[None, None] for _ in range(self.MAX_PLY)]
+        # Histórico indexado por origem * 64 + destino
+        self.history: Dict[int, int] = {}
+        # Incrementos do histórico ainda não recolhidos por take_history_increments
+        self._history_increments: Dict[int, int] = {}
+
+    def new_search(self) -> None:
+        """
+        Prepara o ordenador para uma nova busca.
+
+        Killers são descartados; o histórico é envelhecido (valores pela
+        metade) para que buscas antigas pesem menos.
+        """
+        super().new_search()
+        self.killers = [[None, None] for _ in range(self.MAX_PLY)]
+        self.history = {key: value // 2 for key, value in self.history.items() if value > 1}
+        self._history_increments = {}
+
+    def order_moves(
+        self,
+        moves: List[Move],
+        board: BoardState,
+        ply: int,
+        hash_move: Optional[Move] = None
+    ) -> List[Move]:
+        """
+        Ordena os movimentos de um nó pelas heurísticas.
+
+        Args:
+            moves: Movimentos válidos do nó
+            board: Estado do tabuleiro no nó
+            ply: Distância do nó até a raiz
+            hash_move: Melhor movimento conhecido, se houver
+
+        Returns:
+            Lista de movimentos ordenada (empates mantêm a ordem do gerador)
+        """
+        if len(moves) < 2:
+            return moves
+
+        killers = self.killers[ply] if self.use_killers and ply < self.MAX_PLY else (None, None)
+        history = self.history if self.use_history else {}
+
+        def score(move: Move) -> int:
+            if hash_move is not None and move == hash_move:
+                return self.HASH_MOVE_SCORE
+
+            value = 0
+            if move.captured_positions:
+                value += self.CAPTURE_SCORE
+                for captured_pos in move.captured_positions:
+                    captured = board.get_piece(captured_pos)
+                    value += self.CAPTURED_PIECE_SCORE * (2 if captured is not None and captured.is_king() else 1)
+
+            if self._is_promotion(move, board):
+                value += self.PROMOTION_SCORE
+
+            if value:
+                return value
+
+            if move == killers[0]:
+                return self.KILLER_SCORES[0]
+            if move == killers[1]:
+                return self.KILLER_SCORES[1]
+
+            return history.get(move.start.index * 64 + move.end.index, 0)
+
+        return sorted(moves, key=score, reverse=True)
+
+    def record_cutoff(self, move: Move, ply: int, depth: int, move_index: int) -> None:
+        """
+        Registra um corte: atualiza killers e histórico para lances quietos.
+
+        Args:
+            move: Movimento que causou o corte
+            ply: Distância do nó até a raiz
+            depth: Profundidade restante no nó
+            move_index: Posição do movimento na lista ordenada
+        """
+        super().record_cutoff(move, ply, depth, move_index)
+
+        if move.is_capture:
+            return
+
+        if self.use_killers and ply < self.MAX_PLY:
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+
+        if self.use_history:
+            key = move.start.index * 64 + move.end.index
+            self.history[key] = self.history.get(key, 0) + depth * depth
+            self._history_increments[key] = self._history_increments.get(key, 0) + depth * depth
+
+    def take_history_increments(self) -> Dict[int, int]:
+        """
+        Devolve e zera os incrementos do histórico feitos desde a última
+        chamada (ou desde new_search).
+
+        Returns:
+            Incrementos indexados por origem * 64 + destino
+        """
+        increments = self._history_increments
+        self._history_increments = {}
+        return increments
+
+    def merge_history(self, increments: Dict[int, int]) -> None:
+        """
+        Soma ao histórico os incrementos aprendidos em outra busca.
+
+        Args:
+            increments: Incrementos indexados por origem * 64 + destino
+        """
+        if not self.use_history:
+            return
+        for key, value in increments.items():
+            self.history[key] = self.history.get(key, 0) + value
+
+    @staticmethod
+    def _is_promotion(move: Move, board: BoardState) -> bool:
+        """
+        Verifica se um movimento promove a peça a dama.
+
+        Args:
+            move: Movimento
+            board: Estado do tabuleiro antes do movimento
+
+        Returns:
+            True se uma peça normal chega à linha de promoção
+        """
+        piece = board.get_piece(move.start)
+        if piece is None or piece.is_king():
+            return False
+        promotion_row = 0 if piece.color == PlayerColor.RED else 7
+        return move.end.row == promotion_row
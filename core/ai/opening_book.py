@@ -0,0 +1,429 @@
+"""Livro de aberturas gerado por autojogo e lido por mapeamento de memória."""
+
+import argparse
+import mmap
+import random
+import struct
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from ..board_state import BoardState
+from ..position import Position
+from ..move import Move
+from ..enums import PlayerColor
+from ..move_generator import MoveGenerator
+from ..zobrist import side_key
+from ..evaluation.base_evaluator import BaseEvaluator
+from .minimax import MinimaxAlphaBeta
+
+
+# Formato do arquivo (little-endian):
+#   cabeçalho: assinatura, versão, reservado, número de registros
+#   registros: chave Zobrist, casa de origem, casa de destino, peso e
+#              pontuação em centésimos, ordenados pela chave
+# Uma posição com vários movimentos ocupa registros consecutivos.
+BOOK_MAGIC = b'CKOB'
+BOOK_VERSION = 1
+_HEADER = struct.Struct('<4sHHI')
+_RECORD = struct.Struct('<QBBHh')
+
+# Peso do melhor movimento de uma posição
+MAX_WEIGHT = 100
+
+
+@dataclass(frozen=True)
+class BookMove:
+    """
+    Movimento do livro para uma posição.
+
+    Attributes:
+        start: Posição inicial do movimento
+        end: Posição final do movimento
+        weight: Peso relativo na escolha entre os movimentos da posição
+        score: Pontuação da busca que gerou o movimento (jogador da vez)
+    """
+    start: Position
+    end: Position
+    weight: int
+    score: float
+
+    def matches(self, move: Move) -> bool:
+        """
+        Verifica se um movimento válido corresponde a este registro.
+
+        Args:
+            move: Movimento válido na posição
+
+        Returns:
+            True se origem e destino são os mesmos
+        """
+        return move.start == self.start and move.end == self.end
+
+
+def position_key(board: BoardState, color: PlayerColor) -> int:
+    """
+    Chave do livro para uma posição: hash Zobrist com color a jogar.
+
+    Args:
+        board: Estado do tabuleiro
+        color: Jogador da vez
+
+    Returns:
+        Hash de 64 bits
+    """
+    return board.zobrist ^ side_key(board.side_to_move) ^ side_key(color)
+
+
+class OpeningBook:
+    """
+    Livro de aberturas somente leitura.
+
+    O arquivo é mapeado em memória e consultado por busca binária sobre
+    as chaves ordenadas, sem carregar os registros: uma consulta custa
+    O(log n) leituras de registros de tamanho fixo.
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre um livro de aberturas.
+
+        Args:
+            path: Caminho do arquivo do livro
+
+        Raises:
+            ValueError: Se o arquivo não é um livro válido
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Livro de aberturas vazio: {path}")
+
+        if len(self._data) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Livro de aberturas inválido: {path}")
+
+        magic, version, _, count = _HEADER.unpack_from(self._data, 0)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION:
+            self.close()
+            raise ValueError(f"Livro de aberturas inválido ou de outra versão: {path}")
+        if len(self._data) != _HEADER.size + count * _RECORD.size:
+            self.close()
+            raise ValueError(f"Livro de aberturas truncado: {path}")
+
+        self._count = count
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Número de registros (movimentos) no livro."""
+        return self._count
+
+    def __enter__(self) -> 'OpeningBook':
+        """Permite usar o livro com with."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Fecha o livro ao sair do bloco with."""
+        self.close()
+
+    def close(self) -> None:
+        """Libera o mapeamento e o arquivo."""
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def _key_at(self, index: int) -> int:
+        """Chave do registro index."""
+        return struct.unpack_from('<Q', self._data, _HEADER.size + index * _RECORD.size)[0]
+
+    def probe(self, board: BoardState, color: PlayerColor) -> List[BookMove]:
+        """
+        Consulta os movimentos do livro para uma posição.
+
+        Args:
+            board: Estado do tabuleiro
+            color: Jogador da vez
+
+        Returns:
+            Movimentos do livro (lista vazia se a posição não está no livro)
+        """
+        key = position_key(board, color)
+
+        # Primeiro registro com chave >= key
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves: List[BookMove] = []
+        offset = _HEADER.size + low * _RECORD.size
+        for _ in range(low, self._count):
+            record_key, start, end, weight, score = _RECORD.unpack_from(self._data, offset)
+            if record_key != key:
+                break
+            moves.append(BookMove(
+                start=Position.at(start // 8, start % 8),
+                end=Position.at(end // 8, end % 8),
+                weight=weight,
+                score=score / 100
+            ))
+            offset += _RECORD.size
+        return moves
+
+    def choose_move(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        valid_moves: List[Move],
+        rng: Optional[random.Random] = None
+    ) -> Optional[Move]:
+        """
+        Escolhe um movimento do livro, sorteado pelos pesos.
+
+        Args:
+            board: Estado do tabuleiro
+            color: Jogador da vez
+            valid_moves: Movimentos válidos na posição
+            rng: Gerador de números aleatórios (padrão: módulo random)
+
+        Returns:
+            Movimento válido escolhido ou None se a posição não está no livro
+        """
+        candidates: List[Tuple[Move, int]] = []
+        for book_move in self.probe(board, color):
+            for move in valid_moves:
+                if book_move.matches(move):
+                    candidates.append((move, book_move.weight))
+                    break
+
+        if not candidates:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        moves, weights = zip(*candidates)
+        return (rng or random).choices(moves, weights=weights)[0]
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna estatísticas de consulta ao livro.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        probes = self.hits + self.misses
+        return {
+            'book_hits': self.hits,
+            'book_misses': self.misses,
+            'book_hit_rate': self.hits / probes if probes else 0.0,
+            'book_records': self._count
+        }
+
+    @staticmethod
+    def write(path: str, entries: Dict[int, List[BookMove]]) -> int:
+        """
+        Grava um livro de aberturas.
+
+        Args:
+            path: Caminho do arquivo
+            entries: Movimentos por chave de posição
+
+        Returns:
+            Número de registros gravados
+        """
+        records = []
+        for key in sorted(entries):
+            for book_move in sorted(entries[key], key=lambda entry: -entry.weight):
+                score = max(-32768, min(32767, round(book_move.score * 100)))
+                records.append(_RECORD.pack(
+                    key, book_move.start.index, book_move.end.index, book_move.weight, score
+                ))
+
+        with open(path, 'wb') as book_file:
+            book_file.write(_HEADER.pack(BOOK_MAGIC, BOOK_VERSION, 0, len(records)))
+            book_file.writelines(records)
+        return len(records)
+
+
+class OpeningBookBuilder:
+    """
+    Gera um livro de aberturas por autojogo do motor.
+
+    A partir da posição inicial, cada posição é analisada (multi-PV) e os
+    movimentos com pontuação até margin abaixo do melhor entram no livro,
+    com peso decrescente. As posições resultantes desses movimentos são
+    expandidas da mesma forma, ply a ply, até max_ply. Transposições são
+    analisadas uma única vez.
+    """
+
+    def __init__(
+        self,
+        evaluator: BaseEvaluator,
+        depth: int = 6,
+        max_ply: int = 10,
+        width: int = 2,
+        margin: float = 0.5
+    ):
+        """
+        Inicializa o gerador.
+
+        Args:
+            evaluator: Função de avaliação do motor
+            depth: Profundidade da análise de cada posição
+            max_ply: Número de plies cobertos pelo livro
+            width: Máximo de movimentos guardados por posição
+            margin: Diferença máxima de pontuação para o melhor movimento
+        """
+        self.engine = MinimaxAlphaBeta(evaluator, depth)
+        self.depth = depth
+        self.max_ply = max_ply
+        self.width = width
+        self.margin = margin
+
+    def build(self, verbose: bool = False) -> Dict[int, List[BookMove]]:
+        """
+        Gera os movimentos do livro.
+
+        Args:
+            verbose: Imprimir o progresso por ply
+
+        Returns:
+            Movimentos por chave de posição
+        """
+        entries: Dict[int, List[BookMove]] = {}
+        frontier = [BoardState.create_initial_state()]
+        color = PlayerColor.RED
+
+        for ply in range(self.max_ply):
+            start_time = time.perf_counter()
+            next_frontier: List[BoardState] = []
+
+            for board in frontier:
+                key = position_key(board, color)
+                if key in entries:
+                    continue
+
+                book_moves, children = self._analyze_position(board, color)
+                if book_moves:
+                    entries[key] = book_moves
+                    next_frontier.extend(children)
+
+            if verbose:
+                print(
+                    f"ply {ply + 1}: {len(frontier)} posições, {len(entries)} no livro "
+                    f"({time.perf_counter() - start_time:.1f}s)"
+                )
+
+            frontier = next_frontier
+            color = color.opposite()
+
+        return entries
+
+    def _analyze_position(
+        self,
+        board: BoardState,
+        color: PlayerColor
+    ) -> Tuple[List[BookMove], List[BoardState]]:
+        """
+        Escolhe os movimentos do livro para uma posição.
+
+        Args:
+            board: Estado do tabuleiro
+            color: Jogador da vez
+
+        Returns:
+            Tupla (movimentos do livro, posições resultantes)
+        """
+        valid_moves = MoveGenerator.get_all_valid_moves(color, board)
+        if not valid_moves:
+            return [], []
+
+        if len(valid_moves) == 1:
+            # Movimento forçado: não há o que analisar
+            scored = [(valid_moves[0], 0.0)]
+        else:
+            lines = self.engine.analyze(board, color, multipv=self.width, depth=self.depth)
+            best_score = lines[0].score
+            scored = [(line.move, line.score) for line in lines if line.score >= best_score - self.margin]
+
+        best_score = scored[0][1]
+        book_moves = []
+        children = []
+        for move, score in scored:
+            loss = best_score - score
+            weight = MAX_WEIGHT if not self.margin else round(MAX_WEIGHT * (1 - loss / (2 * self.margin)))
+            book_moves.append(BookMove(start=move.start, end=move.end, weight=max(1, weight), score=score))
+
+            child = board.clone()
+            child.make_move(move)
+            children.append(child)
+
+        return book_moves, children
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Linha de comando do livro de aberturas.
+
+    Uso:
+        python -m core.ai.opening_book build ARQUIVO [--plies N] [--depth D] ...
+        python -m core.ai.opening_book info ARQUIVO
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    from ..evaluation.fast_amp_evaluator import FastAMPEvaluator
+    from ..evaluation.piece_count_evaluator import PieceCountEvaluator
+
+    evaluators = {'amp': FastAMPEvaluator, 'piece_count': PieceCountEvaluator}
+
+    parser = argparse.ArgumentParser(prog='python -m core.ai.opening_book', description="Livro de aberturas")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', help="gera um livro por autojogo")
+    build_parser.add_argument('output', help="arquivo do livro")
+    build_parser.add_argument('--plies', type=int, default=10, help="plies cobertos (padrão: 10)")
+    build_parser.add_argument('--depth', type=int, default=6, help="profundidade da análise (padrão: 6)")
+    build_parser.add_argument('--width', type=int, default=2, help="movimentos por posição (padrão: 2)")
+    build_parser.add_argument('--margin', type=float, default=0.5, help="margem para o melhor (padrão: 0.5)")
+    build_parser.add_argument('--evaluator', choices=sorted(evaluators), default='amp')
+
+    info_parser = commands.add_parser('info', help="mostra o conteúdo de um livro")
+    info_parser.add_argument('path', help="arquivo do livro")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        builder = OpeningBookBuilder(
+            evaluators[args.evaluator](),
+            depth=args.depth,
+            max_ply=args.plies,
+            width=args.width,
+            margin=args.margin
+        )
+        entries = builder.build(verbose=True)
+        count = OpeningBook.write(args.output, entries)
+        print(f"{len(entries)} posições, {count} movimentos gravados em {args.output}")
+        return 0
+
+    with OpeningBook(args.path) as book:
+        board = BoardState.create_initial_state()
+        print(f"{len(book)} movimentos")
+        for book_move in book.probe(board, PlayerColor.RED):
+            print(f"  {book_move.start} -> {book_move.end}  peso {book_move.weight}  {book_move.score:+.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
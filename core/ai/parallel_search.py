@@ -0,0 +1,235 @@
+"""Busca paralela na raiz usando múltiplos processos."""
+
+import math
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+from typing import Dict, List, Optional, Tuple
+from ..board_state import BoardState
+from ..move import Move
+from ..enums import PlayerColor
+
+
+# Estado global de cada processo trabalhador (definido por _init_worker)
+_worker_engine = None
+_worker_bound = None
+_worker_stop = None
+_worker_search_id = None
+
+
+def _init_worker(shared_bound, shared_stop, engine_config: dict) -> None:
+    """
+    Inicializa um processo trabalhador com seu próprio motor de busca.
+
+    Args:
+        shared_bound: Valor compartilhado com a melhor pontuação exata da raiz
+        shared_stop: Evento compartilhado que cancela as buscas em andamento
+        engine_config: Argumentos para construir MinimaxAlphaBeta
+    """
+    global _worker_engine, _worker_bound, _worker_stop
+    from .minimax import MinimaxAlphaBeta
+
+    _worker_engine = MinimaxAlphaBeta(**engine_config)
+    _worker_bound = shared_bound
+    _worker_stop = shared_stop
+
+
+def _search_move_in_worker(
+    board: BoardState,
+    color: PlayerColor,
+    move: Move,
+    depth: int,
+    search_id: int
+) -> Tuple[float, bool, int, Dict[int, int], List[Move]]:
+    """
+    Busca um movimento da raiz num processo trabalhador.
+
+    A janela começa logo abaixo da melhor pontuação exata já encontrada por
+    qualquer processo, de modo que um empate ainda é devolvido como valor
+    exato e um resultado abaixo da janela é estritamente pior.
+
+    O primeiro movimento de cada busca da raiz que o processo recebe
+    prepara o motor para uma nova busca (killers descartados, histórico
+    envelhecido). Os incrementos do histórico feitos por esta busca são
+    devolvidos para que o processo principal os some ao seu próprio
+    histórico.
+
+    Args:
+        board: Tabuleiro da raiz
+        color: Cor do jogador da raiz
+        move: Movimento a buscar
+        depth: Profundidade da busca
+        search_id: Identificador da busca da raiz
+
+    Returns:
+        Tupla (pontuação, se é exata, nós avaliados, incrementos do
+        histórico, variação principal); uma busca cancelada devolve
+        (-inf, False, nós, {}, [])
+    """
+    global _worker_search_id
+    from .minimax import SearchTimeout
+
+    bound = _worker_bound.value
+    alpha = math.nextafter(bound, -math.inf) if bound > -math.inf else -math.inf
+    starts_search = search_id != _worker_search_id
+    _worker_search_id = search_id
+
+    try:
+        score = _worker_engine.search_root_move(board, color, move, depth, alpha, _worker_stop, starts_search)
+    except SearchTimeout:
+        _worker_engine.move_orderer.take_history_increments()
+        return -math.inf, False, _worker_engine.nodes_evaluated, {}, []
+    exact = score > alpha
+    history_increments = _worker_engine.move_orderer.take_history_increments()
+
+    if exact:
+        with _worker_bound.get_lock():
+            if score > _worker_bound.value:
+                _worker_bound.value = score
+
+    return score, exact, _worker_engine.nodes_evaluated, history_increments, _worker_engine.principal_variation
+
+
+class ParallelRootSearch:
+    """
+    Distribui os movimentos da raiz entre processos (ProcessPoolExecutor).
+
+    Cada processo tem seu próprio motor, tabela de transposição e
+    ordenação. Os processos compartilham a melhor pontuação exata da raiz
+    (multiprocessing.Value) e a usam como limite inferior da janela.
+
+    Vence a maior pontuação e, em caso de empate, o movimento que vem
+    primeiro na ordem da raiz, como na busca serial. O resultado não é
+    garantidamente o da busca serial: cada processo corta com a sua tabela
+    de transposição, que pode ter entradas mais profundas (de buscas
+    anteriores ou de outros movimentos da raiz) do que as que a busca serial
+    teria naquele nó, e com reduções ou podas seletivas a pontuação também
+    depende da janela. Os incrementos de histórico dos processos são somados
+    ao do motor principal, para que a ordenação das buscas seguintes leve
+    em conta os cortes feitos nos processos.
+    """
+
+    # Intervalo, em segundos, entre verificações do cancelamento
+    CANCEL_POLL_INTERVAL = 0.05
+
+    def __init__(self, workers: int, engine_config: dict):
+        """
+        Inicializa a busca paralela (os processos são criados sob demanda).
+
+        Args:
+            workers: Número de processos
+            engine_config: Argumentos para construir o motor de cada processo
+        """
+        self.workers = workers
+        self.engine_config = engine_config
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._shared_bound = None
+        self._shared_stop = None
+        self._search_id = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Cria o pool de processos na primeira utilização."""
+        if self._executor is None:
+            self._shared_bound = multiprocessing.Value('d', -math.inf)
+            self._shared_stop = multiprocessing.Event()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(self._shared_bound, self._shared_stop, self.engine_config)
+            )
+        return self._executor
+
+    def search(
+        self,
+        board: BoardState,
+        color: PlayerColor,
+        ordered_moves: List[Move],
+        depth: int,
+        stop_event: Optional[threading.Event] = None
+    ) -> Optional[Tuple[Move, float, List[Move], int, Dict[int, int]]]:
+        """
+        Busca todos os movimentos da raiz em paralelo.
+
+        Se stop_event é sinalizado, os movimentos ainda na fila são
+        descartados e as buscas em andamento nos processos são canceladas.
+
+        Args:
+            board: Tabuleiro da raiz
+            color: Cor do jogador da raiz
+            ordered_moves: Movimentos da raiz, na ordem de busca
+            depth: Profundidade da busca
+            stop_event: Evento de cancelamento da busca (ou None)
+
+        Returns:
+            Tupla (melhor movimento, pontuação, variação principal, nós
+            avaliados, incrementos do histórico somados de todos os
+            movimentos), ou None se a busca foi cancelada
+        """
+        executor = self._get_executor()
+        with self._shared_bound.get_lock():
+            self._shared_bound.value = -math.inf
+
+        self._search_id += 1
+        futures = [
+            executor.submit(_search_move_in_worker, board, color, move, depth, self._search_id)
+            for move in ordered_moves
+        ]
+
+        best_move = ordered_moves[0]
+        best_score = -math.inf
+        best_pv = [best_move]
+        nodes = 0
+        history_increments: Dict[int, int] = {}
+
+        # Percorrer na ordem da raiz: empates ficam com o primeiro movimento
+        for move, future in zip(ordered_moves, futures):
+            if not self._wait(future, stop_event):
+                self._cancel(futures)
+                return None
+            score, exact, move_nodes, move_history, pv = future.result()
+            nodes += move_nodes
+            for key, value in move_history.items():
+                history_increments[key] = history_increments.get(key, 0) + value
+            if exact and score > best_score:
+                best_score = score
+                best_move = move
+                best_pv = pv
+
+        return best_move, best_score, best_pv, nodes, history_increments
+
+    def _wait(self, future: Future, stop_event: Optional[threading.Event]) -> bool:
+        """
+        Espera um movimento terminar, verificando o cancelamento.
+
+        Returns:
+            False se a busca foi cancelada antes do fim
+        """
+        if stop_event is None:
+            future.result()
+            return True
+
+        while not stop_event.is_set():
+            try:
+                future.result(timeout=self.CANCEL_POLL_INTERVAL)
+                return True
+            except FutureTimeout:
+                pass
+        return False
+
+    def _cancel(self, futures: List[Future]) -> None:
+        """Descarta os movimentos na fila e interrompe os que estão em andamento."""
+        for future in futures:
+            future.cancel()
+        self._shared_stop.set()
+        try:
+            for future in futures:
+                if not future.cancelled():
+                    future.result()
+        finally:
+            self._shared_stop.clear()
+
+    def shutdown(self) -> None:
+        """Encerra os processos trabalhadores."""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
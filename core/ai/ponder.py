@@ -0,0 +1,235 @@
+"""Pondering: busca durante o tempo do adversário."""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+from ..board_state import BoardState
+from ..move import Move
+from ..enums import PlayerColor
+from ..move_generator import MoveGenerator
+from .minimax import MinimaxAlphaBeta
+
+
+@dataclass
+class PonderResult:
+    """
+    Resultado de uma busca feita durante o turno do adversário.
+
+    Attributes:
+        move: Melhor movimento encontrado para a posição
+        search_time_ms: Tempo gasto na busca (economizado em caso de acerto)
+        depth_reached: Profundidade alcançada
+    """
+    move: Move
+    search_time_ms: float
+    depth_reached: int
+
+
+class Ponderer:
+    """
+    Busca as respostas às jogadas mais prováveis do adversário enquanto ele pensa.
+
+    As jogadas do adversário são ordenadas pela avaliação estática da
+    posição resultante (a pior para a IA primeiro) e, para cada uma, a IA
+    busca sua resposta como faria no próprio turno. Os resultados ficam
+    guardados pelo hash Zobrist da posição.
+
+    Quando o adversário joga:
+        - se a posição foi buscada por completo, o movimento sai na hora;
+        - caso contrário, a busca em andamento é interrompida e o resultado
+          é descartado, mas o que ela gravou na tabela de transposição do
+          motor continua valendo para a busca normal.
+
+    O mesmo motor é usado pela IA no seu turno; take() e stop() esperam a
+    thread de pondering parar antes de devolver o controle. take() roda na
+    thread de busca da IA e stop() pode vir da thread da interface, por
+    isso o estado compartilhado (thread, resultados, posição) fica sob um
+    lock.
+    """
+
+    def __init__(
+        self,
+        minimax: MinimaxAlphaBeta,
+        color: PlayerColor,
+        time_limit_ms: Optional[float] = None,
+        max_replies: int = 8
+    ):
+        """
+        Inicializa o ponderer.
+
+        Args:
+            minimax: Motor de busca da IA
+            color: Cor da IA
+            time_limit_ms: Orçamento por resposta (None = profundidade fixa)
+            max_replies: Número máximo de jogadas do adversário consideradas
+        """
+        self.minimax = minimax
+        self.color = color
+        self.time_limit_ms = time_limit_ms
+        self.max_replies = max_replies
+
+        # Protege _results, _thread, _stop_event e _root_key
+        self._lock = threading.Lock()
+        self._results: Dict[int, PonderResult] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._root_key: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.positions_pondered = 0
+        self.time_saved_ms = 0.0
+
+    def is_pondering(self) -> bool:
+        """
+        Verifica se há pondering em andamento.
+
+        Returns:
+            True se a thread de pondering está rodando
+        """
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def start(self, board: BoardState) -> None:
+        """
+        Começa a pensar durante o turno do adversário.
+
+        Não faz nada se já está pensando sobre a mesma posição.
+
+        Args:
+            board: Tabuleiro com o adversário a jogar
+        """
+        with self._lock:
+            if self._root_key == board.zobrist and self._thread is not None:
+                return
+            previous = self._halt()
+
+        if previous is not None:
+            previous.join()
+
+        with self._lock:
+            self._results = {}
+            self._root_key = board.zobrist
+            self._stop_event = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(board.clone(), self._stop_event),
+                name=f"Ponderer-{self.color.value}",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Interrompe o pondering e espera a thread terminar."""
+        with self._lock:
+            thread = self._halt()
+        if thread is not None:
+            thread.join()
+
+    def take(self, board: BoardState) -> Optional[PonderResult]:
+        """
+        Interrompe o pondering e retorna o resultado para a posição real.
+
+        Args:
+            board: Tabuleiro depois da jogada do adversário (IA a jogar)
+
+        Returns:
+            Resultado guardado, ou None se a posição não foi buscada por completo
+        """
+        with self._lock:
+            thread = self._halt()
+            result = self._results.pop(board.zobrist, None)
+            self._results = {}
+
+            if result is not None:
+                self.hits += 1
+                self.time_saved_ms += result.search_time_ms
+            elif thread is not None:
+                self.misses += 1
+
+        if thread is not None:
+            thread.join()
+        return result
+
+    def _halt(self) -> Optional[threading.Thread]:
+        """
+        Sinaliza a parada da thread atual e a desassocia (com o lock).
+
+        Depois da chamada, a thread não grava mais resultados; quem chamou
+        deve esperá-la fora do lock.
+
+        Returns:
+            Thread a esperar, ou None se não havia pondering
+        """
+        self._stop_event.set()
+        thread = self._thread
+        self._thread = None
+        self._root_key = None
+        return thread
+
+    def _predict_replies(self, board: BoardState) -> List[Move]:
+        """
+        Ordena as jogadas do adversário da mais para a menos provável.
+
+        Args:
+            board: Tabuleiro com o adversário a jogar
+
+        Returns:
+            Até max_replies jogadas
+        """
+        opponent = self.color.opposite()
+        moves = MoveGenerator.get_all_valid_moves(opponent, board)
+
+        def score(move: Move) -> float:
+            undo = board.make_move(move)
+            value = self.minimax.evaluate_position(board, self.color)
+            board.unmake_move(undo)
+            return value
+
+        # O adversário deve preferir as posições piores para a IA
+        return sorted(moves, key=score)[:self.max_replies]
+
+    def _run(self, board: BoardState, stop_event: threading.Event) -> None:
+        """Corpo da thread: busca a resposta para cada jogada prevista."""
+        for reply in self._predict_replies(board):
+            if stop_event.is_set():
+                return
+
+            undo = board.make_move(reply)
+            position = board.clone()
+            board.unmake_move(undo)
+
+            start_time = time.perf_counter()
+            move = self.minimax.find_best_move(position, self.color, self.time_limit_ms, stop_event)
+            if move is None:
+                # Cancelado (ou posição sem movimentos)
+                continue
+
+            result = PonderResult(
+                move=move,
+                search_time_ms=(time.perf_counter() - start_time) * 1000,
+                depth_reached=self.minimax.depth_reached
+            )
+            with self._lock:
+                # Parado depois do fim da busca: o resultado é de outra posição
+                if stop_event.is_set():
+                    return
+                self._results[position.zobrist] = result
+                self.positions_pondered += 1
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna estatísticas de pondering.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        turns = self.hits + self.misses
+        return {
+            'ponder_hits': self.hits,
+            'ponder_misses': self.misses,
+            'ponder_hit_rate': self.hits / turns if turns else 0.0,
+            'ponder_positions': self.positions_pondered,
+            'ponder_time_saved_ms': self.time_saved_ms
+        }
@@ -0,0 +1,183 @@
+"""Tabela de transposição para a busca Minimax."""
+
+from dataclasses import dataclass
+from typing import List, Optional
+from ..move import Move
+from ..enums import BoundType
+
+
+@dataclass(slots=True)
+class TTEntry:
+    """
+    Entrada da tabela de transposição.
+
+    Attributes:
+        key: Hash Zobrist completo da posição
+        depth: Profundidade restante com que a posição foi buscada
+        score: Pontuação encontrada
+        bound: Tipo de limite da pontuação (exata, inferior ou superior)
+        best_move: Melhor movimento encontrado (ou None)
+    """
+    key: int
+    depth: int
+    score: float
+    bound: BoundType
+    best_move: Optional[Move]
+
+
+class TranspositionTable:
+    """
+    Tabela de transposição com orçamento de memória limitado.
+
+    A tabela é dividida em buckets de duas entradas:
+        - uma entrada "preferência por profundidade", substituída apenas por
+          buscas de profundidade maior ou igual (ou pela mesma posição);
+        - uma entrada "sempre substituir", que recebe todo o resto.
+
+    O índice do bucket vem dos bits baixos do hash; a chave completa é
+    guardada na entrada para detectar colisões de índice.
+    """
+
+    # Número padrão de entradas (somando as duas entradas de cada bucket)
+    DEFAULT_MAX_ENTRIES = 1 << 17
+
+    # Estimativa de memória por entrada ocupada (objeto, pontuação e ponteiro)
+    ENTRY_SIZE_BYTES = 120
+
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Inicializa a tabela.
+
+        Args:
+            max_entries: Número máximo de entradas
+            max_bytes: Orçamento aproximado de memória em bytes
+
+        Se ambos forem informados, vale o menor limite. Se nenhum for
+        informado, usa DEFAULT_MAX_ENTRIES.
+        """
+        if max_entries is None and max_bytes is None:
+            max_entries = self.DEFAULT_MAX_ENTRIES
+
+        capacity = max_entries if max_entries is not None else max_bytes // self.ENTRY_SIZE_BYTES
+        if max_bytes is not None:
+            capacity = min(capacity, max_bytes // self.ENTRY_SIZE_BYTES)
+
+        if capacity < 2:
+            raise ValueError(f"Tabela de transposição pequena demais: {capacity} entradas.")
+
+        # Número de buckets arredondado para baixo até uma potência de 2
+        bucket_count = 1 << ((capacity // 2).bit_length() - 1)
+        self._mask = bucket_count - 1
+        self._depth_slots: List[Optional[TTEntry]] = [None] * bucket_count
+        self._always_slots: List[Optional[TTEntry]] = [None] * bucket_count
+
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    @property
+    def capacity(self) -> int:
+        """Número máximo de entradas."""
+        return 2 * len(self._depth_slots)
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        """
+        Procura uma posição na tabela.
+
+        Args:
+            key: Hash Zobrist da posição
+
+        Returns:
+            Entrada encontrada ou None
+        """
+        index = key & self._mask
+
+        entry = self._depth_slots[index]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+
+        other = self._always_slots[index]
+        if other is not None and other.key == key:
+            self.hits += 1
+            return other
+
+        self.misses += 1
+        if entry is not None or other is not None:
+            # Bucket ocupado por outras posições
+            self.collisions += 1
+        return None
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        score: float,
+        bound: BoundType,
+        best_move: Optional[Move]
+    ) -> None:
+        """
+        Armazena o resultado da busca de uma posição.
+
+        Args:
+            key: Hash Zobrist da posição
+            depth: Profundidade restante da busca
+            score: Pontuação encontrada
+            bound: Tipo de limite da pontuação
+            best_move: Melhor movimento encontrado
+        """
+        self.stores += 1
+        index = key & self._mask
+        new_entry = TTEntry(key, depth, score, bound, best_move)
+
+        current = self._depth_slots[index]
+        if current is None or current.key == key or depth >= current.depth:
+            if current is not None and current.key != key:
+                self.overwrites += 1
+            self._depth_slots[index] = new_entry
+            return
+
+        if self._always_slots[index] is not None and self._always_slots[index].key != key:
+            self.overwrites += 1
+        self._always_slots[index] = new_entry
+
+    def clear(self) -> None:
+        """Remove todas as entradas da tabela."""
+        bucket_count = len(self._depth_slots)
+        self._depth_slots = [None] * bucket_count
+        self._always_slots = [None] * bucket_count
+
+    def reset_counters(self) -> None:
+        """Zera os contadores de acertos, falhas e colisões."""
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def __len__(self) -> int:
+        """Número de entradas ocupadas."""
+        return (
+            sum(1 for entry in self._depth_slots if entry is not None)
+            + sum(1 for entry in self._always_slots if entry is not None)
+        )
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna os contadores da tabela.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        probes = self.hits + self.misses
+        return {
+            'tt_hits': self.hits,
+            'tt_misses': self.misses,
+            'tt_collisions': self.collisions,
+            'tt_hit_rate': self.hits / probes if probes else 0.0,
+            'tt_stores': self.stores,
+            'tt_overwrites': self.overwrites,
+            'tt_capacity': self.capacity
+        }
@@ -1,10 +1,56 @@
 """Classe para representar o estado do tabuleiro de damas."""
 
-from typing import Dict, List, Optional
-from copy import deepcopy
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from .position import Position
 from .piece import Piece
+from .move import Move
 from .enums import PlayerColor, PieceType
+from .zobrist import piece_key, compute_hash, SIDE_TO_MOVE_KEY
+
+
+@dataclass(frozen=True)
+class MoveUndo:
+    """
+    Registro compacto para desfazer um movimento feito com make_move.
+
+    Attributes:
+        piece: Peça que se moveu, como estava antes do movimento
+        end: Posição final da peça
+        captured: Peças capturadas pelo movimento
+        promoted: Indica se a peça foi promovida a dama no movimento
+    """
+    piece: Piece
+    end: Position
+    captured: Tuple[Piece, ...]
+    promoted: bool
+
+
+class BoardObserver:
+    """
+    Recebe notificações de cada peça colocada ou retirada de um tabuleiro.
+
+    make_move e unmake_move alteram o tabuleiro apenas por set_piece e
+    remove_piece, então um observador vê toda mudança como uma sequência de
+    retiradas e colocações (um movimento retira a peça da origem e coloca a
+    nova peça, talvez promovida, no destino).
+    """
+
+    def piece_added(self, piece: Piece) -> None:
+        """
+        Chamado depois que uma peça é colocada no tabuleiro.
+
+        Args:
+            piece: Peça colocada
+        """
+
+    def piece_removed(self, piece: Piece) -> None:
+        """
+        Chamado depois que uma peça é retirada do tabuleiro.
+
+        Args:
+            piece: Peça retirada
+        """
 
 
 class BoardState:
@@ -12,11 +58,23 @@ class BoardState:
     Representa o estado atual do tabuleiro de damas.
 
     O tabuleiro é representado por um dicionário que mapeia posições para peças.
+
+    Attributes:
+        pieces: Mapeamento posição -> peça
+        side_to_move: Jogador que tem a vez (alternado por make_move)
+        zobrist: Hash Zobrist de 64 bits da posição, mantido incrementalmente
+        observers: Observadores notificados a cada peça colocada ou retirada
+            (não são copiados por clone)
     """
 
+    # Sem observadores por padrão; add_observer cria a lista da instância
+    observers: Tuple[BoardObserver, ...] = ()
+
     def __init__(self):
-        """Inicializa um tabuleiro vazio."""
+        """Inicializa um tabuleiro vazio, com vermelho a jogar."""
         self.pieces: Dict[Position, Piece] = {}
+        self.side_to_move = PlayerColor.RED
+        self.zobrist = 0
 
     @classmethod
     def create_initial_state(cls) -> 'BoardState':
@@ -35,18 +93,18 @@ class BoardState:
         # Colocar peças pretas (linhas 0-2)
         for row in range(3):
             for col in range(8):
-                pos = Position(row, col)
+                pos = Position.at(row, col)
                 if pos.is_dark_square():
                     piece = Piece(PlayerColor.BLACK, PieceType.NORMAL, pos)
-                    board.pieces[pos] = piece
+                    board.set_piece(piece)
 
         # Colocar peças vermelhas (linhas 5-7)
         for row in range(5, 8):
             for col in range(8):
-                pos = Position(row, col)
+                pos = Position.at(row, col)
                 if pos.is_dark_square():
                     piece = Piece(PlayerColor.RED, PieceType.NORMAL, pos)
-                    board.pieces[pos] = piece
+                    board.set_piece(piece)
 
         return board
 
@@ -69,7 +127,16 @@ class BoardState:
         Args:
             piece: Peça a colocar
         """
+        previous = self.pieces.get(piece.position)
+        if previous is not None:
+            self.zobrist ^= piece_key(previous)
         self.pieces[piece.position] = piece
+        self.zobrist ^= piece_key(piece)
+
+        for observer in self.observers:
+            if previous is not None:
+                observer.piece_removed(previous)
+            observer.piece_added(piece)
 
     def remove_piece(self, position: Position) -> Optional[Piece]:
         """
@@ -81,7 +148,12 @@ class BoardState:
         Returns:
             Peça removida ou None se posição vazia
         """
-        return self.pieces.pop(position, None)
+        piece = self.pieces.pop(position, None)
+        if piece is not None:
+            self.zobrist ^= piece_key(piece)
+            for observer in self.observers:
+                observer.piece_removed(piece)
+        return piece
 
     def is_empty(self, position: Position) -> bool:
         """
@@ -143,15 +215,116 @@ class BoardState:
         """
         return self.count_pieces(color) > 0
 
+    def add_observer(self, observer: BoardObserver) -> None:
+        """
+        Registra um observador das mudanças de peças.
+
+        Args:
+            observer: Observador a registrar
+        """
+        self.observers = self.observers + (observer,)
+
+    def remove_observer(self, observer: BoardObserver) -> None:
+        """
+        Remove um observador registrado (não faz nada se não estiver registrado).
+
+        Args:
+            observer: Observador a remover
+        """
+        self.observers = tuple(registered for registered in self.observers if registered is not observer)
+
+    def set_side_to_move(self, color: PlayerColor) -> None:
+        """
+        Define o jogador que tem a vez, atualizando o hash.
+
+        Args:
+            color: Jogador da vez
+        """
+        if color != self.side_to_move:
+            self.side_to_move = color
+            self.zobrist ^= SIDE_TO_MOVE_KEY
+
+    def compute_zobrist(self) -> int:
+        """
+        Recalcula o hash Zobrist do zero (para verificação).
+
+        Returns:
+            Hash de 64 bits da posição
+        """
+        return compute_hash(self, self.side_to_move)
+
+    def make_move(self, move: Move) -> MoveUndo:
+        """
+        Aplica um movimento no próprio tabuleiro (sem clonar).
+
+        Passa a vez para o adversário.
+
+        Args:
+            move: Movimento a aplicar
+
+        Returns:
+            Registro para desfazer o movimento com unmake_move
+
+        Raises:
+            ValueError: Se não há peça na posição inicial do movimento
+        """
+        piece = self.remove_piece(move.start)
+        if piece is None:
+            raise ValueError(f"Nenhuma peça na posição inicial {move.start}")
+
+        # Remover peças capturadas
+        captured = []
+        for captured_pos in move.captured_positions:
+            captured_piece = self.remove_piece(captured_pos)
+            if captured_piece is not None:
+                captured.append(captured_piece)
+
+        # Mover peça, promovendo se necessário
+        moved_piece = piece.move_to(move.end)
+        promoted = moved_piece.should_be_promoted()
+        if promoted:
+            moved_piece = moved_piece.promote_to_king()
+
+        self.set_piece(moved_piece)
+
+        # Passar a vez
+        self.side_to_move = self.side_to_move.opposite()
+        self.zobrist ^= SIDE_TO_MOVE_KEY
+
+        return MoveUndo(piece=piece, end=move.end, captured=tuple(captured), promoted=promoted)
+
+    def unmake_move(self, undo: MoveUndo) -> None:
+        """
+        Desfaz um movimento aplicado com make_move.
+
+        Movimentos devem ser desfeitos na ordem inversa em que foram feitos.
+
+        Args:
+            undo: Registro retornado por make_move
+        """
+        self.side_to_move = self.side_to_move.opposite()
+        self.zobrist ^= SIDE_TO_MOVE_KEY
+
+        self.remove_piece(undo.end)
+        for captured_piece in undo.captured:
+            self.set_piece(captured_piece)
+        self.set_piece(undo.piece)
+
     def clone(self) -> 'BoardState':
         """
-        Cria uma cópia profunda do estado do tabuleiro.
+        Cria uma cópia do estado do tabuleiro.
+
+        As peças não são copiadas: Piece nunca é alterada no lugar
+        (move_to e promote_to_king criam novas instâncias), então basta
+        copiar o dicionário.
 
         Returns:
             Nova instância de BoardState com mesmo estado
         """
         new_board = BoardState()
-        new_board.pieces = deepcopy(self.pieces)
+        new_board.pieces = dict(self.pieces)
+        new_board.side_to_move = self.side_to_move
+        new_board.zobrist = self.zobrist
         return new_board
 
     def get_all_pieces(self) -> List[Piece]:
@@ -169,7 +342,7 @@ class BoardState:
         for row in range(8):
             line = []
             for col in range(8):
-                pos = Position(row, col)
+                pos = Position.at(row, col)
                 piece = self.get_piece(pos)
                 if piece:
                     if piece.color == PlayerColor.RED:
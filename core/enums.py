@@ -131,4 +131,26 @@ class GameStatus(Enum):
             return PlayerColor.RED
         elif self == GameStatus.BLACK_WINS:
             return PlayerColor.BLACK
-        return None
\ No newline at end of file
+        return None
+
+
+class BoundType(Enum):
+    """Tipo de limite de uma pontuação armazenada na tabela de transposição."""
+    EXACT = "EXACT"  # Pontuação exata
+    LOWER = "LOWER"  # Pontuação real >= armazenada (corte beta)
+    UPPER = "UPPER"  # Pontuação real <= armazenada (nenhum movimento superou alpha)
+
+    def __str__(self) -> str:
+        """Representação em string do tipo de limite."""
+        return self.value
+
+
+class TablebaseValue(Enum):
+    """Resultado teórico de uma posição, do ponto de vista do jogador da vez."""
+    WIN = "WIN"    # Vitória forçada
+    LOSS = "LOSS"  # Derrota forçada
+    DRAW = "DRAW"  # Nenhum lado força a vitória
+
+    def __str__(self) -> str:
+        """Representação em string do resultado."""
+        return self.value
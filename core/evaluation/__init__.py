@@ -2,9 +2,15 @@
 """Funções de avaliação para IA."""
 
 from .base_evaluator import BaseEvaluator
+from .cached_evaluator import CachedEvaluator
+from .composite_evaluator import CompositeEvaluator
+from .incremental_evaluator import IncrementalEvaluator
 from .piece_count_evaluator import PieceCountEvaluator
 
 __all__ = [
     'BaseEvaluator',
+    'CachedEvaluator',
+    'CompositeEvaluator',
+    'IncrementalEvaluator',
     'PieceCountEvaluator'
 ]
\ No newline at end of file
@@ -1,115 +1,160 @@
 """Avaliador de Checkers do grupo AMP - Agda Silva, Matheus Cardoso, Pedro Carvalho"""
 
 from core.position import Position
-from .base_evaluator import BaseEvaluator
+from .incremental_evaluator import IncrementalEvaluator
+from .features import BoardFeatures
 from ..board_state import BoardState
+from ..piece import Piece
 from ..enums import PlayerColor
 
 
-class AMPEvaluator(BaseEvaluator):
+class AMPEvaluator(IncrementalEvaluator):
+    """
+    Material e peças nas bordas (termos por peça, mantidos incrementalmente),
+    mais capturas possíveis e peças prestes a promover (termos que dependem
+    das casas vizinhas, recalculados em positional_score).
+
+    Os termos são os do avaliador original, mas somados em outra ordem
+    (material e bordas por termo, depois os termos posicionais). Como 2.3,
+    3.8 e 0.35 não são exatos em ponto flutuante, a pontuação difere da
+    original nos últimos bits em boa parte das posições (diferenças de até
+    cerca de 2.5e-14), o que pode trocar o desempate entre movimentos de
+    avaliação praticamente igual.
+    """
 
     # Pesos para diferentes tipos de peças
     NORMAL_PIECE_VALUE = 2.3
     KING_PIECE_VALUE = 3.8
 
-    def evaluate(self, board: BoardState, color: PlayerColor) -> float:
+    # Bônus por peça nas colunas laterais
+    EDGE_PIECE_VALUE = 0.35
 
-        opponent_color = color.opposite()
+    uses_features = True
 
-        # Contar peças do jogador
-        player_pieces = board.get_pieces_by_color(color)
-        player_score = sum(
-            self.KING_PIECE_VALUE if piece.is_king() else self.NORMAL_PIECE_VALUE
-            for piece in player_pieces
-        )
+    def piece_value(self, piece: Piece) -> float:
+        """
+        Valor da peça pelo tipo, com bônus nas colunas laterais.
+
+        Args:
+            piece: Peça a avaliar
+
+        Returns:
+            Valor de dama ou de peça normal, mais EDGE_PIECE_VALUE nas
+            colunas 0 e 7
+        """
+        value = self.KING_PIECE_VALUE if piece.is_king() else self.NORMAL_PIECE_VALUE
+        if piece.position.col == 0 or piece.position.col == 7:
+            value += self.EDGE_PIECE_VALUE
+        return value
+
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Avalia a posição pelas características extraídas.
+
+        Os termos são os de evaluate, mas a ordem da soma difere, e a
+        pontuação pode diferir nos últimos bits.
 
-        # Contar peças do adversário
-        opponent_pieces = board.get_pieces_by_color(opponent_color)
-        opponent_score = sum(
-            self.KING_PIECE_VALUE if piece.is_king() else self.NORMAL_PIECE_VALUE
-            for piece in opponent_pieces
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação da posição (quanto maior, melhor para a cor)
+        """
+        own = features.of(color)
+        other = features.of(color.opposite())
+        return (
+            self.NORMAL_PIECE_VALUE * (own.men - other.men)
+            + self.KING_PIECE_VALUE * (own.kings - other.kings)
+            + self.EDGE_PIECE_VALUE * (own.edge_pieces - other.edge_pieces)
+            + own.threats - 2 * other.threats
+            + 1.5 * (own.near_promotion - other.near_promotion)
         )
 
-        boardStateValue = player_score - opponent_score
+    def positional_score(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Capturas possíveis e peças prestes a promover.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação a somar à dos termos por peça
+        """
+
+        boardStateValue = 0.0
 
         allpieces = board.get_all_pieces()
 
         #Verificando se podem capturar
         for piece in allpieces:
             if piece.position.row+2<=7 and piece.position.col+2<=7:
-                if piece.color == color and board.get_piece(Position(piece.position.row+1, piece.position.col+1)) != None and piece.position.row+2<=7 and piece.position.col+2<=7:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position(piece.position.row+2, piece.position.col+2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) != None and piece.position.row+2<=7 and piece.position.col+2<=7:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row+2, piece.position.col+2)) == None):
                         boardStateValue += 1
             if piece.position.row+2<=7 and piece.position.col-2>=0:
-                if piece.color == color and board.get_piece(Position(piece.position.row+1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position(piece.position.row+2, piece.position.col-2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row+2, piece.position.col-2)) == None):
                         boardStateValue += 1
             if piece.position.row-2>=0 and piece.position.col+2<=7:
-                if piece.color == color and board.get_piece(Position(piece.position.row-1, piece.position.col+1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position(piece.position.row-2, piece.position.col+2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row-2, piece.position.col+2)) == None):
                         boardStateValue += 1
             if piece.position.row-2>=0 and piece.position.col-2>=0:
-                if piece.color == color and board.get_piece(Position(piece.position.row-1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position(piece.position.row-2, piece.position.col-2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row-2, piece.position.col-2)) == None):
                         boardStateValue += 1
             
             if piece.position.row+2<=7 and piece.position.col+2<=7:
-                if piece.color == color.opposite() and board.get_piece(Position(piece.position.row+1, piece.position.col+1)) != None:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col+1)).color == color and (board.get_piece(Position(piece.position.row+2, piece.position.col+2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) != None:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)).color == color and (board.get_piece(Position.at(piece.position.row+2, piece.position.col+2)) == None):
                         boardStateValue -= 2
             if piece.position.row+2<=7 and piece.position.col-2>=0:
-                if piece.color == color.opposite() and board.get_piece(Position(piece.position.row+1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col-1)).color == color and (board.get_piece(Position(piece.position.row+2, piece.position.col-2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)).color == color and (board.get_piece(Position.at(piece.position.row+2, piece.position.col-2)) == None):
                         boardStateValue -= 2
             if piece.position.row-2>=0 and piece.position.col+2<=7:
-                if piece.color == color.opposite() and board.get_piece(Position(piece.position.row-1, piece.position.col+1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col+1)).color == color and (board.get_piece(Position(piece.position.row-2, piece.position.col+2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)).color == color and (board.get_piece(Position.at(piece.position.row-2, piece.position.col+2)) == None):
                         boardStateValue -= 2
             if piece.position.row-2>=0 and piece.position.col-2>=0:
-                if piece.color == color.opposite() and board.get_piece(Position(piece.position.row-1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col-1)).color == color and (board.get_piece(Position(piece.position.row-2, piece.position.col-2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)).color == color and (board.get_piece(Position.at(piece.position.row-2, piece.position.col-2)) == None):
                         boardStateValue -= 2
             
         
-        #Verificando se estão nas bordas
-        for piece in allpieces:
-            if piece.position.col == 0 or piece.position.col == 7:
-                if piece.color == color:
-                    boardStateValue += 0.35
-                else:
-                    boardStateValue -= 0.35
-
         #Verificando estão prestes a serem promovidas
         for piece in allpieces:
             if color == PlayerColor.RED:
                 if piece.color == PlayerColor.RED and piece.position.row == 1 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) == None:
                             boardStateValue += 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) == None:
                             boardStateValue += 1.5
                 if piece.color == PlayerColor.BLACK and piece.position.row == 6 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) == None:
                             boardStateValue -= 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) == None:
                             boardStateValue -= 1.5
             else:
                 if piece.color == PlayerColor.RED and piece.position.row == 1 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) == None:
                             boardStateValue -= 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) == None:
                             boardStateValue -= 1.5
                 if piece.color == PlayerColor.BLACK and piece.position.row == 6 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) == None:
                             boardStateValue += 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) == None:
                             boardStateValue += 1.5
 
         # Retornar resultado
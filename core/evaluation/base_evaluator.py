@@ -1,8 +1,10 @@
 """Classe base para avaliadores de posição."""
 
 from abc import ABC, abstractmethod
+from typing import Sequence
 from ..board_state import BoardState
 from ..enums import PlayerColor
+from .features import BoardFeatures
 
 
 class BaseEvaluator(ABC):
@@ -11,8 +13,16 @@ class BaseEvaluator(ABC):
 
     Todas as funções de avaliação devem herdar desta classe e implementar
     o método evaluate().
+
+    Avaliadores que dependem apenas das características de extract_features
+    também implementam evaluate_features (com uses_features = True), para
+    que CompositeEvaluator extraia as características uma vez só para
+    todos os componentes.
     """
 
+    # Indica se evaluate_features está implementado
+    uses_features = False
+
     @abstractmethod
     def evaluate(self, board: BoardState, color: PlayerColor) -> float:
         """
@@ -30,6 +40,74 @@ class BaseEvaluator(ABC):
         """
         pass
 
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Avalia a posição a partir das características já extraídas.
+
+        Deve dar o mesmo resultado que evaluate no tabuleiro de onde as
+        características vieram.
+
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação da posição (quanto maior, melhor para a cor)
+
+        Raises:
+            NotImplementedError: Se o avaliador não usa características
+        """
+        raise NotImplementedError(f"{self} não avalia por características")
+
+    def evaluate_batch(self, boards: Sequence[BoardState], color: PlayerColor) -> 'numpy.ndarray':
+        """
+        Avalia vários tabuleiros de uma vez (requer NumPy).
+
+        Avaliadores com uses_features recebem as características de todos
+        os tabuleiros extraídas por operações vetoriais (ver
+        evaluation.batch) e as combinam com as mesmas contas de
+        evaluate_features; os demais são avaliados um a um.
+
+        Args:
+            boards: Tabuleiros a avaliar
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Vetor float64 com uma pontuação por tabuleiro
+        """
+        # NumPy só é necessário para a avaliação em lote
+        import numpy as np
+        from .batch import BoardBatch
+
+        if self.uses_features:
+            features = BoardBatch.from_boards(boards).features()
+            return np.asarray(self.evaluate_features(features, color), dtype=np.float64)
+        return np.fromiter((self.evaluate(board, color) for board in boards), dtype=np.float64, count=len(boards))
+
+    def attach(self, board: BoardState) -> None:
+        """
+        Avisa que as próximas avaliações serão feitas sobre este tabuleiro.
+
+        O motor de busca chama este método com o tabuleiro em que vai fazer
+        e desfazer movimentos. Avaliadores incrementais passam a observá-lo;
+        os demais ignoram o aviso.
+
+        Args:
+            board: Tabuleiro da busca
+        """
+
+    def new_search(self) -> None:
+        """Prepara o avaliador para uma nova busca (zera contadores, se houver)."""
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna estatísticas do avaliador na última busca.
+
+        Returns:
+            Dicionário com estatísticas (vazio por padrão)
+        """
+        return {}
+
     def __str__(self) -> str:
         """Representação em string do avaliador."""
         return self.__class__.__name__
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""Codificação de vários tabuleiros em vetores NumPy para avaliação em lote."""
+
+from typing import Sequence, Tuple
+import numpy as np
+from .features import BoardFeatures, board_masks, features_from_masks
+from ..board_state import BoardState
+from ..move import Move
+from ..enums import PlayerColor
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Conta os bits de cada máscara (em int64, para permitir subtrações)."""
+    return np.bitwise_count(masks).astype(np.int64)
+
+
+class BoardBatch:
+    """
+    Vários tabuleiros codificados como máscaras 8x8 (ver evaluation.features),
+    uma posição por elemento de cada vetor uint64.
+
+    Attributes:
+        red: Máscaras das peças vermelhas
+        black: Máscaras das peças pretas
+        kings: Máscaras das damas
+    """
+
+    def __init__(self, red: np.ndarray, black: np.ndarray, kings: np.ndarray):
+        """
+        Inicializa o lote a partir dos vetores de máscaras.
+
+        Args:
+            red: Máscaras das peças vermelhas
+            black: Máscaras das peças pretas
+            kings: Máscaras das damas
+        """
+        self.red = red
+        self.black = black
+        self.kings = kings
+
+    @classmethod
+    def from_boards(cls, boards: Sequence[BoardState]) -> 'BoardBatch':
+        """
+        Codifica uma sequência de tabuleiros.
+
+        Args:
+            boards: Tabuleiros
+
+        Returns:
+            Lote com um elemento por tabuleiro
+        """
+        masks = np.array([board_masks(board) for board in boards], dtype=np.uint64).reshape(-1, 3)
+        return cls(masks[:, 0], masks[:, 1], masks[:, 2])
+
+    @classmethod
+    def from_moves(cls, masks: Tuple[int, int, int], moves: Sequence[Move], color: PlayerColor) -> 'BoardBatch':
+        """
+        Codifica as posições resultantes de cada movimento, sem aplicá-los.
+
+        As máscaras de cada filho saem das do pai: a peça sai da origem e
+        entra no destino (como dama se já era ou se chegou à última linha),
+        e as capturadas saem do tabuleiro.
+
+        Args:
+            masks: Máscaras (vermelhas, pretas, damas) do tabuleiro pai
+            moves: Movimentos de color no tabuleiro pai
+            color: Jogador que faz os movimentos
+
+        Returns:
+            Lote com um elemento por movimento
+        """
+        red, black, kings = masks
+        own, other = (red, black) if color == PlayerColor.RED else (black, red)
+        promotion_row = 0 if color == PlayerColor.RED else 7
+
+        children = []
+        for move in moves:
+            start_bit = 1 << move.start.index
+            end_bit = 1 << move.end.index
+            captured = 0
+            for position in move.captured_positions:
+                captured |= 1 << position.index
+
+            child_own = (own & ~start_bit) | end_bit
+            child_other = other & ~captured
+            child_kings = kings & ~start_bit & ~captured
+            if kings & start_bit or move.end.row == promotion_row:
+                child_kings |= end_bit
+
+            if color == PlayerColor.RED:
+                children.append((child_own, child_other, child_kings))
+            else:
+                children.append((child_other, child_own, child_kings))
+
+        encoded = np.array(children, dtype=np.uint64).reshape(-1, 3)
+        return cls(encoded[:, 0], encoded[:, 1], encoded[:, 2])
+
+    def features(self) -> BoardFeatures:
+        """
+        Extrai as características de todos os tabuleiros de uma vez.
+
+        Returns:
+            Características com um vetor int64 por campo
+        """
+        return features_from_masks(self.red, self.black, self.kings, _popcount)
+
+    def __len__(self) -> int:
+        """Número de tabuleiros do lote."""
+        return len(self.red)
@@ -0,0 +1,122 @@
+"""Cache de avaliações indexado pelo hash da posição."""
+
+from typing import List, Optional
+from .base_evaluator import BaseEvaluator
+from ..board_state import BoardState
+from ..enums import PlayerColor
+
+
+class CachedEvaluator(BaseEvaluator):
+    """
+    Guarda as avaliações de outro avaliador pelo hash Zobrist da posição.
+
+    A chave é o hash da posição mais a cor do ponto de vista. As entradas
+    ficam num vetor de tamanho fixo (potência de 2) indexado pelos bits
+    baixos da chave; cada avaliação nova substitui o que estiver no seu
+    índice. A chave completa é guardada para detectar colisões de índice.
+
+    As entradas são mantidas entre buscas (a avaliação só depende da
+    posição); os contadores de acertos são zerados a cada busca.
+    """
+
+    # Número padrão de entradas
+    DEFAULT_SIZE = 1 << 16
+
+    def __init__(self, evaluator: BaseEvaluator, size: int = DEFAULT_SIZE):
+        """
+        Inicializa o cache.
+
+        Args:
+            evaluator: Avaliador cujas pontuações são guardadas
+            size: Número de entradas (arredondado para baixo até uma potência de 2)
+
+        Raises:
+            ValueError: Se size é menor que 1
+        """
+        if size < 1:
+            raise ValueError(f"Cache de avaliações pequeno demais: {size} entradas.")
+
+        self.evaluator = evaluator
+        self.size = 1 << (size.bit_length() - 1)
+        self._mask = self.size - 1
+        self._keys: List[Optional[int]] = [None] * self.size
+        self._scores: List[float] = [0.0] * self.size
+
+        self.hits = 0
+        self.misses = 0
+
+    def evaluate(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Retorna a avaliação guardada ou avalia e guarda.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação do avaliador interno
+        """
+        key = board.zobrist << 1 | (color == PlayerColor.BLACK)
+        index = key & self._mask
+        if self._keys[index] == key:
+            self.hits += 1
+            return self._scores[index]
+
+        self.misses += 1
+        score = self.evaluator.evaluate(board, color)
+        self._keys[index] = key
+        self._scores[index] = score
+        return score
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        self._keys = [None] * self.size
+        self._scores = [0.0] * self.size
+
+    def attach(self, board: BoardState) -> None:
+        """
+        Repassa o tabuleiro da busca ao avaliador interno.
+
+        Args:
+            board: Tabuleiro da busca
+        """
+        self.evaluator.attach(board)
+
+    def new_search(self) -> None:
+        """Zera os contadores de acertos."""
+        self.hits = 0
+        self.misses = 0
+        self.evaluator.new_search()
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna estatísticas de uso do cache na última busca.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        lookups = self.hits + self.misses
+        statistics = {
+            'eval_cache_hits': self.hits,
+            'eval_cache_misses': self.misses,
+            'eval_cache_hit_rate': self.hits / lookups if lookups else 0.0,
+            'eval_cache_size': self.size
+        }
+        statistics.update(self.evaluator.get_statistics())
+        return statistics
+
+    def __getstate__(self) -> dict:
+        """Estado para pickle, com o cache vazio."""
+        state = self.__dict__.copy()
+        state['_keys'] = None
+        state['_scores'] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restaura o estado de pickle, recriando o cache vazio."""
+        self.__dict__.update(state)
+        self.clear()
+
+    def __str__(self) -> str:
+        """Representação em string do avaliador."""
+        return f"{self.__class__.__name__}({self.evaluator})"
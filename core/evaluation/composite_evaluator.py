@@ -0,0 +1,138 @@
+"""Avaliador que combina outros avaliadores com pesos."""
+
+from typing import List, Optional, Sequence, Tuple
+from .base_evaluator import BaseEvaluator
+from .features import BoardFeatures, MaskTracker, extract_features
+from ..board_state import BoardState
+from ..bitboard_state import BitboardState
+from ..enums import PlayerColor
+
+
+class CompositeEvaluator(BaseEvaluator):
+    """
+    Soma ponderada das avaliações de vários componentes.
+
+    As características do tabuleiro (material, damas, peças nas laterais,
+    peças prestes a promover e ameaças) são extraídas uma única vez por
+    avaliação e repassadas a todos os componentes que implementam
+    evaluate_features; os demais são avaliados normalmente, cada um com
+    sua própria varredura. Se todos os componentes usam características,
+    o próprio composto também as usa (e pode ser avaliado em lote).
+
+    Exemplo:
+        CompositeEvaluator([
+            (PieceCountEvaluator(), 1.0),
+            (PieceOnSidesEvaluator(), 0.5),
+            (PiecesThreatenedEvaluator(), 2.0),
+        ])
+    """
+
+    def __init__(self, components: Sequence[Tuple[BaseEvaluator, float]]):
+        """
+        Inicializa o avaliador composto.
+
+        Args:
+            components: Pares (avaliador, peso)
+
+        Raises:
+            ValueError: Se não há componentes
+        """
+        if not components:
+            raise ValueError("CompositeEvaluator precisa de pelo menos um componente.")
+
+        self.components: List[Tuple[BaseEvaluator, float]] = list(components)
+        self._feature_components = [
+            (evaluator, weight) for evaluator, weight in self.components if evaluator.uses_features
+        ]
+        self._board_components = [
+            (evaluator, weight) for evaluator, weight in self.components if not evaluator.uses_features
+        ]
+        self._tracker: Optional[MaskTracker] = None
+        self.uses_features = not self._board_components
+
+    def evaluate(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Avalia a posição somando os componentes ponderados.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Soma ponderada das avaliações dos componentes
+        """
+        score = 0.0
+        if self._feature_components:
+            features = extract_features(board, self._tracker)
+            for evaluator, weight in self._feature_components:
+                score += weight * evaluator.evaluate_features(features, color)
+        for evaluator, weight in self._board_components:
+            score += weight * evaluator.evaluate(board, color)
+        return score
+
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Soma ponderada das avaliações dos componentes por características.
+
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Soma ponderada das avaliações dos componentes
+
+        Raises:
+            NotImplementedError: Se algum componente não usa características
+        """
+        if self._board_components:
+            raise NotImplementedError(f"{self} tem componentes que não avaliam por características")
+
+        score = 0.0
+        for evaluator, weight in self._feature_components:
+            score += weight * evaluator.evaluate_features(features, color)
+        return score
+
+    def attach(self, board: BoardState) -> None:
+        """
+        Mantém as máscaras de peças do tabuleiro da busca e repassa o aviso
+        aos componentes que avaliam o tabuleiro diretamente.
+
+        Args:
+            board: Tabuleiro da busca
+        """
+        if self._tracker is not None:
+            self._tracker.close()
+            self._tracker = None
+        if self._feature_components and not isinstance(board, BitboardState):
+            self._tracker = MaskTracker(board)
+
+        for evaluator, _ in self._board_components:
+            evaluator.attach(board)
+
+    def new_search(self) -> None:
+        """Repassa o aviso de nova busca aos componentes."""
+        for evaluator, _ in self.components:
+            evaluator.new_search()
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna as estatísticas dos componentes.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        statistics = {}
+        for evaluator, _ in self.components:
+            statistics.update(evaluator.get_statistics())
+        return statistics
+
+    def __getstate__(self) -> dict:
+        """Estado para pickle, sem o tabuleiro observado."""
+        state = self.__dict__.copy()
+        state['_tracker'] = None
+        return state
+
+    def __str__(self) -> str:
+        """Representação em string do avaliador."""
+        terms = ' + '.join(f"{weight:g}*{evaluator}" for evaluator, weight in self.components)
+        return f"{self.__class__.__name__}({terms})"
@@ -0,0 +1,84 @@
+"""Versão com máscaras de bits do avaliador AMP."""
+
+from typing import Optional
+from .amp_evaluator import AMPEvaluator
+from .features import MaskTracker, extract_features
+from ..board_state import BoardState
+from ..bitboard_state import BitboardState
+from ..enums import PlayerColor
+
+
+class FastAMPEvaluator(AMPEvaluator):
+    """
+    AMPEvaluator com os termos de vizinhança calculados por máscaras de bits.
+
+    Produz exatamente as mesmas pontuações que AMPEvaluator (os termos por
+    peça são herdados; os de vizinhança são inteiros ou múltiplos de 0.5,
+    exatos em ponto flutuante). Em relação ao avaliador AMP original, que
+    somava peça a peça, vale o mesmo que para AMPEvaluator: a pontuação pode
+    diferir nos últimos bits (até cerca de 2.5e-14). Em vez de consultar as
+    casas vizinhas de cada peça, ameaças e peças prestes a promover vêm de
+    extract_features, que conta cada termo para o tabuleiro inteiro de uma
+    vez.
+
+    As máscaras vêm direto de BitboardState; de outros tabuleiros são
+    montadas peça a peça, exceto do tabuleiro observado (attach), cujas
+    máscaras são mantidas a cada peça colocada ou retirada.
+
+    A conferência contra AMPEvaluator (igualdade exata) e contra o original
+    (tolerância de 1e-12) está em tests/test_amp_parity.py; a medição do
+    ganho, em benchmarks/amp_parity.py.
+    """
+
+    def __init__(self, verify: bool = False):
+        """
+        Inicializa o avaliador.
+
+        Args:
+            verify: Confere as contagens incrementais a cada avaliação
+        """
+        super().__init__(verify)
+        self._tracker: Optional[MaskTracker] = None
+
+    def attach(self, board: BoardState) -> None:
+        """
+        Passa a manter as contagens de termos e as máscaras de um tabuleiro.
+
+        Args:
+            board: Tabuleiro a observar
+        """
+        super().attach(board)
+        if not isinstance(board, BitboardState):
+            self._tracker = MaskTracker(board)
+
+    def detach(self) -> None:
+        """Deixa de observar o tabuleiro atual, se houver."""
+        super().detach()
+        if self._tracker is not None:
+            self._tracker.close()
+            self._tracker = None
+
+    def __getstate__(self) -> dict:
+        """Estado para pickle, sem o tabuleiro observado."""
+        state = super().__getstate__()
+        state['_tracker'] = None
+        return state
+
+    def positional_score(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Capturas possíveis e peças prestes a promover, por máscaras de bits.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação dos termos de vizinhança
+        """
+        features = extract_features(board, self._tracker)
+        own = features.of(color)
+        other = features.of(color.opposite())
+
+        # Capturas possíveis: +1 para as do jogador, -2 para as do adversário;
+        # casas de promoção livres: 1.5 cada
+        return own.threats - 2 * other.threats + 1.5 * (own.near_promotion - other.near_promotion)
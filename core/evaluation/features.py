@@ -0,0 +1,289 @@
+"""Extração das características do tabuleiro compartilhadas pelos avaliadores."""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+from ..board_state import BoardObserver, BoardState
+from ..bitboard_state import BitboardState
+from ..piece import Piece
+from ..enums import PlayerColor
+
+
+# As máscaras usam uma casa por bit na numeração do tabuleiro 8x8
+# (Position.index = row * 8 + col), de modo que cada direção diagonal é um
+# deslocamento fixo: +9 e +7 descem uma linha, -7 e -9 sobem uma linha
+_BOARD_MASK = (1 << 64) - 1
+_DIRECTIONS = (9, 7, -7, -9)
+
+
+def _squares_where(condition) -> int:
+    """Máscara das casas (row, col) que satisfazem condition."""
+    mask = 0
+    for row in range(8):
+        for col in range(8):
+            if condition(row, col):
+                mask |= 1 << (row * 8 + col)
+    return mask
+
+
+def _shift_back(mask: int, shift: int) -> int:
+    """Traz para cada casa s o bit da casa s + shift."""
+    return mask >> shift if shift > 0 else (mask << -shift) & _BOARD_MASK
+
+
+# Casas de onde o salto (duas casas) na direção cabe no tabuleiro
+_JUMP_FROM: Tuple[Tuple[int, int], ...] = tuple(
+    (shift, _squares_where(
+        lambda row, col, shift=shift: 0 <= row + 2 * (1 if shift > 0 else -1) <= 7
+        and 0 <= col + 2 * (1 if shift in (9, -7) else -1) <= 7
+    ))
+    for shift in _DIRECTIONS
+)
+
+# Colunas laterais
+_EDGE_MASK = _squares_where(lambda row, col: col == 0 or col == 7)
+
+# Peças a um passo da promoção, com a casa diagonal à esquerda/direita no tabuleiro
+_ROW_1_LEFT = _squares_where(lambda row, col: row == 1 and col >= 1)
+_ROW_1_RIGHT = _squares_where(lambda row, col: row == 1 and col <= 6)
+_ROW_6_LEFT = _squares_where(lambda row, col: row == 6 and col >= 1)
+_ROW_6_RIGHT = _squares_where(lambda row, col: row == 6 and col <= 6)
+
+
+def _build_expansion() -> List[Tuple[int, ...]]:
+    """
+    Tabelas que convertem cada byte das máscaras de BitboardState
+    (32 casas escuras, duas linhas por byte) para a numeração 8x8.
+    """
+    tables = []
+    for byte_index in range(4):
+        table = []
+        for byte in range(256):
+            mask = 0
+            for bit in range(8):
+                if byte & (1 << bit):
+                    square = byte_index * 8 + bit
+                    row = square // 4
+                    col = (square % 4) * 2 + (1 if row % 2 == 0 else 0)
+                    mask |= 1 << (row * 8 + col)
+            table.append(mask)
+        tables.append(tuple(table))
+    return tables
+
+
+_EXPANSION = _build_expansion()
+
+
+def _expand(mask32: int) -> int:
+    """Converte uma máscara de 32 casas escuras para a numeração 8x8."""
+    return (
+        _EXPANSION[0][mask32 & 0xFF]
+        | _EXPANSION[1][(mask32 >> 8) & 0xFF]
+        | _EXPANSION[2][(mask32 >> 16) & 0xFF]
+        | _EXPANSION[3][mask32 >> 24]
+    )
+
+
+class MaskTracker(BoardObserver):
+    """
+    Observador que mantém as máscaras 8x8 das peças de um tabuleiro.
+
+    Attributes:
+        board: Tabuleiro observado
+        red: Peças vermelhas
+        black: Peças pretas
+        kings: Damas de qualquer cor
+    """
+
+    def __init__(self, board: BoardState):
+        """
+        Calcula as máscaras iniciais e passa a observar o tabuleiro.
+
+        Args:
+            board: Tabuleiro a observar
+        """
+        self.board = board
+        self.red = self.black = self.kings = 0
+        for piece in board.get_all_pieces():
+            self.piece_added(piece)
+        board.add_observer(self)
+
+    def piece_added(self, piece: Piece) -> None:
+        """
+        Marca a casa da peça colocada nas máscaras da sua cor e tipo.
+
+        Args:
+            piece: Peça colocada
+        """
+        bit = 1 << piece.position.index
+        if piece.color == PlayerColor.RED:
+            self.red |= bit
+        else:
+            self.black |= bit
+        if piece.is_king():
+            self.kings |= bit
+
+    def piece_removed(self, piece: Piece) -> None:
+        """
+        Limpa a casa da peça retirada em todas as máscaras.
+
+        Args:
+            piece: Peça retirada
+        """
+        mask = ~(1 << piece.position.index)
+        self.red &= mask
+        self.black &= mask
+        self.kings &= mask
+
+    def close(self) -> None:
+        """Deixa de observar o tabuleiro."""
+        self.board.remove_observer(self)
+
+
+def board_masks(board: BoardState, tracker: Optional[MaskTracker] = None) -> Tuple[int, int, int]:
+    """
+    Máscaras 8x8 das peças vermelhas, das pretas e das damas.
+
+    Args:
+        board: Tabuleiro
+        tracker: Observador do tabuleiro, usado se for deste tabuleiro
+
+    Returns:
+        (vermelhas, pretas, damas)
+    """
+    if isinstance(board, BitboardState):
+        return _expand(board.red_mask), _expand(board.black_mask), _expand(board.kings_mask)
+
+    if tracker is not None and tracker.board is board:
+        return tracker.red, tracker.black, tracker.kings
+
+    red = black = kings = 0
+    for piece in board.get_all_pieces():
+        bit = 1 << piece.position.index
+        if piece.color == PlayerColor.RED:
+            red |= bit
+        else:
+            black |= bit
+        if piece.is_king():
+            kings |= bit
+    return red, black, kings
+
+
+@dataclass
+class ColorFeatures:
+    """
+    Características das peças de uma cor.
+
+    Na extração em lote (evaluation.batch), cada campo é um vetor NumPy
+    com um valor por tabuleiro.
+
+    Attributes:
+        men: Peças normais
+        kings: Damas
+        edge_pieces: Peças nas colunas laterais (0 e 7)
+        near_promotion: Casas de promoção livres ao alcance de peças normais
+            na penúltima linha (uma peça pode contar duas vezes)
+        threats: Capturas possíveis, por peça e direção (peça adversária na
+            diagonal com a casa seguinte vazia)
+    """
+    men: int
+    kings: int
+    edge_pieces: int
+    near_promotion: int
+    threats: int
+
+
+@dataclass
+class BoardFeatures:
+    """
+    Características do tabuleiro para as duas cores.
+
+    Attributes:
+        red: Características das peças vermelhas
+        black: Características das peças pretas
+    """
+    red: ColorFeatures
+    black: ColorFeatures
+
+    def of(self, color: PlayerColor) -> ColorFeatures:
+        """
+        Retorna as características de uma cor.
+
+        Args:
+            color: Cor das peças
+
+        Returns:
+            Características da cor
+        """
+        return self.red if color == PlayerColor.RED else self.black
+
+
+def extract_features(board: BoardState, tracker: Optional[MaskTracker] = None) -> BoardFeatures:
+    """
+    Extrai todas as características do tabuleiro de uma vez.
+
+    Cada característica é contada para o tabuleiro inteiro com operações
+    sobre as máscaras de peças. Nas ameaças, deslocar a máscara do
+    adversário e a das casas vazias leva a casa do meio e a de chegada de
+    cada salto para a casa de origem; um AND com as peças da cor marca
+    todas as capturas numa direção.
+
+    Args:
+        board: Tabuleiro
+        tracker: Observador do tabuleiro, usado se for deste tabuleiro
+
+    Returns:
+        Características das duas cores
+    """
+    red, black, kings = board_masks(board, tracker)
+    return features_from_masks(red, black, kings)
+
+
+def features_from_masks(red, black, kings, popcount: Callable = int.bit_count) -> BoardFeatures:
+    """
+    Calcula as características a partir das máscaras 8x8 das peças.
+
+    Só usa operações de bits, então também funciona com vetores NumPy de
+    máscaras (uma por tabuleiro), passando uma contagem de bits vetorial.
+
+    Args:
+        red: Máscara das peças vermelhas
+        black: Máscara das peças pretas
+        kings: Máscara das damas
+        popcount: Função que conta os bits de uma máscara
+
+    Returns:
+        Características das duas cores
+    """
+    empty = ~(red | black) & _BOARD_MASK
+    red_men = red & ~kings
+    black_men = black & ~kings
+
+    red_threats = 0
+    black_threats = 0
+    for shift, jump_from in _JUMP_FROM:
+        landing = _shift_back(empty, 2 * shift) & jump_from
+        red_threats += popcount(red & _shift_back(black, shift) & landing)
+        black_threats += popcount(black & _shift_back(red, shift) & landing)
+
+    return BoardFeatures(
+        red=ColorFeatures(
+            men=popcount(red_men),
+            kings=popcount(red & kings),
+            edge_pieces=popcount(red & _EDGE_MASK),
+            near_promotion=(
+                popcount(red_men & _ROW_1_LEFT & _shift_back(empty, -9))
+                + popcount(red_men & _ROW_1_RIGHT & _shift_back(empty, -7))
+            ),
+            threats=red_threats
+        ),
+        black=ColorFeatures(
+            men=popcount(black_men),
+            kings=popcount(black & kings),
+            edge_pieces=popcount(black & _EDGE_MASK),
+            near_promotion=(
+                popcount(black_men & _ROW_6_LEFT & _shift_back(empty, 7))
+                + popcount(black_men & _ROW_6_RIGHT & _shift_back(empty, 9))
+            ),
+            threats=black_threats
+        )
+    )
@@ -0,0 +1,204 @@
+"""Avaliação incremental: termos por peça mantidos durante make/unmake."""
+
+from abc import abstractmethod
+from typing import Dict, List, Optional, Tuple
+from .base_evaluator import BaseEvaluator
+from ..board_state import BoardObserver, BoardState
+from ..piece import Piece
+from ..position import Position
+from ..enums import PlayerColor, PieceType
+
+
+class _TermCounter(BoardObserver):
+    """
+    Observador que mantém, por cor, quantas peças caem em cada termo.
+
+    Attributes:
+        board: Tabuleiro observado
+        counts: Cor -> contagem de peças por termo
+    """
+
+    def __init__(self, evaluator: 'IncrementalEvaluator', board: BoardState):
+        """
+        Conta as peças do tabuleiro por termo.
+
+        Args:
+            evaluator: Avaliador dono dos termos
+            board: Tabuleiro a observar
+        """
+        self.board = board
+        self._slots = evaluator._slots
+        self.counts = evaluator._count_terms(board)
+
+    def piece_added(self, piece: Piece) -> None:
+        """
+        Soma a peça colocada à contagem do seu termo.
+
+        Args:
+            piece: Peça colocada
+        """
+        self.counts[piece.color][self._slots[piece.color, piece.piece_type][piece.position.index]] += 1
+
+    def piece_removed(self, piece: Piece) -> None:
+        """
+        Subtrai a peça retirada da contagem do seu termo.
+
+        Args:
+            piece: Peça retirada
+        """
+        self.counts[piece.color][self._slots[piece.color, piece.piece_type][piece.position.index]] -= 1
+
+
+class IncrementalEvaluator(BaseEvaluator):
+    """
+    Avaliador cuja parte principal é uma soma de termos por peça.
+
+    Subclasses declaram em piece_value quanto cada peça vale para o seu
+    dono, conforme cor, tipo e casa. A avaliação é a soma dos valores das
+    peças do jogador menos a das peças do adversário, mais o que
+    positional_score acrescentar (termos que dependem das vizinhas e não
+    podem ser mantidos peça a peça).
+
+    Os valores são tabelados na construção e agrupados em termos (valores
+    distintos). Com attach, o avaliador passa a observar o tabuleiro e
+    mantém a contagem de peças por termo a cada peça colocada ou retirada;
+    a avaliação desse tabuleiro lê as contagens em vez de percorrer as
+    peças. Como a pontuação sai das contagens, ela depende só da posição e
+    não da ordem das atualizações. Outros tabuleiros são avaliados
+    contando as peças do zero.
+
+    A soma é feita termo a termo (valor * diferença de contagens), não peça
+    a peça. Com pesos que não são exatos em ponto flutuante, a pontuação
+    pode diferir nos últimos bits da de uma soma peça a peça.
+
+    Com verify=True, cada avaliação do tabuleiro observado também recalcula
+    as contagens do zero e levanta AssertionError se divergirem.
+    """
+
+    def __init__(self, verify: bool = False):
+        """
+        Inicializa o avaliador, tabelando piece_value para todas as casas.
+
+        Args:
+            verify: Confere as contagens incrementais a cada avaliação
+        """
+        self.verify = verify
+
+        values: List[float] = []
+        self._slots: Dict[Tuple[PlayerColor, PieceType], Tuple[int, ...]] = {}
+        for color in PlayerColor:
+            for piece_type in PieceType:
+                slots = []
+                for index in range(64):
+                    position = Position.at(index // 8, index % 8)
+                    if not position.is_dark_square():
+                        slots.append(0)
+                        continue
+                    value = self.piece_value(Piece(color, piece_type, position))
+                    if value not in values:
+                        values.append(value)
+                    slots.append(values.index(value))
+                self._slots[color, piece_type] = tuple(slots)
+        self._values: Tuple[float, ...] = tuple(values)
+        self._counter: Optional[_TermCounter] = None
+
+    @abstractmethod
+    def piece_value(self, piece: Piece) -> float:
+        """
+        Valor de uma peça para o seu dono.
+
+        Deve depender apenas da cor, do tipo e da posição da peça.
+
+        Args:
+            piece: Peça a avaliar
+
+        Returns:
+            Contribuição da peça
+        """
+        pass
+
+    def positional_score(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Termos não incrementais da avaliação (nenhum por padrão).
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação a somar à dos termos por peça
+        """
+        return 0.0
+
+    def attach(self, board: BoardState) -> None:
+        """
+        Passa a manter as contagens de termos de um tabuleiro.
+
+        Deixa de observar o tabuleiro anterior, se houver.
+
+        Args:
+            board: Tabuleiro a observar
+        """
+        self.detach()
+        self._counter = _TermCounter(self, board)
+        board.add_observer(self._counter)
+
+    def detach(self) -> None:
+        """Deixa de observar o tabuleiro atual, se houver."""
+        if self._counter is not None:
+            self._counter.board.remove_observer(self._counter)
+            self._counter = None
+
+    def evaluate(self, board: BoardState, color: PlayerColor) -> float:
+        """
+        Avalia a posição pelos termos por peça mais positional_score.
+
+        Args:
+            board: Estado atual do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Pontuação da posição (quanto maior, melhor para a cor)
+
+        Raises:
+            AssertionError: Com verify, se as contagens incrementais divergirem
+        """
+        counter = self._counter
+        if counter is not None and counter.board is board:
+            counts = counter.counts
+            if self.verify:
+                expected = self._count_terms(board)
+                if counts != expected:
+                    raise AssertionError(
+                        f"{self}: contagens incrementais {counts} diferem das recalculadas {expected}"
+                    )
+        else:
+            counts = self._count_terms(board)
+
+        own = counts[color]
+        other = counts[color.opposite()]
+        score = 0.0
+        for value, own_count, other_count in zip(self._values, own, other):
+            score += value * (own_count - other_count)
+        return score + self.positional_score(board, color)
+
+    def _count_terms(self, board: BoardState) -> Dict[PlayerColor, List[int]]:
+        """
+        Conta do zero as peças de cada cor por termo.
+
+        Args:
+            board: Tabuleiro a contar
+
+        Returns:
+            Cor -> contagem de peças por termo
+        """
+        counts = {color: [0] * len(self._values) for color in PlayerColor}
+        for piece in board.get_all_pieces():
+            counts[piece.color][self._slots[piece.color, piece.piece_type][piece.position.index]] += 1
+        return counts
+
+    def __getstate__(self) -> dict:
+        """Estado para pickle, sem o tabuleiro observado."""
+        state = self.__dict__.copy()
+        state['_counter'] = None
+        return state
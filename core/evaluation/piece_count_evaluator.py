@@ -1,11 +1,12 @@
 """Avaliador simples baseado em contagem de peças."""
 
-from .base_evaluator import BaseEvaluator
-from ..board_state import BoardState
-from ..enums import PlayerColor, PieceType
+from .incremental_evaluator import IncrementalEvaluator
+from .features import BoardFeatures
+from ..piece import Piece
+from ..enums import PlayerColor
 
 
-class PieceCountEvaluator(BaseEvaluator):
+class PieceCountEvaluator(IncrementalEvaluator):
     """
     Avaliador que conta peças.
 
@@ -13,39 +14,42 @@ class PieceCountEvaluator(BaseEvaluator):
     Damas valem 3 pontos.
 
     A pontuação final é a diferença entre as peças do jogador
-    e as peças do adversário.
+    e as peças do adversário, mantida incrementalmente no tabuleiro
+    da busca.
     """
 
     # Pesos para diferentes tipos de peças
     NORMAL_PIECE_VALUE = 2.0
     KING_PIECE_VALUE = 4.0
 
-    def evaluate(self, board: BoardState, color: PlayerColor) -> float:
+    uses_features = True
+
+    def piece_value(self, piece: Piece) -> float:
         """
-        Avalia a posição contando peças.
+        Valor da peça pelo tipo.
 
         Args:
-            board: Estado atual do tabuleiro
-            color: Cor do jogador a avaliar
+            piece: Peça a avaliar
 
         Returns:
-            Diferença de pontos (peças do jogador - peças do adversário)
+            Valor de dama ou de peça normal
         """
-        opponent_color = color.opposite()
+        return self.KING_PIECE_VALUE if piece.is_king() else self.NORMAL_PIECE_VALUE
 
-        # Contar peças do jogador
-        player_pieces = board.get_pieces_by_color(color)
-        player_score = sum(
-            self.KING_PIECE_VALUE if piece.is_king() else self.NORMAL_PIECE_VALUE
-            for piece in player_pieces
-        )
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Avalia a posição pelas contagens de peças normais e damas.
 
-        # Contar peças do adversário
-        opponent_pieces = board.get_pieces_by_color(opponent_color)
-        opponent_score = sum(
-            self.KING_PIECE_VALUE if piece.is_king() else self.NORMAL_PIECE_VALUE
-            for piece in opponent_pieces
-        )
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
 
-        # Retornar diferença
-        return player_score - opponent_score
\ No newline at end of file
+        Returns:
+            Diferença de pontos (peças do jogador - peças do adversário)
+        """
+        own = features.of(color)
+        other = features.of(color.opposite())
+        return (
+            self.NORMAL_PIECE_VALUE * (own.men - other.men)
+            + self.KING_PIECE_VALUE * (own.kings - other.kings)
+        )
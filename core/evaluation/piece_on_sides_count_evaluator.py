@@ -1,37 +1,47 @@
 """Avaliador simples baseado em contagem de peças nas laterais."""
 
-from .base_evaluator import BaseEvaluator
-from ..board_state import BoardState
+from .incremental_evaluator import IncrementalEvaluator
+from .features import BoardFeatures
+from ..piece import Piece
 from ..enums import PlayerColor
 
 
-class PieceOnSidesEvaluator(BaseEvaluator):
+class PieceOnSidesEvaluator(IncrementalEvaluator):
     """
     Avaliador que conta peças nas colunas laterais do tabuleiro (0 e 7).
+
+    A pontuação é a diferença entre as peças do jogador e as do adversário
+    nas laterais, mantida incrementalmente no tabuleiro da busca.
     """
 
-    def evaluate(self, board: BoardState, color: PlayerColor) -> float:
+    # Valor de cada peça nas laterais
+    SIDE_PIECE_VALUE = 0.3
+
+    uses_features = True
+
+    def piece_value(self, piece: Piece) -> float:
         """
-        Avalia a posição das peças nas laterais.
+        Valor da peça pela coluna.
 
         Args:
-            board: Estado atual do tabuleiro
-            color: Cor do jogador a avaliar
+            piece: Peça a avaliar
 
         Returns:
-            Diferença de pontos (peças do jogador nas laterais - peças do adversário nas laterais)
+            SIDE_PIECE_VALUE nas colunas 0 e 7, zero nas demais
         """
+        if piece.position.col == 0 or piece.position.col == 7:
+            return self.SIDE_PIECE_VALUE
+        return 0.0
 
-        allpieces = board.get_all_pieces()
-
-        boardStateValue = 0.0
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Avalia a posição pelas contagens de peças nas laterais.
 
-        for piece in allpieces:
-            if piece.position.col == 0 or piece.position.col == 7:
-                if piece.color == color:
-                    boardStateValue += 0.3
-                else:
-                    boardStateValue -= 0.3
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
 
-        # Retornar diferença
-        return boardStateValue
\ No newline at end of file
+        Returns:
+            Diferença de pontos (peças do jogador nas laterais - peças do adversário nas laterais)
+        """
+        return self.SIDE_PIECE_VALUE * (features.of(color).edge_pieces - features.of(color.opposite()).edge_pieces)
@@ -2,6 +2,7 @@
 
 from core.position import Position
 from .base_evaluator import BaseEvaluator
+from .features import BoardFeatures
 from ..board_state import BoardState
 from ..enums import PlayerColor
 
@@ -11,6 +12,8 @@ class PieceAboutToPromoteEvaluator(BaseEvaluator):
     Avaliador que conta peças nas penultimas linhas do tabuleiro.
     """
 
+    uses_features = True
+
     def evaluate(self, board: BoardState, color: PlayerColor) -> float:
         """
         Avalia a posição das peças nas penultimas linhas.
@@ -31,33 +34,46 @@ class PieceAboutToPromoteEvaluator(BaseEvaluator):
             if color == PlayerColor.RED:
                 if piece.color == PlayerColor.RED and piece.position.row == 1 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) == None:
                             boardStateValue += 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) == None:
                             boardStateValue += 1.5
                 if piece.color == PlayerColor.BLACK and piece.position.row == 6 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) == None:
                             boardStateValue -= 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) == None:
                             boardStateValue -= 1.5
             else:
                 if piece.color == PlayerColor.RED and piece.position.row == 1 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) == None:
                             boardStateValue -= 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row-1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) == None:
                             boardStateValue -= 1.5
                 if piece.color == PlayerColor.BLACK and piece.position.row == 6 and piece.is_king() == False:
                     if piece.position.col-1 >= 0:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col-1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) == None:
                             boardStateValue += 1.5
                     if piece.position.col+1 <= 7:
-                        if board.get_piece(Position(piece.position.row+1, piece.position.col+1)) == None:
+                        if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) == None:
                             boardStateValue += 1.5
 
         # Retornar diferença
-        return boardStateValue
\ No newline at end of file
+        return boardStateValue
+
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Avalia as casas de promoção livres ao alcance de cada lado.
+
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Diferença de pontos (1.5 por casa de promoção livre)
+        """
+        return 1.5 * (features.of(color).near_promotion - features.of(color.opposite()).near_promotion)
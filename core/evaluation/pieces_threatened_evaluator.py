@@ -2,6 +2,7 @@
 
 from core.position import Position
 from .base_evaluator import BaseEvaluator
+from .features import BoardFeatures
 from ..board_state import BoardState
 from ..enums import PlayerColor
 
@@ -11,6 +12,8 @@ class PiecesThreatenedEvaluator(BaseEvaluator):
     Avaliador que conta peças que, em um determinado estado, estarão ameaçadas.
     """
 
+    uses_features = True
+
     def evaluate(self, board: BoardState, color: PlayerColor) -> float:
         """
         Avalia a posição das peças e checa se há alguma ameaça em potencial.
@@ -20,7 +23,7 @@ class PiecesThreatenedEvaluator(BaseEvaluator):
             color: Cor do jogador a avaliar
 
         Returns:
-            Diferença de pontos (peças do jogador nas laterais - peças do adversário nas laterais)
+            Diferença entre as capturas possíveis do jogador e as do adversário
         """
 
         allpieces = board.get_all_pieces()
@@ -29,38 +32,51 @@ class PiecesThreatenedEvaluator(BaseEvaluator):
 
         for piece in allpieces:
             if piece.position.row+2<=7 and piece.position.col+2<=7:
-                if piece.color == color and board.get_piece(Position(piece.position.row+1, piece.position.col+1)) != None and piece.position.row+2<=7 and piece.position.col+2<=7:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col+1)).color == color.opposite and (board.get_piece(Position(piece.position.row+2, piece.position.col+2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) != None and piece.position.row+2<=7 and piece.position.col+2<=7:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row+2, piece.position.col+2)) == None):
                         boardStateValue += 1
             if piece.position.row+2<=7 and piece.position.col-2>=0:
-                if piece.color == color and board.get_piece(Position(piece.position.row+1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col-1)).color == color.opposite and (board.get_piece(Position(piece.position.row+2, piece.position.col-2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row+2, piece.position.col-2)) == None):
                         boardStateValue += 1
             if piece.position.row-2>=0 and piece.position.col+2<=7:
-                if piece.color == color and board.get_piece(Position(piece.position.row-1, piece.position.col+1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col+1)).color == color.opposite and (board.get_piece(Position(piece.position.row-2, piece.position.col+2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row-2, piece.position.col+2)) == None):
                         boardStateValue += 1
             if piece.position.row-2>=0 and piece.position.col-2>=0:
-                if piece.color == color and board.get_piece(Position(piece.position.row-1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col-1)).color == color.opposite and (board.get_piece(Position(piece.position.row-2, piece.position.col-2)) == None):
+                if piece.color == color and board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)).color == color.opposite() and (board.get_piece(Position.at(piece.position.row-2, piece.position.col-2)) == None):
                         boardStateValue += 1
             
             if piece.position.row+2<=7 and piece.position.col+2<=7:
-                if piece.color == color.opposite and board.get_piece(Position(piece.position.row+1, piece.position.col+1)) != None:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col+1)).color == color and (board.get_piece(Position(piece.position.row+2, piece.position.col+2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)) != None:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col+1)).color == color and (board.get_piece(Position.at(piece.position.row+2, piece.position.col+2)) == None):
                         boardStateValue -= 1
             if piece.position.row+2<=7 and piece.position.col-2>=0:
-                if piece.color == color.opposite and board.get_piece(Position(piece.position.row+1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row+1, piece.position.col-1)).color == color and (board.get_piece(Position(piece.position.row+2, piece.position.col-2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row+1, piece.position.col-1)).color == color and (board.get_piece(Position.at(piece.position.row+2, piece.position.col-2)) == None):
                         boardStateValue -= 1
             if piece.position.row-2>=0 and piece.position.col+2<=7:
-                if piece.color == color.opposite and board.get_piece(Position(piece.position.row-1, piece.position.col+1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col+1)).color == color and (board.get_piece(Position(piece.position.row-2, piece.position.col+2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col+1)).color == color and (board.get_piece(Position.at(piece.position.row-2, piece.position.col+2)) == None):
                         boardStateValue -= 1
             if piece.position.row-2>=0 and piece.position.col-2>=0:
-                if piece.color == color.opposite and board.get_piece(Position(piece.position.row-1, piece.position.col-1)) != None:
-                    if board.get_piece(Position(piece.position.row-1, piece.position.col-1)).color == color and (board.get_piece(Position(piece.position.row-2, piece.position.col-2)) == None):
+                if piece.color == color.opposite() and board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)) != None:
+                    if board.get_piece(Position.at(piece.position.row-1, piece.position.col-1)).color == color and (board.get_piece(Position.at(piece.position.row-2, piece.position.col-2)) == None):
                         boardStateValue -= 1
         
         # Retornar resultado
-        return boardStateValue
\ No newline at end of file
+        return boardStateValue
+
+    def evaluate_features(self, features: BoardFeatures, color: PlayerColor) -> float:
+        """
+        Avalia as ameaças pelas capturas possíveis de cada lado.
+
+        Args:
+            features: Características do tabuleiro
+            color: Cor do jogador a avaliar
+
+        Returns:
+            Diferença entre as capturas possíveis do jogador e as do adversário
+        """
+        return features.of(color).threats - features.of(color.opposite()).threats
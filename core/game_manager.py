@@ -2,7 +2,8 @@
 
 from typing import List, Optional
 
-from core.evaluation.amp_evaluator import AMPEvaluator
+from core.evaluation.fast_amp_evaluator import FastAMPEvaluator
+from core.evaluation.cached_evaluator import CachedEvaluator
 from .board_state import BoardState
 from .move import Move
 from .position import Position
@@ -10,6 +11,9 @@ from .enums import PlayerColor, GameStatus, GameMode, Difficulty
 from .game_rules import GameRules
 from .move_generator import MoveGenerator
 from .ai.ai_player import AIPlayer
+from .ai.background_search import BackgroundSearch
+from .ai.opening_book import OpeningBook
+from .tablebase import EndgameTablebase
 
 
 class GameManager:
@@ -32,7 +36,9 @@ class GameManager:
     def __init__(
         self,
         game_mode: GameMode = GameMode.HUMAN_VS_AI,
-        difficulty: Difficulty = Difficulty.MEDIUM
+        difficulty: Difficulty = Difficulty.MEDIUM,
+        opening_book: Optional[OpeningBook] = None,
+        tablebase: Optional[EndgameTablebase] = None
     ):
         """
         Inicializa o gerenciador do jogo.
@@ -40,9 +46,14 @@ class GameManager:
         Args:
             game_mode: Modo de jogo (HUMAN_VS_HUMAN, HUMAN_VS_AI, AI_VS_AI)
             difficulty: Dificuldade da IA
+            opening_book: Livro de aberturas compartilhado pelas IAs (opcional)
+            tablebase: Tabela de finais usada pelas IAs e, no modo IA vs IA,
+                para encerrar o jogo quando o resultado já está decidido
         """
         self.game_mode = game_mode
         self.difficulty = difficulty
+        self.opening_book = opening_book
+        self.tablebase = tablebase
 
         self.board = BoardState.create_initial_state()
         self.current_player = PlayerColor.RED  # Vermelho sempre começa
@@ -57,6 +68,7 @@ class GameManager:
         self.is_ai_thinking = False
         self.last_ai_move_time = 0
         self.ai_think_delay = 500  # ms de delay visual para IA
+        self._ai_search: Optional[BackgroundSearch] = None
 
         # Seleção de peça (para jogadores humanos)
         self.selected_piece: Optional[Position] = None
@@ -75,27 +87,35 @@ class GameManager:
             self.red_player = None
             self.black_player = None
         elif self.game_mode == GameMode.HUMAN_VS_AI:
-            # Humano é RED, IA é BLACK
+            # Humano é RED, IA é BLACK (pensando durante o turno do humano)
             self.red_player = None
             self.black_player = AIPlayer(
                 color=PlayerColor.BLACK,
                 evaluator=PieceCountEvaluator(),
                 difficulty=self.difficulty,
-                name="IA Preta"
+                name="IA Preta",
+                ponder=True,
+                opening_book=self.opening_book,
+                tablebase=self.tablebase
             )
         else:  # AI_VS_AI
             # Ambos são IA
             self.red_player = AIPlayer(
                 color=PlayerColor.RED,
-                evaluator=AMPEvaluator(),
+                # Avaliador caro: cada posição é avaliada uma vez só
+                evaluator=CachedEvaluator(FastAMPEvaluator()),
                 difficulty=self.difficulty,
-                name="IA Vermelha"
+                name="IA Vermelha",
+                opening_book=self.opening_book,
+                tablebase=self.tablebase
             )
             self.black_player = AIPlayer(
                 color=PlayerColor.BLACK,
                 evaluator=PieceCountEvaluator(),
                 difficulty=self.difficulty,
-                name="IA Preta"
+                name="IA Preta",
+                opening_book=self.opening_book,
+                tablebase=self.tablebase
             )
 
     def get_current_ai_player(self) -> Optional[AIPlayer]:
@@ -129,7 +149,11 @@ class GameManager:
 
     def process_ai_move(self, current_time: int) -> bool:
         """
-        Processa o movimento da IA com delay visual.
+        Processa o movimento da IA com delay visual, sem bloquear o loop.
+
+        Na primeira chamada do turno a busca é iniciada em segundo plano;
+        as chamadas seguintes (uma por quadro) apenas verificam se ela
+        terminou e se o delay visual já passou.
 
         Args:
             current_time: Tempo atual em milissegundos
@@ -145,23 +169,54 @@ class GameManager:
         if self.game_status != GameStatus.PLAYING:
             return False
 
-        # Implementar delay visual
-        if not self.is_ai_thinking:
+        # Iniciar busca em segundo plano e o delay visual
+        if not self.is_ai_thinking or self._ai_search is None:
             self.is_ai_thinking = True
             self.last_ai_move_time = current_time
+            self._ai_search = BackgroundSearch(self.get_current_ai_player(), self.board)
             return False
 
-        # Aguardar delay
+        # Aguardar delay e o fim da busca
         if current_time - self.last_ai_move_time < self.ai_think_delay:
             return False
 
+        if not self._ai_search.done():
+            return False
+
         # Executar movimento da IA
+        move = self._ai_search.result()
+        self._ai_search = None
         self.is_ai_thinking = False
-        return self.execute_ai_move() is not None
+
+        if move is None:
+            # Sem movimentos, jogo terminou
+            self._update_game_status()
+            return False
+
+        return self.apply_move(move)
+
+    def cancel_ai_search(self) -> None:
+        """Cancela a busca da IA e o pondering em andamento, descartando seus resultados."""
+        if self._ai_search is not None:
+            self._ai_search.cancel()
+            self._ai_search = None
+        self.is_ai_thinking = False
+
+        for player in (self.red_player, self.black_player):
+            if player is not None:
+                player.stop_pondering()
+
+    def _start_pondering(self) -> None:
+        """Faz a IA adversária pensar durante o turno do humano."""
+        opponent = self.black_player if self.current_player == PlayerColor.RED else self.red_player
+        if opponent is not None:
+            opponent.start_pondering(self.board)
 
     def execute_ai_move(self) -> Optional[Move]:
         """
-        Executa o movimento da IA atual.
+        Executa o movimento da IA atual de forma síncrona (bloqueante).
+
+        Útil fora do loop gráfico (partidas sem interface, testes).
 
         Returns:
             Movimento executado ou None se o jogo terminou
@@ -313,16 +368,22 @@ class GameManager:
         return True
 
     def _update_game_status(self) -> None:
-        """Atualiza o status do jogo."""
-        self.game_status = GameRules.get_game_status(self.board, self.current_player)
+        """
+        Atualiza o status do jogo.
+
+        No modo IA vs IA, finais cobertos pela tabela de finais são
+        adjudicados com o resultado teórico.
+        """
+        tablebase = self.tablebase if self.game_mode == GameMode.AI_VS_AI else None
+        self.game_status = GameRules.get_game_status(self.board, self.current_player, tablebase)
 
     def reset_game(self) -> None:
         """Reinicia o jogo com estado inicial."""
+        self.cancel_ai_search()
         self.board = BoardState.create_initial_state()
         self.current_player = PlayerColor.RED
         self.move_history.clear()
         self.game_status = GameStatus.PLAYING
-        self.is_ai_thinking = False
         self.deselect_piece()
 
     def set_game_mode(self, game_mode: GameMode) -> None:
@@ -332,6 +393,7 @@ class GameManager:
         Args:
             game_mode: Novo modo de jogo
         """
+        self.cancel_ai_search()
         self.game_mode = game_mode
         self._initialize_players()
         self.reset_game()
@@ -342,7 +404,10 @@ class GameManager:
 
         Args:
             difficulty: Nova dificuldade
+
+        Uma busca em andamento é cancelada e refeita com a nova dificuldade.
         """
+        self.cancel_ai_search()
         self.difficulty = difficulty
         self._initialize_players()
 
@@ -356,6 +421,9 @@ class GameManager:
         # Processar movimento da IA se for turno dela
         if self.game_status == GameStatus.PLAYING and self.is_ai_turn():
             self.process_ai_move(current_time)
+        elif self.game_status == GameStatus.PLAYING:
+            # Turno humano: a IA adversária aproveita para pensar
+            self._start_pondering()
 
     def is_game_over(self) -> bool:
         """
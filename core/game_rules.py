@@ -3,9 +3,10 @@
 from .board_state import BoardState
 from .move import Move
 from .piece import Piece
-from .enums import PlayerColor, GameStatus, PieceType
+from .enums import PlayerColor, GameStatus, PieceType, TablebaseValue
 from .move_generator import MoveGenerator
-from typing import Optional
+from .tablebase import EndgameTablebase
+from typing import List, Optional
 
 
 class GameRules:
@@ -16,6 +17,9 @@ class GameRules:
         """
         Aplica um movimento ao tabuleiro, retornando novo estado.
 
+        O hash Zobrist do novo estado (incluindo a troca de vez) é
+        atualizado incrementalmente.
+
         Args:
             board: Estado atual do tabuleiro
             move: Movimento a aplicar
@@ -23,30 +27,9 @@ class GameRules:
         Returns:
             Novo estado do tabuleiro após o movimento
         """
-        # Clonar o tabuleiro
+        # Clonar o tabuleiro e aplicar o movimento na cópia
         new_board = board.clone()
-
-        # Obter a peça que está se movendo
-        piece = new_board.get_piece(move.start)
-        if not piece:
-            raise ValueError(f"Nenhuma peça na posição inicial {move.start}")
-
-        # Remover peça da posição inicial
-        new_board.remove_piece(move.start)
-
-        # Remover peças capturadas
-        for captured_pos in move.captured_positions:
-            new_board.remove_piece(captured_pos)
-
-        # Mover peça para nova posição
-        moved_piece = piece.move_to(move.end)
-
-        # Verificar se a peça deve ser promovida
-        if moved_piece.should_be_promoted():
-            moved_piece = moved_piece.promote_to_king()
-
-        # Colocar peça na nova posição
-        new_board.set_piece(moved_piece)
+        new_board.make_move(move)
 
         return new_board
 
@@ -75,30 +58,62 @@ class GameRules:
         return move in valid_moves
 
     @staticmethod
-    def get_game_status(board: BoardState, current_player: PlayerColor) -> GameStatus:
+    def get_game_status(
+        board: BoardState,
+        current_player: PlayerColor,
+        tablebase: Optional[EndgameTablebase] = None
+    ) -> GameStatus:
         """
         Determina o status atual do jogo.
 
         Args:
             board: Estado atual do tabuleiro
             current_player: Jogador atual
+            tablebase: Tabela de finais (opcional). Se informada, uma posição
+                coberta pela tabela encerra o jogo com o resultado teórico
+                (adjudicação), inclusive empate.
 
         Returns:
             Status do jogo (PLAYING, RED_WINS, BLACK_WINS, DRAW)
         """
-        # Verificar se o jogador atual tem peças
-        if not board.has_pieces(current_player):
-            # Jogador atual sem peças, adversário vence
-            return GameStatus.RED_WINS if current_player == PlayerColor.BLACK else GameStatus.BLACK_WINS
-
-        # Verificar se o jogador atual tem movimentos válidos
         valid_moves = MoveGenerator.get_all_valid_moves(current_player, board)
-        if not valid_moves:
-            # Jogador atual sem movimentos, adversário vence
-            return GameStatus.RED_WINS if current_player == PlayerColor.BLACK else GameStatus.BLACK_WINS
+        status = GameRules.get_status_from_moves(board, current_player, valid_moves)
+
+        if status == GameStatus.PLAYING and tablebase is not None:
+            entry = tablebase.probe(board, current_player)
+            if entry is not None:
+                if entry.value == TablebaseValue.DRAW:
+                    return GameStatus.DRAW
+                winner = current_player if entry.value == TablebaseValue.WIN else current_player.opposite()
+                return GameStatus.RED_WINS if winner == PlayerColor.RED else GameStatus.BLACK_WINS
+
+        return status
+
+    @staticmethod
+    def get_status_from_moves(
+        board: BoardState,
+        current_player: PlayerColor,
+        valid_moves: List[Move]
+    ) -> GameStatus:
+        """
+        Determina o status do jogo a partir de movimentos já gerados.
+
+        Evita gerar os movimentos de novo quando quem chama já os tem.
+
+        Args:
+            board: Estado atual do tabuleiro
+            current_player: Jogador atual
+            valid_moves: Movimentos válidos do jogador atual
+
+        Returns:
+            Status do jogo (PLAYING, RED_WINS, BLACK_WINS, DRAW)
+        """
+        # Havendo movimentos, o jogador atual tem peças e o jogo continua
+        if valid_moves:
+            return GameStatus.PLAYING
 
-        # Jogo continua
-        return GameStatus.PLAYING
+        # Jogador atual sem peças ou sem movimentos, adversário vence
+        return GameStatus.RED_WINS if current_player == PlayerColor.BLACK else GameStatus.BLACK_WINS
 
     @staticmethod
     def is_game_over(board: BoardState, current_player: PlayerColor) -> bool:
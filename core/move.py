@@ -92,7 +92,7 @@ class Move:
         current_col = self.start.col + col_dir
 
         while current_row != self.end.row and current_col != self.end.col:
-            path.append(Position(current_row, current_col))
+            path.append(Position.at(current_row, current_col))
             current_row += row_dir
             current_col += col_dir
 
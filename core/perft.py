@@ -0,0 +1,225 @@
+"""Contagem de nós da árvore de movimentos (perft) para conferir e medir o gerador."""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from .board_state import BoardState
+from .bitboard_state import BitboardState
+from .move import Move
+from .move_generator import MoveGenerator
+from .enums import PlayerColor
+
+
+# Número de folhas da árvore de movimentos a partir da posição inicial,
+# com as vermelhas jogando primeiro, contadas com MoveGenerator (BoardState
+# e BitboardState dão as mesmas contagens). Cada sequência de captura gerada
+# conta como um movimento (inclusive sequências diferentes que capturam as
+# mesmas peças e terminam na mesma casa). Posições sem movimentos não têm
+# folhas.
+KNOWN_COUNTS: Dict[int, int] = {
+    1: 7,
+    2: 49,
+    3: 302,
+    4: 1469,
+    5: 7482,
+    6: 37986,
+    7: 190146,
+    8: 929902,
+    9: 4570590,
+    10: 22459095,
+}
+
+
+@dataclass
+class PerftResult:
+    """
+    Resultado de uma contagem.
+
+    Attributes:
+        depth: Profundidade contada
+        nodes: Número de folhas
+        seconds: Tempo gasto
+    """
+    depth: int
+    nodes: int
+    seconds: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Folhas contadas por segundo."""
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+def perft(board: BoardState, color: PlayerColor, depth: int) -> int:
+    """
+    Conta as folhas da árvore de movimentos até a profundidade dada.
+
+    O tabuleiro é percorrido com make_move/unmake_move e volta ao estado
+    original. No último nível os movimentos são só contados, sem aplicá-los.
+
+    Args:
+        board: Tabuleiro
+        color: Jogador da vez
+        depth: Profundidade em meios-lances
+
+    Returns:
+        Número de folhas
+    """
+    if depth == 0:
+        return 1
+
+    moves = MoveGenerator.get_all_valid_moves(color, board)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    opponent = color.opposite()
+    for move in moves:
+        undo = board.make_move(move)
+        nodes += perft(board, opponent, depth - 1)
+        board.unmake_move(undo)
+    return nodes
+
+
+def divide(board: BoardState, color: PlayerColor, depth: int) -> List[Tuple[Move, int]]:
+    """
+    Conta as folhas separadamente para cada movimento da raiz.
+
+    Comparar as contagens por movimento com as de uma versão correta do
+    gerador aponta o ramo em que está a diferença.
+
+    Args:
+        board: Tabuleiro
+        color: Jogador da vez
+        depth: Profundidade em meios-lances (pelo menos 1)
+
+    Returns:
+        Pares (movimento, folhas abaixo dele)
+
+    Raises:
+        ValueError: Se depth é menor que 1
+    """
+    if depth < 1:
+        raise ValueError(f"Profundidade inválida para divide: {depth}")
+
+    counts: List[Tuple[Move, int]] = []
+    for move in MoveGenerator.get_all_valid_moves(color, board):
+        undo = board.make_move(move)
+        counts.append((move, perft(board, color.opposite(), depth - 1)))
+        board.unmake_move(undo)
+    return counts
+
+
+def timed_perft(board: BoardState, color: PlayerColor, depth: int) -> PerftResult:
+    """
+    Conta as folhas e mede o tempo gasto.
+
+    Args:
+        board: Tabuleiro
+        color: Jogador da vez
+        depth: Profundidade em meios-lances
+
+    Returns:
+        Resultado com contagem e tempo
+    """
+    start = time.perf_counter()
+    nodes = perft(board, color, depth)
+    return PerftResult(depth, nodes, time.perf_counter() - start)
+
+
+def check_known_counts(max_depth: int, bitboard: bool = False) -> List[Tuple[PerftResult, int]]:
+    """
+    Confere as contagens da posição inicial contra KNOWN_COUNTS.
+
+    Args:
+        max_depth: Maior profundidade a conferir
+        bitboard: Usa BitboardState em vez de BoardState
+
+    Returns:
+        Pares (resultado, contagem esperada) das profundidades que diferem
+
+    Raises:
+        ValueError: Se max_depth não está na tabela
+    """
+    if max_depth not in KNOWN_COUNTS:
+        raise ValueError(f"Sem contagem conhecida para a profundidade {max_depth} (máximo {max(KNOWN_COUNTS)})")
+
+    board = _initial_board(bitboard)
+    mismatches = []
+    for depth in range(1, max_depth + 1):
+        result = timed_perft(board, PlayerColor.RED, depth)
+        if result.nodes != KNOWN_COUNTS[depth]:
+            mismatches.append((result, KNOWN_COUNTS[depth]))
+    return mismatches
+
+
+def _initial_board(bitboard: bool) -> BoardState:
+    """Posição inicial na representação escolhida."""
+    board = BoardState.create_initial_state()
+    return BitboardState.from_board_state(board) if bitboard else board
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Linha de comando do perft.
+
+    Uso:
+        python -m core.perft [PROFUNDIDADE] [--divide] [--bitboard]
+        python -m core.perft --check [PROFUNDIDADE] [--bitboard]
+
+    Sem --check, conta da posição inicial de 1 até a profundidade dada,
+    mostrando folhas, tempo e folhas por segundo de cada nível. Com
+    --check, sai com código 1 se alguma contagem diferir de KNOWN_COUNTS.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    parser = argparse.ArgumentParser(prog='python -m core.perft', description="Perft do gerador de movimentos")
+    parser.add_argument('depth', type=int, nargs='?', default=6, help="profundidade (padrão: 6)")
+    parser.add_argument('--divide', action='store_true', help="contagem por movimento da raiz")
+    parser.add_argument('--bitboard', action='store_true', help="usa BitboardState")
+    parser.add_argument('--check', action='store_true', help="confere contra as contagens conhecidas")
+    args = parser.parse_args(argv)
+
+    if args.depth < 1:
+        parser.error(f"profundidade inválida: {args.depth}")
+    if args.check and args.depth not in KNOWN_COUNTS:
+        parser.error(f"sem contagem conhecida para a profundidade {args.depth} (máximo {max(KNOWN_COUNTS)})")
+
+    if args.check:
+        mismatches = check_known_counts(args.depth, args.bitboard)
+        for result, expected in mismatches:
+            print(f"profundidade {result.depth}: {result.nodes} folhas, esperado {expected}")
+        if mismatches:
+            return 1
+        print(f"Contagens conferem até a profundidade {args.depth}")
+        return 0
+
+    board = _initial_board(args.bitboard)
+
+    if args.divide:
+        start = time.perf_counter()
+        counts = divide(board, PlayerColor.RED, args.depth)
+        seconds = time.perf_counter() - start
+        for move, nodes in counts:
+            print(f"{move}: {nodes}")
+        result = PerftResult(args.depth, sum(nodes for _, nodes in counts), seconds)
+        print(f"Movimentos: {len(counts)}")
+        print(f"Folhas: {result.nodes} em {result.seconds:.2f}s ({result.nodes_per_second:,.0f}/s)")
+        return 0
+
+    for depth in range(1, args.depth + 1):
+        result = timed_perft(board, PlayerColor.RED, depth)
+        expected = KNOWN_COUNTS.get(depth)
+        status = "" if expected is None else (" ok" if result.nodes == expected else f" ERRO (esperado {expected})")
+        print(f"{depth:2d} {result.nodes:12d} {result.seconds:9.2f}s {result.nodes_per_second:12,.0f}/s{status}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
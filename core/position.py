@@ -1,6 +1,11 @@
 """Classe para representar uma posição no tabuleiro."""
 
 from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+
+# Direções diagonais (row_delta, col_delta)
+DIAGONAL_DIRECTIONS: Tuple[Tuple[int, int], ...] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
 
 
 @dataclass(frozen=True)
@@ -9,10 +14,34 @@ class Position:
     Representa uma posição no tabuleiro de damas.
 
     A classe é imutável (frozen) para permitir uso como chave em dicionários.
+
+    Existe uma instância canônica para cada uma das 64 casas, obtida com
+    Position.at(row, col). As instâncias canônicas são reutilizadas por
+    move() e pelas tabelas de vizinhos diagonais, evitando alocações e a
+    validação de __post_init__ nos laços da busca.
     """
     row: int
     col: int
 
+    @classmethod
+    def at(cls, row: int, col: int) -> 'Position':
+        """
+        Retorna a instância canônica de uma posição.
+
+        Args:
+            row: Linha (0-7)
+            col: Coluna (0-7)
+
+        Returns:
+            Position compartilhada para a casa
+
+        Raises:
+            ValueError: Se a posição está fora do tabuleiro
+        """
+        if 0 <= row < 8 and 0 <= col < 8:
+            return _POSITIONS[row * 8 + col]
+        return cls(row, col)
+
     def __post_init__(self):
         """Valida a posição após inicialização."""
         if not (0 <= self.row < 8):
@@ -41,22 +70,45 @@ class Position:
         """
         return (self.row + self.col) % 2 == 1
 
+    @property
+    def index(self) -> int:
+        """Índice da casa no tabuleiro (row * 8 + col)."""
+        return self.row * 8 + self.col
+
+    @property
+    def diagonal_neighbours(self) -> Dict[Tuple[int, int], Optional['Position']]:
+        """Vizinhos diagonais por direção (None fora do tabuleiro)."""
+        return _NEIGHBOURS[self.row * 8 + self.col]
+
+    @property
+    def jump_landings(self) -> Dict[Tuple[int, int], Optional['Position']]:
+        """Casas de aterrissagem de um salto por direção (None fora do tabuleiro)."""
+        return _JUMP_LANDINGS[self.row * 8 + self.col]
+
     def move(self, row_delta: int, col_delta: int) -> 'Position | None':
         """
-        Cria nova posição aplicando um deslocamento.
+        Retorna a posição obtida aplicando um deslocamento.
+
+        Passos e saltos diagonais são lidos das tabelas pré-calculadas;
+        outros deslocamentos são calculados na hora. O resultado é sempre
+        a instância canônica da casa.
 
         Args:
             row_delta: Deslocamento na linha
             col_delta: Deslocamento na coluna
 
         Returns:
-            Nova Position se válida, None caso contrário
+            Position se válida, None caso contrário
         """
+        table = _STEP_TABLES.get((row_delta, col_delta))
+        if table is not None:
+            return table[self.row * 8 + self.col]
+
         new_row = self.row + row_delta
         new_col = self.col + col_delta
 
         if 0 <= new_row < 8 and 0 <= new_col < 8:
-            return Position(new_row, new_col)
+            return _POSITIONS[new_row * 8 + new_col]
         return None
 
     def distance_to(self, other: 'Position') -> int:
@@ -97,10 +149,65 @@ class Position:
         col_diff = abs(self.col - other.col)
         return row_diff == 1 and col_diff == 1
 
+    def __eq__(self, other: object) -> bool:
+        """Igualdade entre posições (identidade para instâncias canônicas)."""
+        if self is other:
+            return True
+        if other.__class__ is not Position:
+            return NotImplemented
+        return self.row == other.row and self.col == other.col
+
+    def __hash__(self) -> int:
+        """Hash da posição."""
+        return self.row * 8 + self.col
+
+    def __reduce__(self):
+        """Serialização que devolve a instância canônica ao desserializar."""
+        return (Position.at, (self.row, self.col))
+
     def __str__(self) -> str:
         """Representação em string."""
         return f"({self.row}, {self.col})"
 
     def __repr__(self) -> str:
         """Representação para debug."""
-        return f"Position(row={self.row}, col={self.col})"
\ No newline at end of file
+        return f"Position(row={self.row}, col={self.col})"
+
+
+# Instâncias canônicas das 64 casas, indexadas por row * 8 + col
+_POSITIONS: Tuple[Position, ...] = tuple(Position(row, col) for row in range(8) for col in range(8))
+
+
+def _build_step_table(row_delta: int, col_delta: int) -> Tuple[Optional[Position], ...]:
+    """Calcula o destino de um deslocamento a partir de cada casa."""
+    table = []
+    for position in _POSITIONS:
+        new_row = position.row + row_delta
+        new_col = position.col + col_delta
+        if 0 <= new_row < 8 and 0 <= new_col < 8:
+            table.append(_POSITIONS[new_row * 8 + new_col])
+        else:
+            table.append(None)
+    return tuple(table)
+
+
+# Tabelas de passos (1 casa) e saltos (2 casas) em cada direção diagonal
+_STEP_TABLES: Dict[Tuple[int, int], Tuple[Optional[Position], ...]] = {}
+for _row_dir, _col_dir in DIAGONAL_DIRECTIONS:
+    for _distance in (1, 2):
+        _STEP_TABLES[(_row_dir * _distance, _col_dir * _distance)] = _build_step_table(
+            _row_dir * _distance, _col_dir * _distance
+        )
+
+_NEIGHBOURS: Tuple[Dict[Tuple[int, int], Optional[Position]], ...] = tuple(
+    {direction: _STEP_TABLES[direction][index] for direction in DIAGONAL_DIRECTIONS}
+    for index in range(64)
+)
+
+_JUMP_LANDINGS: Tuple[Dict[Tuple[int, int], Optional[Position]], ...] = tuple(
+    {
+        (row_dir, col_dir): _STEP_TABLES[(row_dir * 2, col_dir * 2)][index]
+        for row_dir, col_dir in DIAGONAL_DIRECTIONS
+    }
+    for index in range(64)
+)
@@ -0,0 +1,733 @@
+"""Tabela de finais (tablebase) gerada por análise retrógrada."""
+
+import argparse
+import itertools
+import mmap
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass
+from math import comb
+from typing import Dict, List, Optional, Tuple
+from .board_state import BoardState
+from .bitboard_state import BitboardState
+from .enums import PlayerColor, PieceType, TablebaseValue
+
+
+# Assinatura material: (peças vermelhas, damas vermelhas, peças pretas, damas pretas)
+Signature = Tuple[int, int, int, int]
+
+# Número de casas jogáveis e geometria das diagonais sobre os índices 0-31
+# (índice = linha * 4 + coluna // 2, como em bitboard_state.square_index)
+SQUARE_COUNT = 32
+
+
+def _build_geometry() -> Tuple[list, list]:
+    """
+    Pré-calcula passos e saltos diagonais de cada casa.
+
+    Returns:
+        Tupla (passos por direção, saltos (casa pulada, destino))
+    """
+    steps = []
+    jumps = []
+    for square in range(SQUARE_COUNT):
+        row = square // 4
+        col = (square % 4) * 2 + (1 if row % 2 == 0 else 0)
+        square_steps = {}
+        square_jumps = []
+        for row_delta, col_delta in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+            step_row, step_col = row + row_delta, col + col_delta
+            if 0 <= step_row < 8 and 0 <= step_col < 8:
+                step = step_row * 4 + step_col // 2
+                square_steps[row_delta, col_delta] = step
+                land_row, land_col = row + 2 * row_delta, col + 2 * col_delta
+                if 0 <= land_row < 8 and 0 <= land_col < 8:
+                    square_jumps.append((step, land_row * 4 + land_col // 2))
+        steps.append(square_steps)
+        jumps.append(tuple(square_jumps))
+    return steps, jumps
+
+
+_STEPS, _JUMPS = _build_geometry()
+
+# Passos simples por casa: para frente de cada cor e em todas as direções (damas)
+_RED_MAN_STEPS = tuple(tuple(s for d, s in steps.items() if d[0] == -1) for steps in _STEPS)
+_BLACK_MAN_STEPS = tuple(tuple(s for d, s in steps.items() if d[0] == 1) for steps in _STEPS)
+_KING_STEPS = tuple(tuple(steps.values()) for steps in _STEPS)
+
+# Casas de promoção: linha 0 para vermelhas, linha 7 para pretas
+_RED_PROMOTION_MASK = 0x0000000F
+_BLACK_PROMOTION_MASK = 0xF0000000
+
+# Codificação dos valores durante a geração e no formato com distância:
+# 0 = empate, 1 = posição inválida, 2 + d = resultado em d plies
+# (d par: derrota do jogador da vez; d ímpar: vitória)
+_DRAW = 0
+_INVALID = 1
+_DISTANCE_OFFSET = 2
+_MAX_DISTANCE = 253
+
+# Codificação compacta (2 bits por posição)
+_PACKED_DRAW = 0
+_PACKED_WIN = 1
+_PACKED_LOSS = 2
+_PACKED_INVALID = 3
+
+# Formato do arquivo (little-endian):
+#   cabeçalho: assinatura, versão, flags, máximo de peças, número de tabelas
+#   índice: assinatura material, deslocamento dos dados e número de posições
+#   dados: um byte por posição (com distância) ou 2 bits por posição
+TABLEBASE_MAGIC = b'CKTB'
+TABLEBASE_VERSION = 1
+_FLAG_DISTANCE = 1
+_HEADER = struct.Struct('<4sHHHH')
+_TOC_ENTRY = struct.Struct('<BBBBQQ')
+
+
+def _squares(mask: int) -> List[int]:
+    """Lista as casas de uma máscara."""
+    squares = []
+    while mask:
+        low = mask & -mask
+        squares.append(low.bit_length() - 1)
+        mask ^= low
+    return squares
+
+
+def _rank(mask: int, used: int) -> int:
+    """
+    Posição de um conjunto de casas entre todas as combinações possíveis
+    nas casas livres (ordem colexicográfica).
+
+    Args:
+        mask: Casas do grupo
+        used: Casas já ocupadas pelos grupos anteriores
+
+    Returns:
+        Índice da combinação
+    """
+    rank = 0
+    for order, square in enumerate(_squares(mask), 1):
+        free_position = square - (used & ((1 << square) - 1)).bit_count()
+        rank += comb(free_position, order)
+    return rank
+
+
+def table_size(signature: Signature) -> int:
+    """
+    Número de posições de uma assinatura material (com os dois lados a jogar).
+
+    Args:
+        signature: Assinatura material
+
+    Returns:
+        Tamanho da tabela
+    """
+    size = 2
+    free = SQUARE_COUNT
+    for count in signature:
+        size *= comb(free, count)
+        free -= count
+    return size
+
+
+def position_index(
+    signature: Signature,
+    red_men: int,
+    red_kings: int,
+    black_men: int,
+    black_kings: int,
+    side: int
+) -> int:
+    """
+    Índice de uma posição na tabela da sua assinatura material.
+
+    Args:
+        signature: Assinatura material da posição
+        red_men: Máscara das peças vermelhas
+        red_kings: Máscara das damas vermelhas
+        black_men: Máscara das peças pretas
+        black_kings: Máscara das damas pretas
+        side: Jogador da vez (0 = vermelho, 1 = preto)
+
+    Returns:
+        Índice na tabela
+    """
+    index = 0
+    used = 0
+    free = SQUARE_COUNT
+    for count, mask in zip(signature, (red_men, red_kings, black_men, black_kings)):
+        index = index * comb(free, count) + _rank(mask, used)
+        used |= mask
+        free -= count
+    return index * 2 + side
+
+
+def _captures(start: int, opponents: int, occupied: int) -> List[Tuple[int, int]]:
+    """
+    Sequências de captura de uma peça, com as regras de MoveGenerator.
+
+    Peças comuns e damas capturam nas quatro direções; a sequência
+    continua enquanto houver captura, e peças capturadas (e a casa de
+    origem) continuam ocupadas até o fim do movimento.
+
+    Args:
+        start: Casa da peça
+        opponents: Máscara das peças adversárias
+        occupied: Máscara de todas as casas ocupadas
+
+    Returns:
+        Lista de (casa final, máscara das peças capturadas)
+    """
+    results = []
+
+    def extend(square: int, captured: int) -> bool:
+        found = False
+        for over, land in _JUMPS[square]:
+            over_bit = 1 << over
+            if opponents & over_bit and not captured & over_bit and not occupied & (1 << land):
+                found = True
+                if not extend(land, captured | over_bit):
+                    results.append((land, captured | over_bit))
+        return found
+
+    extend(start, 0)
+    return results
+
+
+def successors(
+    red_men: int,
+    red_kings: int,
+    black_men: int,
+    black_kings: int,
+    side: int
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Posições resultantes de todos os movimentos válidos do jogador da vez.
+
+    Segue as mesmas regras de MoveGenerator (captura obrigatória, capturas
+    múltiplas, promoção ao fim do movimento).
+
+    Args:
+        red_men: Máscara das peças vermelhas
+        red_kings: Máscara das damas vermelhas
+        black_men: Máscara das peças pretas
+        black_kings: Máscara das damas pretas
+        side: Jogador da vez (0 = vermelho, 1 = preto)
+
+    Returns:
+        Lista de máscaras (red_men, red_kings, black_men, black_kings) após
+        cada movimento (o adversário passa a jogar)
+    """
+    if side == 0:
+        own_men, own_kings, opp_men, opp_kings = red_men, red_kings, black_men, black_kings
+        man_steps, promotion_mask = _RED_MAN_STEPS, _RED_PROMOTION_MASK
+    else:
+        own_men, own_kings, opp_men, opp_kings = black_men, black_kings, red_men, red_kings
+        man_steps, promotion_mask = _BLACK_MAN_STEPS, _BLACK_PROMOTION_MASK
+
+    opponents = opp_men | opp_kings
+    occupied = own_men | own_kings | opponents
+    results = []
+
+    # Capturas (obrigatórias)
+    for start in _squares(own_men | own_kings):
+        start_bit = 1 << start
+        is_king = bool(own_kings & start_bit)
+        for end, captured in _captures(start, opponents, occupied):
+            end_bit = 1 << end
+            new_opp_men = opp_men & ~captured
+            new_opp_kings = opp_kings & ~captured
+            if is_king:
+                new_men, new_kings = own_men, (own_kings ^ start_bit) | end_bit
+            elif end_bit & promotion_mask:
+                new_men, new_kings = own_men ^ start_bit, own_kings | end_bit
+            else:
+                new_men, new_kings = (own_men ^ start_bit) | end_bit, own_kings
+            results.append((new_men, new_kings, new_opp_men, new_opp_kings))
+
+    if not results:
+        for start in _squares(own_men):
+            start_bit = 1 << start
+            for end in man_steps[start]:
+                end_bit = 1 << end
+                if occupied & end_bit:
+                    continue
+                if end_bit & promotion_mask:
+                    results.append((own_men ^ start_bit, own_kings | end_bit, opp_men, opp_kings))
+                else:
+                    results.append(((own_men ^ start_bit) | end_bit, own_kings, opp_men, opp_kings))
+        for start in _squares(own_kings):
+            start_bit = 1 << start
+            for end in _KING_STEPS[start]:
+                end_bit = 1 << end
+                if not occupied & end_bit:
+                    results.append((own_men, (own_kings ^ start_bit) | end_bit, opp_men, opp_kings))
+
+    if side == 0:
+        return results
+    # Reordenar para (red_men, red_kings, black_men, black_kings)
+    return [(rm, rk, bm, bk) for bm, bk, rm, rk in results]
+
+
+def signatures(max_pieces: int) -> List[Signature]:
+    """
+    Assinaturas materiais com até max_pieces peças (ao menos uma de cada cor),
+    na ordem de geração: cada tabela depende apenas de tabelas anteriores
+    (capturas reduzem o total de peças; promoções reduzem as peças comuns).
+
+    Args:
+        max_pieces: Número máximo de peças no tabuleiro
+
+    Returns:
+        Lista de assinaturas
+    """
+    result = [
+        (rm, rk, bm, bk)
+        for rm, rk, bm, bk in itertools.product(range(max_pieces + 1), repeat=4)
+        if rm + rk >= 1 and bm + bk >= 1 and rm + rk + bm + bk <= max_pieces
+    ]
+    result.sort(key=lambda sig: (sum(sig), sig[0] + sig[2], sig))
+    return result
+
+
+def board_masks(board: BoardState) -> Tuple[int, int, int, int]:
+    """
+    Máscaras (red_men, red_kings, black_men, black_kings) de um tabuleiro.
+
+    Args:
+        board: Estado do tabuleiro
+
+    Returns:
+        Tupla de máscaras de 32 bits
+    """
+    if isinstance(board, BitboardState):
+        return (
+            board.get_men_mask(PlayerColor.RED),
+            board.get_kings_mask(PlayerColor.RED),
+            board.get_men_mask(PlayerColor.BLACK),
+            board.get_kings_mask(PlayerColor.BLACK)
+        )
+
+    masks = [0, 0, 0, 0]
+    for piece in board.get_all_pieces():
+        slot = (0 if piece.color == PlayerColor.RED else 2) + (1 if piece.piece_type == PieceType.KING else 0)
+        masks[slot] |= 1 << (piece.position.row * 4 + piece.position.col // 2)
+    return masks[0], masks[1], masks[2], masks[3]
+
+
+def _piece_count(board: BoardState) -> int:
+    """Número de peças no tabuleiro, sem percorrê-lo."""
+    if isinstance(board, BitboardState):
+        return (board.red_mask | board.black_mask).bit_count()
+    return len(board.pieces)
+
+
+def _signature_of(red_men: int, red_kings: int, black_men: int, black_kings: int) -> Signature:
+    """Assinatura material de um conjunto de máscaras."""
+    return (red_men.bit_count(), red_kings.bit_count(), black_men.bit_count(), black_kings.bit_count())
+
+
+@dataclass(frozen=True)
+class TablebaseEntry:
+    """
+    Resultado da consulta de uma posição.
+
+    Attributes:
+        value: Resultado para o jogador da vez
+        distance: Plies até o fim do jogo com jogo perfeito (None em
+            empates ou em tabelas sem distância)
+    """
+    value: TablebaseValue
+    distance: Optional[int]
+
+
+class TablebaseGenerator:
+    """
+    Gera a tabela de finais por análise retrógrada.
+
+    Para cada assinatura material (em ordem de dependência), todas as
+    posições são enumeradas e seus sucessores classificados:
+        - fora da assinatura (capturas e promoções): valor já conhecido;
+        - dentro da assinatura: arestas usadas na propagação.
+
+    A propagação parte das posições resolvidas, em ordem crescente de
+    distância: o predecessor de uma derrota é vitória; uma posição cujos
+    sucessores são todos vitórias do adversário é derrota. O que não se
+    resolve é empate. Assim a vitória usa a menor distância e a derrota,
+    a maior.
+    """
+
+    def __init__(self, max_pieces: int = 4):
+        """
+        Inicializa o gerador.
+
+        Args:
+            max_pieces: Número máximo de peças no tabuleiro
+        """
+        self.max_pieces = max_pieces
+        self.tables: Dict[Signature, bytearray] = {}
+
+    def generate(self, verbose: bool = False) -> Dict[Signature, bytearray]:
+        """
+        Gera todas as tabelas.
+
+        Args:
+            verbose: Imprimir o progresso por assinatura
+
+        Returns:
+            Valores codificados por assinatura
+        """
+        for signature in signatures(self.max_pieces):
+            start_time = time.perf_counter()
+            self.tables[signature] = self._solve(signature)
+            if verbose:
+                values = self.tables[signature]
+                wins = sum(1 for code in values if code >= _DISTANCE_OFFSET and (code - _DISTANCE_OFFSET) % 2)
+                losses = sum(1 for code in values if code >= _DISTANCE_OFFSET and not (code - _DISTANCE_OFFSET) % 2)
+                print(
+                    f"{signature}: {len(values)} posições, {wins} vitórias, {losses} derrotas "
+                    f"({time.perf_counter() - start_time:.1f}s)"
+                )
+        return self.tables
+
+    def _enumerate(self, signature: Signature):
+        """Percorre as posições válidas da assinatura: (índice, máscaras, lado)."""
+        red_men_count, red_kings_count, black_men_count, black_kings_count = signature
+        all_squares = range(SQUARE_COUNT)
+
+        # Peças comuns nunca ficam na própria linha de promoção
+        for red_men_squares in itertools.combinations(range(4, SQUARE_COUNT), red_men_count):
+            red_men = sum(1 << square for square in red_men_squares)
+            for red_kings_squares in itertools.combinations(
+                [s for s in all_squares if not red_men >> s & 1], red_kings_count
+            ):
+                red_kings = sum(1 << square for square in red_kings_squares)
+                used = red_men | red_kings
+                for black_men_squares in itertools.combinations(
+                    [s for s in range(SQUARE_COUNT - 4) if not used >> s & 1], black_men_count
+                ):
+                    black_men = sum(1 << square for square in black_men_squares)
+                    used_black = used | black_men
+                    for black_kings_squares in itertools.combinations(
+                        [s for s in all_squares if not used_black >> s & 1], black_kings_count
+                    ):
+                        black_kings = sum(1 << square for square in black_kings_squares)
+                        index = position_index(signature, red_men, red_kings, black_men, black_kings, 0)
+                        yield index, red_men, red_kings, black_men, black_kings
+
+    def _lookup(self, red_men: int, red_kings: int, black_men: int, black_kings: int, side: int) -> int:
+        """Valor codificado de uma posição de outra assinatura (já gerada)."""
+        signature = _signature_of(red_men, red_kings, black_men, black_kings)
+        if side == 0 and not red_men | red_kings or side == 1 and not black_men | black_kings:
+            # Jogador da vez sem peças: derrota imediata
+            return _DISTANCE_OFFSET
+        return self.tables[signature][position_index(signature, red_men, red_kings, black_men, black_kings, side)]
+
+    def _solve(self, signature: Signature) -> bytearray:
+        """
+        Resolve todas as posições de uma assinatura.
+
+        Args:
+            signature: Assinatura material
+
+        Returns:
+            Valores codificados, indexados por position_index
+        """
+        size = table_size(signature)
+        values = bytearray([_INVALID]) * size
+        resolved = bytearray(size)
+        pending = bytearray(size)          # Sucessores internos ainda não resolvidos
+        longest_win = bytearray(size)      # Maior distância de vitória entre os sucessores
+        can_draw = bytearray(size)         # Algum sucessor externo é empate
+        winning = bytearray(size)          # Algum sucessor externo é derrota do adversário
+        edge_from = array('I')
+        edge_to = array('I')
+        buckets: Dict[int, List[int]] = {}
+
+        for base_index, red_men, red_kings, black_men, black_kings in self._enumerate(signature):
+            for side in (0, 1):
+                index = base_index + side
+                values[index] = _DRAW
+                moves = successors(red_men, red_kings, black_men, black_kings, side)
+                if not moves:
+                    buckets.setdefault(0, []).append(index)
+                    continue
+
+                best_win = None
+                for new_rm, new_rk, new_bm, new_bk in moves:
+                    if _signature_of(new_rm, new_rk, new_bm, new_bk) == signature:
+                        edge_from.append(index)
+                        edge_to.append(position_index(signature, new_rm, new_rk, new_bm, new_bk, 1 - side))
+                        pending[index] += 1
+                        continue
+
+                    code = self._lookup(new_rm, new_rk, new_bm, new_bk, 1 - side)
+                    if code == _DRAW:
+                        can_draw[index] = 1
+                        continue
+                    distance = code - _DISTANCE_OFFSET
+                    if distance % 2 == 0:
+                        # Derrota do adversário: vitória
+                        if best_win is None or distance + 1 < best_win:
+                            best_win = distance + 1
+                    elif distance > longest_win[index]:
+                        longest_win[index] = distance
+
+                if best_win is not None:
+                    winning[index] = 1
+                    buckets.setdefault(best_win, []).append(index)
+                elif not pending[index] and not can_draw[index]:
+                    buckets.setdefault(longest_win[index] + 1, []).append(index)
+
+        # Predecessores internos em forma compacta (CSR)
+        predecessor_start = array('I', bytes(4 * (size + 1)))
+        for target in edge_to:
+            predecessor_start[target + 1] += 1
+        for index in range(size):
+            predecessor_start[index + 1] += predecessor_start[index]
+        predecessors = array('I', bytes(4 * len(edge_to)))
+        fill = array('I', predecessor_start)
+        for source, target in zip(edge_from, edge_to):
+            predecessors[fill[target]] = source
+            fill[target] += 1
+        del edge_from, edge_to, fill
+
+        # Propagação em ordem crescente de distância
+        distance = 0
+        while buckets:
+            queue = buckets.pop(distance, None)
+            # Distâncias muito longas são truncadas mantendo a paridade
+            distance_code = distance if distance <= _MAX_DISTANCE else _MAX_DISTANCE - (distance - _MAX_DISTANCE) % 2
+            if queue:
+                for index in queue:
+                    if resolved[index]:
+                        continue
+                    resolved[index] = 1
+                    values[index] = _DISTANCE_OFFSET + distance_code
+                    is_loss = distance % 2 == 0
+                    for position in range(predecessor_start[index], predecessor_start[index + 1]):
+                        predecessor = predecessors[position]
+                        if resolved[predecessor]:
+                            continue
+                        if is_loss:
+                            buckets.setdefault(distance + 1, []).append(predecessor)
+                            continue
+                        pending[predecessor] -= 1
+                        if distance > longest_win[predecessor]:
+                            longest_win[predecessor] = min(distance, 255)
+                        if not pending[predecessor] and not can_draw[predecessor] and not winning[predecessor]:
+                            buckets.setdefault(longest_win[predecessor] + 1, []).append(predecessor)
+            distance += 1
+
+        return values
+
+    def write(self, path: str, with_distance: bool = True) -> None:
+        """
+        Grava as tabelas geradas.
+
+        Args:
+            path: Caminho do arquivo
+            with_distance: Guardar a distância (um byte por posição) ou
+                apenas vitória/derrota/empate (2 bits por posição)
+        """
+        ordered = sorted(self.tables)
+        offset = _HEADER.size + _TOC_ENTRY.size * len(ordered)
+        entries = []
+        chunks = []
+        for signature in ordered:
+            values = self.tables[signature]
+            data = bytes(values) if with_distance else _pack(values)
+            entries.append(_TOC_ENTRY.pack(*signature, offset, len(values)))
+            chunks.append(data)
+            offset += len(data)
+
+        flags = _FLAG_DISTANCE if with_distance else 0
+        with open(path, 'wb') as tablebase_file:
+            tablebase_file.write(_HEADER.pack(TABLEBASE_MAGIC, TABLEBASE_VERSION, flags, self.max_pieces, len(ordered)))
+            tablebase_file.writelines(entries)
+            tablebase_file.writelines(chunks)
+
+
+def _pack(values: bytearray) -> bytes:
+    """Compacta valores codificados em 2 bits por posição."""
+    packed = bytearray((len(values) + 3) // 4)
+    for index, code in enumerate(values):
+        if code == _DRAW:
+            continue
+        if code == _INVALID:
+            bits = _PACKED_INVALID
+        else:
+            bits = _PACKED_WIN if (code - _DISTANCE_OFFSET) % 2 else _PACKED_LOSS
+        packed[index >> 2] |= bits << ((index & 3) * 2)
+    return bytes(packed)
+
+
+class EndgameTablebase:
+    """
+    Tabela de finais somente leitura, mapeada em memória.
+
+    Cada consulta calcula o índice da posição na tabela da sua assinatura
+    material e lê um byte: custo constante, sem carregar o arquivo.
+    """
+
+    def __init__(self, path: str):
+        """
+        Abre uma tabela de finais.
+
+        Args:
+            path: Caminho do arquivo
+
+        Raises:
+            ValueError: Se o arquivo não é uma tabela válida
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Tabela de finais vazia: {path}")
+
+        if len(self._data) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Tabela de finais inválida: {path}")
+
+        magic, version, flags, max_pieces, count = _HEADER.unpack_from(self._data, 0)
+        if magic != TABLEBASE_MAGIC or version != TABLEBASE_VERSION:
+            self.close()
+            raise ValueError(f"Tabela de finais inválida ou de outra versão: {path}")
+
+        self.max_pieces = max_pieces
+        self.with_distance = bool(flags & _FLAG_DISTANCE)
+        self._offsets: Dict[Signature, int] = {}
+        for entry in range(count):
+            rm, rk, bm, bk, offset, size = _TOC_ENTRY.unpack_from(self._data, _HEADER.size + entry * _TOC_ENTRY.size)
+            self._offsets[rm, rk, bm, bk] = offset
+
+        self.probes = 0
+        self.hits = 0
+
+    def __reduce__(self):
+        """Permite enviar a tabela a outro processo (o arquivo é reaberto lá)."""
+        return (EndgameTablebase, (self.path,))
+
+    def __enter__(self) -> 'EndgameTablebase':
+        """Permite usar a tabela com with."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Fecha a tabela ao sair do bloco with."""
+        self.close()
+
+    def close(self) -> None:
+        """Libera o mapeamento e o arquivo."""
+        if self._data is not None:
+            self._data.close()
+            self._data = None
+        self._file.close()
+
+    def probe(self, board: BoardState, color: PlayerColor) -> Optional[TablebaseEntry]:
+        """
+        Consulta o resultado teórico de uma posição.
+
+        Args:
+            board: Estado do tabuleiro
+            color: Jogador da vez
+
+        Returns:
+            Resultado para color, ou None se a posição não está na tabela
+        """
+        if _piece_count(board) > self.max_pieces:
+            return None
+        self.probes += 1
+
+        red_men, red_kings, black_men, black_kings = board_masks(board)
+        signature = _signature_of(red_men, red_kings, black_men, black_kings)
+        offset = self._offsets.get(signature)
+        if offset is None:
+            return None
+
+        side = 0 if color == PlayerColor.RED else 1
+        index = position_index(signature, red_men, red_kings, black_men, black_kings, side)
+
+        if self.with_distance:
+            code = self._data[offset + index]
+            if code == _INVALID:
+                return None
+            self.hits += 1
+            if code == _DRAW:
+                return TablebaseEntry(TablebaseValue.DRAW, None)
+            distance = code - _DISTANCE_OFFSET
+            value = TablebaseValue.WIN if distance % 2 else TablebaseValue.LOSS
+            return TablebaseEntry(value, distance)
+
+        bits = (self._data[offset + (index >> 2)] >> ((index & 3) * 2)) & 3
+        if bits == _PACKED_INVALID:
+            return None
+        self.hits += 1
+        value = {
+            _PACKED_DRAW: TablebaseValue.DRAW,
+            _PACKED_WIN: TablebaseValue.WIN,
+            _PACKED_LOSS: TablebaseValue.LOSS
+        }[bits]
+        return TablebaseEntry(value, None)
+
+    def get_statistics(self) -> dict:
+        """
+        Retorna estatísticas de consulta.
+
+        Returns:
+            Dicionário com estatísticas
+        """
+        return {
+            'tb_probes': self.probes,
+            'tb_hits': self.hits,
+            'tb_max_pieces': self.max_pieces
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Linha de comando da tabela de finais.
+
+    Uso:
+        python -m core.tablebase build ARQUIVO [--pieces N] [--no-distance]
+        python -m core.tablebase info ARQUIVO
+
+    Args:
+        argv: Argumentos (padrão: sys.argv[1:])
+
+    Returns:
+        Código de saída
+    """
+    parser = argparse.ArgumentParser(prog='python -m core.tablebase', description="Tabela de finais")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build_parser = commands.add_parser('build', help="gera a tabela por análise retrógrada")
+    build_parser.add_argument('output', help="arquivo da tabela")
+    build_parser.add_argument('--pieces', type=int, default=4, help="máximo de peças (padrão: 4)")
+    build_parser.add_argument('--no-distance', action='store_true', help="guardar apenas vitória/derrota/empate")
+
+    info_parser = commands.add_parser('info', help="mostra o conteúdo de uma tabela")
+    info_parser.add_argument('path', help="arquivo da tabela")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        generator = TablebaseGenerator(args.pieces)
+        generator.generate(verbose=True)
+        generator.write(args.output, with_distance=not args.no_distance)
+        print(f"Tabela de até {args.pieces} peças gravada em {args.output}")
+        return 0
+
+    with EndgameTablebase(args.path) as tablebase:
+        distance = "com distância" if tablebase.with_distance else "sem distância"
+        print(f"Até {tablebase.max_pieces} peças, {len(tablebase._offsets)} tabelas, {distance}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Tabelas de hashing Zobrist para identificar posições do tabuleiro."""
+
+import random
+from typing import Dict, Tuple
+from .piece import Piece
+from .enums import PlayerColor, PieceType
+
+
+# Semente fixa: as chaves precisam ser estáveis entre execuções para que
+# possam ser gravadas em disco (livro de aberturas, tabelas, caches)
+ZOBRIST_SEED = 0x5EED_DA3A5
+
+_rng = random.Random(ZOBRIST_SEED)
+
+# Chave aleatória de 64 bits por (cor, tipo de peça) e casa (row * 8 + col)
+PIECE_KEYS: Dict[Tuple[PlayerColor, PieceType], Tuple[int, ...]] = {
+    (color, piece_type): tuple(_rng.getrandbits(64) for _ in range(64))
+    for color in PlayerColor
+    for piece_type in PieceType
+}
+
+# Chave combinada ao hash quando é a vez das pretas
+SIDE_TO_MOVE_KEY = _rng.getrandbits(64)
+
+
+def piece_key(piece: Piece) -> int:
+    """
+    Retorna a chave Zobrist de uma peça na sua posição.
+
+    Args:
+        piece: Peça no tabuleiro
+
+    Returns:
+        Chave de 64 bits
+    """
+    position = piece.position
+    return PIECE_KEYS[(piece.color, piece.piece_type)][position.row * 8 + position.col]
+
+
+def side_key(side_to_move: PlayerColor) -> int:
+    """
+    Retorna a componente do hash referente ao jogador da vez.
+
+    Args:
+        side_to_move: Jogador que tem a vez
+
+    Returns:
+        SIDE_TO_MOVE_KEY se é a vez das pretas, 0 caso contrário
+    """
+    return SIDE_TO_MOVE_KEY if side_to_move == PlayerColor.BLACK else 0
+
+
+def compute_hash(board, side_to_move: PlayerColor) -> int:
+    """
+    Calcula o hash Zobrist completo de um tabuleiro.
+
+    Usado para inicializar e verificar o hash mantido incrementalmente
+    por BoardState.
+
+    Args:
+        board: Estado do tabuleiro
+        side_to_move: Jogador que tem a vez
+
+    Returns:
+        Hash de 64 bits da posição
+    """
+    key = side_key(side_to_move)
+    for piece in board.get_all_pieces():
+        key ^= piece_key(piece)
+    return key
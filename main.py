@@ -1,11 +1,14 @@
 """Arquivo principal do jogo de damas."""
 
+import os
 import pygame
 import sys
 from typing import Optional
-from config import WindowConfig, BoardConfig, ColorsConfig, UIElementConfig
+from config import WindowConfig, BoardConfig, ColorsConfig, UIElementConfig, AIConfig
 from core.enums import PlayerColor, GameMode, Difficulty
 from core.game_manager import GameManager
+from core.ai.opening_book import OpeningBook
+from core.tablebase import EndgameTablebase
 from core.position import Position
 from renderers.board_renderer import BoardRenderer
 from renderers.piece_renderer import PieceRenderer
@@ -33,7 +36,12 @@ class CheckersWindow:
         self.running = True
 
         # Criar gerenciador do jogo
-        self.game_manager = GameManager(GameMode.HUMAN_VS_AI, Difficulty.MEDIUM)
+        self.game_manager = GameManager(
+            GameMode.HUMAN_VS_AI,
+            Difficulty.MEDIUM,
+            self._load_opening_book(),
+            self._load_tablebase()
+        )
 
         # Criar renderizadores
         self.board_renderer = BoardRenderer(self.screen)
@@ -78,6 +86,38 @@ class CheckersWindow:
             on_reset=self._on_reset_clicked
         )
 
+    @staticmethod
+    def _load_opening_book() -> Optional[OpeningBook]:
+        """
+        Abre o livro de aberturas, se existir.
+
+        Returns:
+            Livro de aberturas ou None se o arquivo não existe ou é inválido
+        """
+        if not os.path.exists(AIConfig.OPENING_BOOK_PATH):
+            return None
+        try:
+            return OpeningBook(AIConfig.OPENING_BOOK_PATH)
+        except ValueError as error:
+            print(f"Livro de aberturas ignorado: {error}")
+            return None
+
+    @staticmethod
+    def _load_tablebase() -> Optional[EndgameTablebase]:
+        """
+        Abre a tabela de finais, se existir.
+
+        Returns:
+            Tabela de finais ou None se o arquivo não existe ou é inválido
+        """
+        if not os.path.exists(AIConfig.TABLEBASE_PATH):
+            return None
+        try:
+            return EndgameTablebase(AIConfig.TABLEBASE_PATH)
+        except ValueError as error:
+            print(f"Tabela de finais ignorada: {error}")
+            return None
+
     def _on_mode_change(self, mode: GameMode) -> None:
         """
         Callback para mudança de modo de jogo.
@@ -126,7 +166,7 @@ class CheckersWindow:
             return
 
         row, col = square
-        clicked_pos = Position(row, col)
+        clicked_pos = Position.at(row, col)
 
         # Lógica de seleção e movimento
         if self.game_manager.selected_piece is None:
@@ -275,9 +315,11 @@ class CheckersWindow:
             self.screen.blit(status_surface, status_rect)
 
     def _render_thinking_message(self) -> None:
-        """Renderiza mensagem de IA pensando."""
+        """Renderiza mensagem animada de IA pensando."""
         font = pygame.font.Font(None, 24)
-        text_surface = font.render("IA está pensando...", True, ColorsConfig.TEXT_SECONDARY)
+        # Reticências animadas: a busca roda em segundo plano e o loop segue a 60 FPS
+        dots = "." * (pygame.time.get_ticks() // 400 % 4)
+        text_surface = font.render(f"IA está pensando{dots:<3}", True, ColorsConfig.TEXT_SECONDARY)
         text_rect = text_surface.get_rect(
             center=(BoardConfig.BOARD_X + BoardConfig.BOARD_SIZE // 2, BoardConfig.BOARD_Y + BoardConfig.BOARD_SIZE + 25)
         )
@@ -40,7 +40,7 @@ class BoardRenderer:
         # Desenhar todas as casas
         for row in range(BoardConfig.ROWS):
             for col in range(BoardConfig.COLS):
-                pos = Position(row, col)
+                pos = Position.at(row, col)
                 self._draw_square(pos, selected_pos, valid_moves or [])
 
     def _draw_border(self) -> None:
@@ -0,0 +1,2 @@
+# -*- coding: utf-8 -*-
+"""Testes automatizados (python -m pytest)."""
@@ -0,0 +1,49 @@
+"""FastAMPEvaluator contra AMPEvaluator e contra a pontuação do AMP original."""
+
+import random
+import pytest
+from core.bitboard_state import BitboardState
+from core.enums import PlayerColor
+from core.evaluation.amp_evaluator import AMPEvaluator
+from core.evaluation.fast_amp_evaluator import FastAMPEvaluator
+from benchmarks.amp_baseline import baseline_amp_score
+from benchmarks.amp_parity import BASELINE_TOLERANCE, random_game_positions, random_placements
+
+
+# Posições de cada tipo na amostra
+SAMPLE_SIZE = 300
+
+
+@pytest.fixture(scope='module')
+def positions():
+    """Posições de partidas e peças espalhadas, com semente fixa."""
+    rng = random.Random(2024)
+    return random_game_positions(SAMPLE_SIZE, rng) + random_placements(SAMPLE_SIZE, rng)
+
+
+@pytest.mark.parametrize('bitboard', [False, True], ids=['BoardState', 'BitboardState'])
+def test_fast_amp_matches_amp_exactly(positions, bitboard):
+    """FastAMPEvaluator dá exatamente as pontuações de AMPEvaluator."""
+    reference = AMPEvaluator()
+    fast = FastAMPEvaluator()
+    for board in positions:
+        evaluated = BitboardState.from_board_state(board) if bitboard else board
+        for color in PlayerColor:
+            assert fast.evaluate(evaluated, color) == reference.evaluate(evaluated, color)
+
+
+@pytest.mark.parametrize('bitboard', [False, True], ids=['BoardState', 'BitboardState'])
+def test_fast_amp_matches_baseline_within_tolerance(positions, bitboard):
+    """
+    FastAMPEvaluator difere do AMP original só pela ordem da soma.
+
+    O original é aplicado sempre ao BoardState de origem, cuja ordem de
+    peças define a sua soma.
+    """
+    fast = FastAMPEvaluator()
+    for board in positions:
+        evaluated = BitboardState.from_board_state(board) if bitboard else board
+        for color in PlayerColor:
+            assert fast.evaluate(evaluated, color) == pytest.approx(
+                baseline_amp_score(board, color), rel=0, abs=BASELINE_TOLERANCE
+            )
@@ -0,0 +1,18 @@
+"""Contagens de perft da posição inicial contra core.perft.KNOWN_COUNTS."""
+
+import pytest
+from core.perft import check_known_counts
+
+
+# Profundidade conferida em cada representação (alguns segundos no total)
+CHECKED_DEPTH = 6
+
+
+@pytest.mark.parametrize('bitboard', [False, True], ids=['BoardState', 'BitboardState'])
+def test_known_counts(bitboard):
+    """O gerador reproduz as contagens conhecidas até CHECKED_DEPTH."""
+    mismatches = check_known_counts(CHECKED_DEPTH, bitboard)
+    assert not mismatches, [
+        f"profundidade {result.depth}: {result.nodes} folhas, esperado {expected}"
+        for result, expected in mismatches
+    ]